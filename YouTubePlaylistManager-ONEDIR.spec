@@ -1,4 +1,6 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+
 from PyInstaller.utils.hooks import collect_all
 
 block_cipher = None
@@ -6,6 +8,13 @@ block_cipher = None
 # Google API関連のすべてを収集
 googleapi_datas, googleapi_binaries, googleapi_hiddenimports = collect_all('googleapiclient')
 
+# ディスカバリードキュメントは使用するYouTube Data API v3のもののみ同梱する
+# （googleapiclientには全APIの数百ファイルが含まれている）
+googleapi_datas = [
+    (src, dest) for src, dest in googleapi_datas
+    if 'discovery_cache' not in dest or os.path.basename(src) == 'youtube.v3.json'
+]
+
 a = Analysis(
     ['src\\main.py'],
     pathex=['src'],
@@ -14,11 +23,11 @@ a = Analysis(
         ('src', 'src'),
     ],
     hiddenimports=googleapi_hiddenimports + [
-        'auth', 'backup_manager', 'config', 'config_temp', 'credentials_manager',
-        'description_generator', 'export_manager', 'gui', 'history_manager',
-        'integrated_playlist', 'language_manager', 'niconico_client', 'paths',
-        'playlist_manager', 'preset_manager', 'setup_wizard', 'translations',
-        'update_checker', 'video_classifier', 'vimeo_client', 'youtube_client',
+        'auth', 'backup_manager', 'batch_inserter', 'channel_cache', 'config', 'config_temp', 'credentials_manager',
+        'description_generator', 'export_manager', 'gui', 'history_index', 'history_manager', 'history_tree_view', 'http_pool',
+        'integrated_playlist', 'json_stream', 'language_manager', 'niconico_client', 'paths',
+        'playlist_manager', 'preset_manager', 'quality_scorer', 'quota_manager', 'retry_policy', 'setup_status', 'setup_wizard', 'startup_profiler', 'thumbnail_loader', 'translation_data', 'translations', 'ui_queue',
+        'update_checker', 'video_cache', 'video_list_view', 'video_classifier', 'vimeo_client', 'youtube_client',
         'google.oauth2.credentials', 'google_auth_oauthlib.flow',
         'googleapiclient.discovery', 'googleapiclient.errors',
         'tkinter', 'tkinter.ttk', 'tkinter.messagebox', 'tkinter.filedialog',
@@ -11,20 +11,36 @@ if parent_dir not in sys.path:
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+import json
 import pickle
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
+import httplib2
+import google_auth_httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build, Resource
+from googleapiclient.discovery import build_from_document, Resource
 
 from config import (
     YOUTUBE_API_SCOPES,
     get_client_secret_path,
     get_token_path,
 )
+from paths import DISCOVERY_CACHE_PATH
+
+
+YOUTUBE_API_NAME = "youtube"
+YOUTUBE_API_VERSION = "v3"
+DISCOVERY_URL = "https://www.googleapis.com/discovery/v1/apis/{api}/{version}/rest"
+
+# ローカルキャッシュの有効期限（秒）
+# ディスカバリードキュメントはほとんど変わらないため30日とする
+DISCOVERY_CACHE_TTL = 30 * 24 * 60 * 60
 
 
 class YouTubeAuthenticator:
@@ -80,6 +96,14 @@ class YouTubeAuthenticator:
         credentials = flow.run_local_server(port=0)
         return credentials
 
+    def refresh_credentials(self) -> Credentials:
+        """認証情報を更新して保存（リフレッシュトークンが必要）"""
+        if self._credentials is None:
+            return self.get_credentials()
+        self._credentials.refresh(Request())
+        self._save_credentials()
+        return self._credentials
+
     def _save_credentials(self) -> None:
         """認証情報をファイルに保存"""
         self.token_path.parent.mkdir(parents=True, exist_ok=True)
@@ -87,20 +111,329 @@ class YouTubeAuthenticator:
             pickle.dump(self._credentials, token_file)
 
     def get_youtube_service(self) -> Resource:
-        """認証済みのYouTube APIサービスを取得"""
-        credentials = self.get_credentials()
-        return build("youtube", "v3", credentials=credentials)
+        """認証済みのYouTube APIサービスを作成
+
+        ディスカバリードキュメントはプロセス内でキャッシュしたものを使うため、
+        ネットワークアクセスやJSONの再読み込みは発生しない。
+        通常は共有のサービスを返す get_authenticated_service() を使う。
+        """
+        self.get_credentials()
+        return _build_youtube_service(AuthSession(self))
 
     def revoke_credentials(self) -> bool:
         """認証情報を取り消し"""
         if self.token_path.exists():
             self.token_path.unlink()
             self._credentials = None
+            reset_authenticated_service()
             return True
         return False
 
 
+class AuthSession:
+    """認証済みHTTPセッション（プロセス全体で1つ）
+
+    - 認証情報を1つだけ保持し、期限切れの少し前に更新してtoken.pickleに保存する
+    - httplib2.Httpをプールして使い回し、keep-alive接続（TLS接続）を再利用する
+    - request() はスレッドセーフで、GUIのワーカースレッドから同時に呼び出せる
+
+    googleapiclientのHTTPトランスポートとして使用する（request() と credentials を持つ）。
+    """
+
+    def __init__(
+        self,
+        authenticator: Optional[YouTubeAuthenticator] = None,
+        pool_size: int = 8,
+        timeout: float = 60.0,
+        refresh_margin: float = 300.0,
+    ):
+        """
+        Args:
+            authenticator: 認証情報の読み込み・保存に使うYouTubeAuthenticator
+            pool_size: プールに保持する未使用のHttpの最大数
+            timeout: 1回のリクエストのタイムアウト（秒）
+            refresh_margin: 有効期限の何秒前に認証情報を更新するか
+        """
+        self._authenticator = authenticator or YouTubeAuthenticator()
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.refresh_margin = refresh_margin
+        self._credentials: Optional[Credentials] = None
+        self._lock = threading.Lock()
+        self._idle: list[httplib2.Http] = []  # 未使用のHttp（最後に使ったものが末尾）
+        self._pool_lock = threading.Lock()
+
+        # 統計カウンター
+        self.connections_created = 0
+        self.connections_reused = 0
+        self.refreshes = 0
+
+    # ========================================
+    # 認証情報
+    # ========================================
+    def get_credentials(self) -> Credentials:
+        """有効な認証情報を取得（期限が近い場合は更新する）"""
+        with self._lock:
+            return self._get_fresh_credentials()
+
+    @property
+    def credentials(self) -> Credentials:
+        """googleapiclientが参照する認証情報"""
+        return self.get_credentials()
+
+    def _get_fresh_credentials(self, force_refresh: bool = False) -> Credentials:
+        """有効な認証情報を取得（_lockを保持した状態で呼ぶ）"""
+        if self._credentials is None:
+            self._credentials = self._authenticator.get_credentials()
+
+        credentials = self._credentials
+        if force_refresh or self._expires_soon(credentials):
+            if credentials.refresh_token:
+                try:
+                    self._credentials = self._authenticator.refresh_credentials()
+                    self.refreshes += 1
+                except Exception as e:
+                    # 期限前の更新に失敗した場合は、期限が切れるまで今のトークンを使う
+                    if force_refresh or not credentials.valid:
+                        raise
+                    print(f"認証情報の更新エラー: {e}")
+            else:
+                self._credentials = self._authenticator.get_credentials()
+        return self._credentials
+
+    def _expires_soon(self, credentials: Credentials) -> bool:
+        """認証情報が無効、または有効期限が近いか"""
+        if not credentials.valid:
+            return True
+        expiry = getattr(credentials, "expiry", None)
+        if expiry is None:
+            return False
+        # google-authのexpiryはタイムゾーンなしのUTC
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return (expiry - now).total_seconds() < self.refresh_margin
+
+    # ========================================
+    # HTTP
+    # ========================================
+    def request(
+        self,
+        uri,
+        method="GET",
+        body=None,
+        headers=None,
+        redirections=httplib2.DEFAULT_MAX_REDIRECTS,
+        connection_type=None,
+        **kwargs,
+    ):
+        """認証ヘッダーを付けてリクエストを実行（401の場合は認証情報を更新して1回だけ再実行）"""
+        for attempt in range(2):
+            request_headers = dict(headers or {})
+            with self._lock:
+                credentials = self._get_fresh_credentials(force_refresh=attempt > 0)
+                credentials.apply(request_headers)
+
+            http = self._acquire()
+            try:
+                response, content = http.request(
+                    uri, method,
+                    body=body,
+                    headers=request_headers,
+                    redirections=redirections,
+                    connection_type=connection_type,
+                    **kwargs,
+                )
+            except Exception:
+                # 接続が壊れている可能性があるためプールに戻さない
+                http.close()
+                raise
+            self._release(http)
+
+            if response.status != 401:
+                break
+        return response, content
+
+    def _acquire(self) -> httplib2.Http:
+        """プールからHttpを取り出す（空の場合は作成）"""
+        with self._pool_lock:
+            if self._idle:
+                self.connections_reused += 1
+                return self._idle.pop()
+            self.connections_created += 1
+        return httplib2.Http(timeout=self.timeout)
+
+    def _release(self, http: httplib2.Http) -> None:
+        """Httpをプールに戻す（上限を超える場合は閉じる）"""
+        with self._pool_lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(http)
+                return
+        http.close()
+
+    def close(self) -> None:
+        """プール内の接続をすべて閉じる"""
+        with self._pool_lock:
+            idle, self._idle = self._idle, []
+        for http in idle:
+            http.close()
+
+    def get_stats(self) -> dict[str, int]:
+        """接続の作成・再利用と認証情報の更新回数を取得"""
+        with self._pool_lock:
+            return {
+                "connections_created": self.connections_created,
+                "connections_reused": self.connections_reused,
+                "idle_connections": len(self._idle),
+                "refreshes": self.refreshes,
+            }
+
+
+# ========================================
+# ディスカバリードキュメント
+# ========================================
+
+# 読み込み済みのドキュメント（"api.version" -> JSON文字列）
+_discovery_documents: dict[str, str] = {}
+_discovery_lock = threading.Lock()
+
+
+def load_discovery_document(api: str = YOUTUBE_API_NAME, version: str = YOUTUBE_API_VERSION) -> str:
+    """APIのディスカバリードキュメントを取得（プロセス内でキャッシュ）
+
+    次の順に探す:
+    1. メモリ（2回目以降）
+    2. googleapiclientに同梱された静的ドキュメント
+    3. ローカルキャッシュ（config/discovery/、有効期限内のもの）
+    4. ネットワーク（取得後にローカルキャッシュへ保存）
+    ネットワークから取得できない場合は期限切れのローカルキャッシュも使う。
+    """
+    key = f"{api}.{version}"
+    with _discovery_lock:
+        document = _discovery_documents.get(key)
+        if document is None:
+            document = _read_static_document(api, version)
+            if document is None:
+                document = _read_cached_document(key, max_age=DISCOVERY_CACHE_TTL)
+            if document is None:
+                try:
+                    document = _fetch_document(api, version)
+                    _write_cached_document(key, document)
+                except Exception as e:
+                    document = _read_cached_document(key, max_age=None)
+                    if document is None:
+                        raise
+                    print(f"ディスカバリードキュメント取得エラー（キャッシュを使用）: {e}")
+            _discovery_documents[key] = document
+        return document
+
+
+def _read_static_document(api: str, version: str) -> Optional[str]:
+    """googleapiclientに同梱されたドキュメントを読み込む"""
+    try:
+        from googleapiclient import discovery_cache
+        return discovery_cache.get_static_doc(api, version)
+    except (ImportError, AttributeError, OSError):
+        return None
+
+
+def _get_cache_file(key: str) -> Path:
+    return DISCOVERY_CACHE_PATH / f"{key}.json"
+
+
+def _read_cached_document(key: str, max_age: Optional[float]) -> Optional[str]:
+    """ローカルキャッシュから読み込む（max_ageがNoneの場合は期限を確認しない）"""
+    cache_file = _get_cache_file(key)
+    try:
+        if max_age is not None and time.time() - cache_file.stat().st_mtime > max_age:
+            return None
+        return cache_file.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _write_cached_document(key: str, document: str) -> None:
+    """ローカルキャッシュに保存"""
+    cache_file = _get_cache_file(key)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        tmp_file.write_text(document, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"ディスカバリードキュメント保存エラー: {e}")
+
+
+def _fetch_document(api: str, version: str) -> str:
+    """ネットワークからドキュメントを取得"""
+    url = DISCOVERY_URL.format(api=api, version=version)
+    response, content = httplib2.Http(timeout=30).request(url, "GET")
+    if response.status >= 400:
+        raise RuntimeError(f"HTTP {response.status}: {url}")
+    document = content.decode("utf-8") if isinstance(content, bytes) else content
+    json.loads(document)  # 壊れたドキュメントをキャッシュしないよう確認
+    return document
+
+
+def _build_youtube_service(session: AuthSession) -> Resource:
+    """セッションをHTTPトランスポートにしてYouTubeサービスを作成"""
+    document = load_discovery_document(YOUTUBE_API_NAME, YOUTUBE_API_VERSION)
+    return build_from_document(document, http=session)
+
+
+def create_authorized_http(service: Resource) -> Optional[Union[AuthSession, google_auth_httplib2.AuthorizedHttp]]:
+    """ワーカースレッドから使えるHTTPトランスポートを取得
+
+    サービスがAuthSessionを使っている場合はそのセッションを返す（スレッドセーフ）。
+    それ以外の場合は、httplib2.Httpがスレッドセーフではないため
+    同じ認証情報を使う新しいトランスポートを作成する。
+
+    Returns:
+        HTTPトランスポート（サービスが認証情報を持たない場合はNone）
+    """
+    http = getattr(service, "_http", None)
+    if isinstance(http, AuthSession):
+        return http
+    credentials = getattr(http, "credentials", None)
+    if credentials is None:
+        return None
+    return google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+
+
+# プロセス全体で共有するセッションとサービス
+_auth_session: Optional[AuthSession] = None
+_shared_service: Optional[Resource] = None
+_service_lock = threading.Lock()
+
+
+def get_auth_session() -> AuthSession:
+    """AuthSessionのシングルトンインスタンスを取得"""
+    global _auth_session
+    with _service_lock:
+        if _auth_session is None:
+            _auth_session = AuthSession()
+        return _auth_session
+
+
 def get_authenticated_service() -> Resource:
-    """認証済みYouTubeサービスを取得するヘルパー関数"""
-    auth = YouTubeAuthenticator()
-    return auth.get_youtube_service()
+    """認証済みYouTubeサービスを取得するヘルパー関数
+
+    サービスは初回のみ作成し、以降はプロセス全体で同じものを返す。
+    HTTP接続と認証情報は共有のAuthSessionが管理する。
+    """
+    global _shared_service
+    session = get_auth_session()
+    with _service_lock:
+        if _shared_service is None:
+            # 認証できない場合はここで例外を送出する（従来どおり）
+            session.get_credentials()
+            _shared_service = _build_youtube_service(session)
+        return _shared_service
+
+
+def reset_authenticated_service() -> None:
+    """共有サービスとセッションを破棄（認証情報のリセット・再認証後に呼ぶ）"""
+    global _auth_session, _shared_service
+    with _service_lock:
+        session, _auth_session = _auth_session, None
+        _shared_service = None
+    if session is not None:
+        session.close()
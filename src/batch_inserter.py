@@ -0,0 +1,392 @@
+"""再生リスト一括追加モジュール - playlistItems().insert をまとめて実行"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import bisect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Optional
+from googleapiclient.discovery import Resource
+
+from auth import create_authorized_http
+from quota_manager import QuotaExceededError, QuotaScheduler, get_quota_scheduler
+from retry_policy import RetryPolicy, classify_error, get_retry_policy
+
+
+# バッチエンドポイント自体が使えないことを示すHTTPステータス
+# （5xx・429などの一時的なエラーではバッチ送信をやめない）
+BATCH_UNAVAILABLE_STATUSES = {400, 404, 405, 410, 413, 501}
+
+
+@dataclass
+class InsertResult:
+    """動画1本分の追加結果"""
+    index: int  # 追加を要求した順番（0始まり）
+    video_id: str
+    success: bool = False
+    playlist_item_id: Optional[str] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    retryable: bool = False  # 失敗が一時的なもの（再試行で成功しうる）か
+
+
+class BatchInserter:
+    """再生リストへの動画追加をまとめて実行するクラス
+
+    googleapiclientのBatchHttpRequestで最大50件ずつ1往復にまとめて送信する。
+    バッチが利用できない場合は、スレッドプールで並行して1件ずつ送信する。
+    一時的なエラーで失敗した動画のみをバックオフ後に再試行し、
+    最後に要求順どおりに並び替える。
+    """
+
+    BATCH_SIZE = 50      # 1バッチあたりのリクエスト数
+    MAX_WORKERS = 4      # バッチが使えない場合の並行数
+    MAX_RETRIES = 2      # 失敗した動画の再試行回数
+
+    def __init__(
+        self,
+        service: Resource,
+        use_batch: bool = True,
+        max_workers: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        quota_scheduler: Optional[QuotaScheduler] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        self.service = service
+        self.quota = quota_scheduler or get_quota_scheduler()
+        self.retry_policy = retry_policy or get_retry_policy()
+        # 再試行はinsert_videos()のラウンドで行うため、1件ごとの送信では再試行しない
+        self._single_attempt = RetryPolicy(max_attempts=1, metrics=self.retry_policy.metrics)
+        self.use_batch = use_batch and hasattr(service, "new_batch_http_request")
+        self.max_workers = max_workers or self.MAX_WORKERS
+        self.max_retries = self.MAX_RETRIES if max_retries is None else max_retries
+        self._thread_local = threading.local()
+        self._last_retry_after: Optional[float] = None
+
+    def insert_videos(
+        self,
+        playlist_id: str,
+        video_ids: list[str],
+        preserve_order: bool = True,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        should_continue: Optional[Callable[[], bool]] = None,
+    ) -> list[InsertResult]:
+        """複数の動画を再生リストに追加
+
+        Args:
+            playlist_id: 追加先の再生リストID
+            video_ids: 追加する動画IDのリスト（この順番で並ぶ）
+            preserve_order: Trueの場合、追加後に要求順どおりに並び替える
+            on_progress: 進捗コールバック (追加済み数, 総数)。ワーカースレッドから呼ばれる
+            should_continue: Falseを返した場合、未送信の動画の追加を中止する
+
+        Returns:
+            動画ごとのInsertResult（video_idsと同じ順番）
+        """
+        results = [InsertResult(index=i, video_id=video_id) for i, video_id in enumerate(video_ids)]
+        progress = _Progress(len(results), on_progress)
+
+        pending = results
+        retry_after: Optional[float] = None
+        for round_index in range(self.max_retries + 1):
+            if not pending:
+                break
+            if should_continue is not None and not should_continue():
+                break
+            if round_index > 0:
+                delay = self.retry_policy.get_delay(round_index - 1, retry_after)
+                print(f"{len(pending)}件の動画を{delay:.1f}秒後に再試行します")
+                time.sleep(delay)
+            self._last_retry_after = None
+            try:
+                self._insert_round(playlist_id, pending, progress, should_continue)
+            except QuotaExceededError as e:
+                # クォータ不足の場合は再試行せず、未追加の動画を失敗として返す
+                print(e)
+                for result in pending:
+                    if not result.success:
+                        result.error = str(e)
+                break
+            # 再試行しても成功しないエラー（動画が存在しないなど）は除外する
+            pending = [r for r in pending if not r.success and r.retryable]
+            retry_after = self._last_retry_after
+
+        if preserve_order and any(r.success for r in results):
+            try:
+                self._restore_order(playlist_id, results)
+            except Exception as e:
+                print(f"再生リスト並び替えエラー: {e}")
+
+        return results
+
+    def _build_insert_request(self, playlist_id: str, video_id: str):
+        """playlistItems().insert リクエストを作成"""
+        return self.service.playlistItems().insert(
+            part="snippet",
+            body={
+                "snippet": {
+                    "playlistId": playlist_id,
+                    "resourceId": {
+                        "kind": "youtube#video",
+                        "videoId": video_id,
+                    },
+                },
+            },
+        )
+
+    def _insert_round(
+        self,
+        playlist_id: str,
+        pending: list[InsertResult],
+        progress: "_Progress",
+        should_continue: Optional[Callable[[], bool]],
+    ) -> None:
+        """未成功の動画を1回ずつ送信"""
+        if self.use_batch:
+            attempts = {r.index: r.attempts for r in pending}
+            try:
+                self._insert_batched(playlist_id, pending, progress, should_continue)
+                return
+            except QuotaExceededError:
+                raise
+            except Exception as e:
+                if _is_batch_unavailable(e):
+                    # バッチエンドポイント自体が使えない場合は以降も並行送信にする
+                    print(f"バッチ送信エラー（並行送信に切り替えます）: {e}")
+                    self.use_batch = False
+                else:
+                    # 一時的なエラーの場合はこのラウンドだけ並行送信にする
+                    print(f"バッチ送信エラー（このラウンドは並行送信します）: {e}")
+            # このラウンドでまだ送信していない（結果が返っていない）動画のみ
+            pending = [r for r in pending if r.attempts == attempts[r.index]]
+
+        self._insert_concurrent(playlist_id, pending, progress, should_continue)
+
+    def _insert_batched(
+        self,
+        playlist_id: str,
+        pending: list[InsertResult],
+        progress: "_Progress",
+        should_continue: Optional[Callable[[], bool]],
+    ) -> None:
+        """BatchHttpRequestで最大BATCH_SIZE件ずつ送信"""
+        for start in range(0, len(pending), self.BATCH_SIZE):
+            if should_continue is not None and not should_continue():
+                return
+            chunk = pending[start:start + self.BATCH_SIZE]
+            by_request_id = {str(r.index): r for r in chunk}
+
+            def callback(request_id, response, exception):
+                result = by_request_id[request_id]
+                self._record(result, response, exception)
+                if result.success:
+                    progress.advance()
+
+            # バッチ内の各リクエストもそれぞれクォータを消費する
+            self.quota.reserve("youtube.playlistItems.insert", len(chunk))
+            attempts = {r.index: r.attempts for r in chunk}
+            batch = self.service.new_batch_http_request(callback=callback)
+            for result in chunk:
+                batch.add(
+                    self._build_insert_request(playlist_id, result.video_id),
+                    request_id=str(result.index),
+                )
+            try:
+                batch.execute()
+            except Exception:
+                # 結果が返らなかったリクエストは並行送信で改めて予約するため、予約を戻す
+                unsent = sum(1 for r in chunk if r.attempts == attempts[r.index])
+                if unsent:
+                    self.quota.refund("youtube.playlistItems.insert", unsent)
+                raise
+
+    def _insert_concurrent(
+        self,
+        playlist_id: str,
+        pending: list[InsertResult],
+        progress: "_Progress",
+        should_continue: Optional[Callable[[], bool]],
+    ) -> None:
+        """スレッドプールで1件ずつ並行して送信"""
+        def insert_one(result: InsertResult) -> None:
+            if should_continue is not None and not should_continue():
+                return
+            try:
+                request = self._build_insert_request(playlist_id, result.video_id)
+                response = self.quota.execute(
+                    request,
+                    http=self._get_thread_http(),
+                    retry_policy=self._single_attempt,
+                )
+                self._record(result, response, None)
+            except QuotaExceededError:
+                raise
+            except Exception as e:
+                self._record(result, None, e)
+            if result.success:
+                progress.advance()
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="playlist-insert",
+        ) as executor:
+            futures = [executor.submit(insert_one, result) for result in pending]
+            for future in as_completed(futures):
+                future.result()
+
+    def _record(self, result: InsertResult, response: Optional[dict], exception: Optional[Exception]) -> None:
+        """リクエスト結果をInsertResultに反映"""
+        result.attempts += 1
+        if exception is not None:
+            result.success = False
+            result.error = str(exception)
+            result.retryable, retry_after = classify_error(exception)
+            if retry_after is not None:
+                self._last_retry_after = retry_after
+            print(f"動画追加エラー (video_id={result.video_id}): {exception}")
+            return
+        result.success = True
+        result.error = None
+        result.retryable = False
+        result.playlist_item_id = (response or {}).get("id")
+
+    def _get_thread_http(self):
+        """スレッドごとの認証済みHTTPトランスポートを取得"""
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = create_authorized_http(self.service)
+            self._thread_local.http = http
+        return http
+
+    def _list_playlist_item_ids(self, playlist_id: str) -> list[str]:
+        """再生リスト内のアイテムIDを現在の並び順で取得"""
+        item_ids = []
+        next_page_token = None
+        while True:
+            response = self.quota.execute(self.service.playlistItems().list(
+                part="id",
+                playlistId=playlist_id,
+                maxResults=50,
+                pageToken=next_page_token,
+            ))
+            item_ids.extend(item["id"] for item in response.get("items", []))
+            next_page_token = response.get("nextPageToken")
+            if not next_page_token:
+                return item_ids
+
+    def _restore_order(self, playlist_id: str, results: list[InsertResult]) -> None:
+        """並行追加で前後した動画を要求順に並び替える
+
+        既存のアイテムはそのまま先頭に残し、追加した動画を末尾に要求順で配置する。
+        バッチ内のリクエストは実行順が保証されないため追加時の位置指定では揃えられず、
+        追加後に playlistItems().update（1回50ユニット）で移動する。
+        移動するのは要求順に並んでいる最長の列（最長増加部分列）に含まれない
+        アイテムのみで、移動回数は最小になる。移動に必要なユニットは先に予約し、
+        足りない場合は並び替えない。
+        """
+        inserted = [r for r in results if r.success and r.playlist_item_id]
+        current = self._list_playlist_item_ids(playlist_id)
+        positions = {item_id: i for i, item_id in enumerate(current)}
+        if any(r.playlist_item_id not in positions for r in inserted):
+            # 反映待ちのアイテムがある場合は並び替えない
+            return
+
+        keep = _longest_increasing_subset([positions[r.playlist_item_id] for r in inserted])
+        moves = [r for i, r in enumerate(inserted) if i not in keep]
+        if not moves:
+            return
+
+        try:
+            self.quota.reserve("youtube.playlistItems.update", len(moves))
+        except QuotaExceededError as e:
+            print(f"再生リスト並び替えをスキップしました: {e}")
+            return
+
+        base = len(current) - len(inserted)
+        previous_id: Optional[str] = None
+        for offset, result in enumerate(inserted):
+            if offset in keep:
+                previous_id = result.playlist_item_id
+                continue
+
+            # 要求順で1つ前の動画の直後（先頭の場合は追加した範囲の先頭）に移動する
+            current.remove(result.playlist_item_id)
+            target = base if previous_id is None else current.index(previous_id) + 1
+            current.insert(target, result.playlist_item_id)
+            previous_id = result.playlist_item_id
+
+            self.quota.execute(self.service.playlistItems().update(
+                part="snippet",
+                body={
+                    "id": result.playlist_item_id,
+                    "snippet": {
+                        "playlistId": playlist_id,
+                        "resourceId": {
+                            "kind": "youtube#video",
+                            "videoId": result.video_id,
+                        },
+                        "position": target,
+                    },
+                },
+            ), reserved=True)
+
+
+def _is_batch_unavailable(error: Exception) -> bool:
+    """バッチエンドポイント自体が使えないことを示すエラーか"""
+    status = getattr(getattr(error, "resp", None), "status", None)
+    if status is not None:
+        return int(status) in BATCH_UNAVAILABLE_STATUSES
+    # HTTP以外では、通信エラーなどの一時的なもの以外（バッチ非対応のクライアントなど）
+    retryable, _ = classify_error(error)
+    return not retryable
+
+
+def _longest_increasing_subset(values: list[int]) -> set[int]:
+    """最長増加部分列に含まれる要素のインデックスを返す（O(n log n)）"""
+    tails: list[int] = []         # 長さk+1の増加列の末尾の値
+    tail_indexes: list[int] = []  # tailsの各値のインデックス
+    parents = [-1] * len(values)
+    for i, value in enumerate(values):
+        k = bisect.bisect_left(tails, value)
+        if k == len(tails):
+            tails.append(value)
+            tail_indexes.append(i)
+        else:
+            tails[k] = value
+            tail_indexes[k] = i
+        parents[i] = tail_indexes[k - 1] if k > 0 else -1
+
+    subset = set()
+    i = tail_indexes[-1] if tail_indexes else -1
+    while i >= 0:
+        subset.add(i)
+        i = parents[i]
+    return subset
+
+
+class _Progress:
+    """スレッドセーフな進捗カウンター"""
+
+    def __init__(self, total: int, callback: Optional[Callable[[int, int], None]]):
+        self.total = total
+        self.done = 0
+        self._callback = callback
+        self._lock = threading.Lock()
+
+    def advance(self) -> None:
+        with self._lock:
+            self.done += 1
+            done = self.done
+        if self._callback is not None:
+            self._callback(done, self.total)
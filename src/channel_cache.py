@@ -0,0 +1,182 @@
+"""チャンネル情報キャッシュモジュール - channels().list の結果をローカルに保存"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from paths import CHANNEL_CACHE_FILE
+
+
+# 有効期限（秒）
+# 登録者数・動画数は1日程度では大きく変わらないため1日とする
+DEFAULT_CHANNEL_TTL = 24 * 60 * 60
+
+
+class ChannelCache:
+    """チャンネルIDをキーにしたSQLiteキャッシュ
+
+    チャンネル情報（登録者数・動画数・総視聴回数・カスタムURLなど）を
+    辞書形式で保存し、有効期限内のもののみ返す。
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, ttl: int = DEFAULT_CHANNEL_TTL):
+        self.db_path = db_path or CHANNEL_CACHE_FILE
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # 統計カウンター
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """データベース接続を取得（初回のみテーブルを作成）"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS channels (
+                    channel_id TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get_many(self, channel_ids: list[str]) -> dict[str, dict]:
+        """有効期限内のチャンネル情報を取得
+
+        Args:
+            channel_ids: チャンネルIDのリスト
+
+        Returns:
+            チャンネルID -> チャンネル情報の辞書（ヒットしたもののみ）
+        """
+        if not channel_ids:
+            return {}
+
+        cutoff = time.time() - self.ttl
+        unique_ids = list(dict.fromkeys(channel_ids))
+        found: dict[str, dict] = {}
+        try:
+            with self._lock:
+                conn = self._connect()
+                # SQLiteのパラメータ数上限を超えないよう分割して取得
+                for start in range(0, len(unique_ids), 500):
+                    chunk = unique_ids[start:start + 500]
+                    placeholders = ",".join("?" for _ in chunk)
+                    rows = conn.execute(
+                        f"SELECT channel_id, data FROM channels "
+                        f"WHERE channel_id IN ({placeholders}) AND fetched_at >= ?",
+                        [*chunk, cutoff],
+                    ).fetchall()
+                    for channel_id, data in rows:
+                        found[channel_id] = json.loads(data)
+        except sqlite3.Error as e:
+            print(f"チャンネルキャッシュ読み込みエラー: {e}")
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(unique_ids) - len(found)
+        return found
+
+    def get_missing(self, channel_ids: list[str]) -> list[str]:
+        """キャッシュにない（または期限切れの）チャンネルIDを取得"""
+        found = self.get_many(channel_ids)
+        return [channel_id for channel_id in dict.fromkeys(channel_ids) if channel_id not in found]
+
+    def put_many(self, channels: dict[str, dict]) -> None:
+        """チャンネル情報を保存
+
+        Args:
+            channels: チャンネルID -> チャンネル情報の辞書
+        """
+        if not channels:
+            return
+
+        now = time.time()
+        rows = [
+            (channel_id, json.dumps(data, ensure_ascii=False), now)
+            for channel_id, data in channels.items()
+        ]
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO channels (channel_id, data, fetched_at) VALUES (?, ?, ?)",
+                    rows,
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"チャンネルキャッシュ保存エラー: {e}")
+
+    def purge_expired(self) -> int:
+        """期限切れのエントリーを削除
+
+        Returns:
+            削除した件数
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                cursor = conn.execute(
+                    "DELETE FROM channels WHERE fetched_at < ?",
+                    (time.time() - self.ttl,),
+                )
+                conn.commit()
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            print(f"チャンネルキャッシュ削除エラー: {e}")
+            return 0
+
+    def clear(self) -> None:
+        """キャッシュをすべて削除"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM channels")
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"チャンネルキャッシュ削除エラー: {e}")
+
+    def get_stats(self) -> dict[str, int]:
+        """ヒット/ミス統計を取得"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+    def close(self) -> None:
+        """データベース接続を閉じる"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# グローバルインスタンス
+_channel_cache: Optional[ChannelCache] = None
+
+
+def get_channel_cache() -> ChannelCache:
+    """ChannelCacheのシングルトンインスタンスを取得"""
+    global _channel_cache
+    if _channel_cache is None:
+        _channel_cache = ChannelCache()
+    return _channel_cache
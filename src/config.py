@@ -11,8 +11,10 @@ if parent_dir not in sys.path:
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+import re
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 
@@ -385,6 +387,11 @@ ALL_OFFICIAL_CHANNEL_IDS = {
 }
 
 
+# 高精度検索で公式チャンネルのみに絞り込む前に取得する件数の倍率
+# （クォータの見積もりでも同じ値を使う）
+HIGH_PRECISION_SEARCH_FACTOR = 5
+
+
 def get_official_channel_ids(category: Optional[str] = None) -> dict[str, str]:
     """カテゴリに対応する公式チャンネルIDを取得
 
@@ -426,79 +433,135 @@ def get_official_keywords(category: str) -> list[str]:
     )
 
 
-def is_official_channel(channel_title: str) -> bool:
-    """チャンネルが公式チャンネルかどうかを判定
-
-    Args:
-        channel_title: チャンネル名
+class KeywordMatcher:
+    """複数のキーワードを1回の走査で検出するマッチャー
 
-    Returns:
-        公式チャンネルの場合True
+    すべてのキーワードを1つの正規表現にまとめてコンパイルし、
+    テキスト中に含まれるキーワードを重複も含めてまとめて返す。
+    比較は大文字小文字を区別しない（str.lower()で正規化）。
     """
-    # チャンネル名に公式インジケータが含まれるか確認
-    for indicator in OFFICIAL_CHANNEL_INDICATORS:
-        if indicator.lower() in channel_title.lower():
-            return True
 
-    # 主要公式チャンネルリストに含まれるか確認
-    for official_channel in ALL_OFFICIAL_CHANNELS:
-        if official_channel.lower() in channel_title.lower():
-            return True
+    def __init__(self, keywords: list[str]):
+        terms = sorted({k.lower() for k in keywords if k}, key=len, reverse=True)
+        # 各位置で最長のキーワードのみがマッチするため、
+        # その接頭辞になっている短いキーワードもあわせて検出したことにする
+        self._implied = {
+            term: frozenset(t for t in terms if term.startswith(t))
+            for term in terms
+        }
+        self._pattern = re.compile(
+            "(?=(" + "|".join(re.escape(t) for t in terms) + "))"
+        )
+
+    def find_all(self, text: str) -> frozenset[str]:
+        """テキストに含まれるキーワード（小文字）をすべて取得"""
+        found: set[str] = set()
+        for match in self._pattern.finditer(text.lower()):
+            found |= self._implied[match.group(1)]
+        return frozenset(found)
+
+    def search(self, text: str) -> bool:
+        """テキストにいずれかのキーワードが含まれるか"""
+        return self._pattern.search(text.lower()) is not None
+
+
+# 公式スコアの加点対象（チャンネル名、小文字）
+_VEVO_TERM = "vevo"
+_OFFICIAL_TERM = "official"
+_KOUSHIKI_TERM = "公式"
+_TOPIC_TERM = "- topic"
+
+# 動画タイトルに含まれる公式を示す文字列
+OFFICIAL_TITLE_KEYWORDS = [
+    "official video", "official audio", "official mv",
+    "official music video", "公式", "オフィシャル",
+    "(official)", "[official]",
+]
 
-    return False
+_OFFICIAL_NAME_TERMS = frozenset(
+    k.lower() for k in OFFICIAL_CHANNEL_INDICATORS + ALL_OFFICIAL_CHANNELS
+)
+_OFFICIAL_LIST_TERMS = frozenset(k.lower() for k in ALL_OFFICIAL_CHANNELS)
 
+# インポート時に一度だけ構築する
+_CHANNEL_MATCHER = KeywordMatcher(
+    OFFICIAL_CHANNEL_INDICATORS
+    + ALL_OFFICIAL_CHANNELS
+    + [_VEVO_TERM, _OFFICIAL_TERM, _KOUSHIKI_TERM, _TOPIC_TERM]
+)
+_TITLE_MATCHER = KeywordMatcher(OFFICIAL_TITLE_KEYWORDS)
 
-def get_official_channel_score(channel_title: str, video_title: str = "") -> int:
-    """公式チャンネルのスコアを計算（高いほど公式度が高い）
+
+@lru_cache(maxsize=8192)
+def match_official_indicators(channel_title: str) -> frozenset[str]:
+    """チャンネル名に含まれる公式インジケータ・公式チャンネル名を取得（結果はメモ化）
 
     Args:
         channel_title: チャンネル名
-        video_title: 動画タイトル（オプション）
 
     Returns:
-        公式スコア（0-100）
+        マッチしたキーワード（小文字）の集合
     """
-    score = 0
+    return _CHANNEL_MATCHER.find_all(channel_title)
 
-    # チャンネル名のチェック
-    channel_lower = channel_title.lower()
+
+@lru_cache(maxsize=8192)
+def _get_channel_name_score(channel_title: str) -> int:
+    """チャンネル名による公式スコア（メモ化）"""
+    matches = match_official_indicators(channel_title)
+    score = 0
 
     # VEVOは最高スコア
-    if "vevo" in channel_lower:
+    if _VEVO_TERM in matches:
         score += 50
 
     # "Official" が含まれる
-    if "official" in channel_lower:
+    if _OFFICIAL_TERM in matches:
         score += 40
 
     # 日本語の「公式」が含まれる
-    if "公式" in channel_title:
+    if _KOUSHIKI_TERM in matches:
         score += 40
 
     # "- Topic" チャンネル（YouTube自動生成のアーティストチャンネル）
-    if "- topic" in channel_lower:
+    if _TOPIC_TERM in matches:
         score += 30
 
     # 主要公式チャンネルリストに含まれる
-    for official_channel in ALL_OFFICIAL_CHANNELS:
-        if official_channel.lower() in channel_lower:
-            score += 25
-            break
-
-    # 動画タイトルのチェック
-    if video_title:
-        title_lower = video_title.lower()
-
-        # タイトルに公式を示す文字列が含まれる
-        official_title_keywords = [
-            "official video", "official audio", "official mv",
-            "official music video", "公式", "オフィシャル",
-            "(official)", "[official]",
-        ]
-        for keyword in official_title_keywords:
-            if keyword in title_lower:
-                score += 10
-                break
+    if matches & _OFFICIAL_LIST_TERMS:
+        score += 25
+
+    return score
+
+
+def is_official_channel(channel_title: str) -> bool:
+    """チャンネルが公式チャンネルかどうかを判定
+
+    Args:
+        channel_title: チャンネル名
+
+    Returns:
+        公式チャンネルの場合True
+    """
+    # チャンネル名に公式インジケータ、または主要公式チャンネル名が含まれるか確認
+    return bool(match_official_indicators(channel_title) & _OFFICIAL_NAME_TERMS)
+
+
+def get_official_channel_score(channel_title: str, video_title: str = "") -> int:
+    """公式チャンネルのスコアを計算（高いほど公式度が高い）
+
+    Args:
+        channel_title: チャンネル名
+        video_title: 動画タイトル（オプション）
+
+    Returns:
+        公式スコア（0-100）
+    """
+    score = _get_channel_name_score(channel_title)
+
+    # タイトルに公式を示す文字列が含まれる
+    if video_title and _TITLE_MATCHER.search(video_title):
+        score += 10
 
     return min(score, 100)  # 最大100点
 
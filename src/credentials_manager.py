@@ -19,20 +19,31 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-try:
-    from cryptography.fernet import Fernet
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-    CRYPTOGRAPHY_AVAILABLE = True
-except ImportError:
-    CRYPTOGRAPHY_AVAILABLE = False
-
 # パス管理モジュールからインポート
 from paths import (
     CONFIG_PATH as CONFIG_DIR,
     NICONICO_AUTH_FILE,
 )
 
+# cryptographyは読み込みに時間がかかるため、暗号化・復号を初めて行うときに読み込む
+# （None: 未確認）
+CRYPTOGRAPHY_AVAILABLE: Optional[bool] = None
+
+
+def _load_cryptography() -> bool:
+    """cryptographyを読み込む（読み込めた場合True）"""
+    global CRYPTOGRAPHY_AVAILABLE, Fernet, hashes, PBKDF2HMAC
+    if CRYPTOGRAPHY_AVAILABLE is None:
+        try:
+            from cryptography.fernet import Fernet
+            from cryptography.hazmat.primitives import hashes
+            from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+            CRYPTOGRAPHY_AVAILABLE = True
+        except ImportError:
+            CRYPTOGRAPHY_AVAILABLE = False
+    return CRYPTOGRAPHY_AVAILABLE
+
+
 AUTH_STATUS_FILE = CONFIG_DIR / "auth_status.json"
 
 
@@ -57,7 +68,7 @@ class CredentialsManager:
         if self._key is not None:
             return self._key
 
-        if not CRYPTOGRAPHY_AVAILABLE:
+        if not _load_cryptography():
             # cryptographyがない場合は簡易的なキーを生成
             machine_id = self._get_machine_id()
             key = hashlib.sha256(machine_id.encode()).digest()
@@ -80,7 +91,7 @@ class CredentialsManager:
 
     def encrypt(self, data: str) -> str:
         """文字列を暗号化"""
-        if not CRYPTOGRAPHY_AVAILABLE:
+        if not _load_cryptography():
             # cryptographyがない場合はBase64エンコードのみ（非推奨）
             return base64.b64encode(data.encode()).decode()
 
@@ -91,7 +102,7 @@ class CredentialsManager:
 
     def decrypt(self, encrypted_data: str) -> str:
         """暗号化された文字列を復号"""
-        if not CRYPTOGRAPHY_AVAILABLE:
+        if not _load_cryptography():
             # cryptographyがない場合はBase64デコードのみ
             return base64.b64decode(encrypted_data.encode()).decode()
 
@@ -18,13 +18,8 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog, simpledialog
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
-import webbrowser
-import urllib.request
-import io
+from typing import TYPE_CHECKING, Optional, Union
 
-from youtube_client import YouTubeClient, VideoInfo, SearchPrecision
-from playlist_manager import PlaylistManager
 from config import (
     get_category_id, get_era_date_range, CATEGORY_NAME_TO_ID,
     get_official_keywords, is_official_channel, get_official_channel_score,
@@ -33,18 +28,36 @@ from config import (
 )
 from preset_manager import PresetManager, PresetSettings, Preset
 from history_manager import HistoryManager, HistoryEntry, SearchConditions
-from niconico_client import NicoNicoClient, NicoVideoInfo
+from history_tree_view import HistoryTreeView
 from integrated_playlist import (
     IntegratedPlaylistManager, IntegratedPlaylist, IntegratedVideoItem,
     create_integrated_item_from_youtube,
     create_integrated_item_from_niconico
 )
-from setup_wizard import SetupStatus, SetupWizard, run_setup_wizard
-from credentials_manager import get_credentials_manager, CredentialsManager
+from setup_status import SetupStatus
+from credentials_manager import get_credentials_manager
 from backup_manager import BackupManager
 from export_manager import ExportManager
 from paths import CONFIG_PATH
-from translations import t, set_language, get_current_language, t_keyword, t_region
+from quota_manager import get_quota_scheduler, estimate_random_run_cost
+from quality_scorer import score_videos
+from ui_queue import UIUpdateQueue
+from video_list_view import VirtualListView
+from thumbnail_loader import (
+    ThumbnailLoader, get_youtube_thumbnail_url, PIL_AVAILABLE as THUMBNAILS_AVAILABLE
+)
+from translations import t, set_language, get_current_language, t_keyword, t_region, LANGUAGE_NAMES
+
+# API クライアント・セットアップウィザードは起動時間短縮のため初回使用時に読み込む
+if TYPE_CHECKING:
+    from youtube_client import VideoInfo
+    from niconico_client import NicoNicoClient, NicoVideoInfo
+
+
+def _open_url(url: str) -> None:
+    """URLを既定のブラウザで開く（webbrowserは初回使用時に読み込む）"""
+    import webbrowser
+    webbrowser.open(url)
 
 
 class PresetEditDialog:
@@ -259,10 +272,10 @@ class IntegratedPlaylistViewer:
             link_frame.pack(fill=tk.X, pady=(5, 0))
             ttk.Label(link_frame, text="プラットフォームリンク:").pack(side=tk.LEFT)
             if self.playlist.youtube_playlist_url:
-                btn = ttk.Button(link_frame, text="YouTube", command=lambda: webbrowser.open(self.playlist.youtube_playlist_url))
+                btn = ttk.Button(link_frame, text="YouTube", command=lambda: _open_url(self.playlist.youtube_playlist_url))
                 btn.pack(side=tk.LEFT, padx=5)
             if self.playlist.niconico_mylist_url:
-                btn = ttk.Button(link_frame, text="ニコニコ", command=lambda: webbrowser.open(self.playlist.niconico_mylist_url))
+                btn = ttk.Button(link_frame, text="ニコニコ", command=lambda: _open_url(self.playlist.niconico_mylist_url))
                 btn.pack(side=tk.LEFT, padx=5)
 
         # フィルターボタン
@@ -359,10 +372,186 @@ class IntegratedPlaylistViewer:
         video_id = selection[0]
         for video in self.playlist.items:
             if video.id == video_id:
-                webbrowser.open(video.url)
+                _open_url(video.url)
                 break
 
 
+class ResultVideoRow:
+    """検索結果リストの1行（信頼性インジケーター付き）
+
+    VirtualListViewで使い回されるため、bind()で表示内容のみを差し替える。
+    """
+
+    HEIGHT = 86  # 行間を含む1行の高さ（px）
+
+    def __init__(self, parent, app: "PlaylistManagerGUI"):
+        self.app = app
+        self.video_id = ""
+        self._thumbnail = None  # 表示中のPhotoImage（参照を保持）
+
+        self.widget = ttk.Frame(parent, relief="groove", borderwidth=1)
+
+        # 内部フレーム
+        inner_frame = ttk.Frame(self.widget, padding="5")
+        inner_frame.pack(fill=tk.BOTH, expand=True)
+
+        # サムネイル（読み込み完了まではプレースホルダー）
+        self.thumb_frame = ttk.Frame(inner_frame, width=120, height=68)
+        self.thumb_frame.pack(side=tk.LEFT, padx=(0, 10))
+        self.thumb_frame.pack_propagate(False)
+
+        # サムネイルボタン（クリックで再生）
+        self.thumb_btn = ttk.Button(
+            self.thumb_frame,
+            text="▶ 再生",
+            command=lambda: self.app._open_video(self.video_id)
+        )
+        self.thumb_btn.pack(expand=True, fill=tk.BOTH)
+
+        # 再生ボタン
+        ttk.Button(
+            inner_frame,
+            text="🌐 YouTubeで開く",
+            command=lambda: self.app._open_video(self.video_id),
+            width=15
+        ).pack(side=tk.RIGHT, padx=(10, 0))
+
+        # 動画情報
+        info_frame = ttk.Frame(inner_frame)
+        info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        self.title_label = ttk.Label(info_frame, font=("", 9, "bold"))
+        self.title_label.pack(anchor=tk.W)
+
+        self.meta_label = ttk.Label(info_frame)
+        self.meta_label.pack(anchor=tk.W)
+
+        # 品質スコア表示（デバッグ用、スコアがある場合のみ）
+        self.score_label = ttk.Label(info_frame, foreground="purple", font=("", 8))
+
+    def bind(self, video: "VideoInfo", index: int):
+        """動画の内容を表示"""
+        self.video_id = video.video_id
+
+        # サムネイル（バックグラウンドで読み込み、この行が同じ動画を表示中の場合のみ反映）
+        self._thumbnail = None
+        self.thumb_btn.config(image="", text="▶ 再生")
+        if THUMBNAILS_AVAILABLE:
+            self.app.thumbnail_loader.request(
+                get_youtube_thumbnail_url(video.video_id),
+                lambda image, vid=video.video_id: self._set_thumbnail(vid, image),
+            )
+
+        # タイトル
+        title = video.title[:55] + "..." if len(video.title) > 55 else video.title
+        self.title_label.config(text=f"{index + 1}. {title}")
+
+        # 信頼性判定
+        is_official_by_id = is_official_channel_by_id(video.channel_id)
+        is_official_by_name = is_official_channel(video.channel_title)
+        is_verified = getattr(video, 'is_verified', False)
+
+        # 信頼性バッジを構築
+        badges = []
+        if is_official_by_id:
+            badges.append("⭐公式ID")
+        elif is_official_by_name:
+            badges.append("✓公式")
+        if is_verified:
+            badges.append("✓認証済")
+
+        # チャンネル名と信頼性インジケーター
+        channel_info = f"📺 {video.channel_title}"
+        if badges:
+            channel_info += f" {' '.join(badges)}"
+        channel_info += f" | 📅 {video.year}"
+
+        # 登録者数表示
+        if getattr(video, 'subscriber_count', None):
+            channel_info += f" | 👥 {self.app._format_subscriber_count(video.subscriber_count)}"
+
+        # 視聴回数表示
+        if getattr(video, 'view_count', None):
+            channel_info += f" | 👁 {self.app._format_view_count(video.view_count)}"
+
+        # 色分け（公式度に応じて）
+        if is_official_by_id:
+            meta_color = "#006600"  # 濃い緑（最高信頼性）
+        elif is_official_by_name or is_verified:
+            meta_color = "#0066cc"  # 青（高信頼性）
+        else:
+            meta_color = "gray"
+        self.meta_label.config(text=channel_info, foreground=meta_color)
+
+        if getattr(video, 'quality_score', 0) > 0:
+            self.score_label.config(text=f"品質スコア: {video.quality_score}")
+            self.score_label.pack(anchor=tk.W)
+        else:
+            self.score_label.pack_forget()
+
+
+    def _set_thumbnail(self, video_id: str, image):
+        """読み込んだサムネイルを表示"""
+        if video_id != self.video_id:
+            # 行が別の動画に再利用された
+            return
+        self._thumbnail = image
+        self.thumb_btn.config(image=image, text="")
+
+
+class PlaylistVideoRow:
+    """再生リスト動画一覧の1行
+
+    VirtualListViewで使い回されるため、bind()で表示内容のみを差し替える。
+    """
+
+    HEIGHT = 124  # 行間を含む1行の高さ（px）
+
+    def __init__(self, parent, app: "PlaylistManagerGUI"):
+        self.app = app
+        self.video_url = ""
+
+        self.widget = ttk.LabelFrame(parent, padding=10)
+
+        # 情報表示
+        info_frame = ttk.Frame(self.widget)
+        info_frame.pack(fill=tk.X)
+
+        self.channel_label = ttk.Label(info_frame, font=('', 9))
+        self.channel_label.pack(anchor="w")
+
+        self.date_label = ttk.Label(info_frame, font=('', 9), foreground="gray")
+        self.date_label.pack(anchor="w")
+
+        # ボタン
+        button_frame = ttk.Frame(self.widget)
+        button_frame.pack(fill=tk.X, pady=(5, 0))
+
+        ttk.Button(
+            button_frame,
+            text="▶ 再生",
+            command=lambda: _open_url(self.video_url),
+            width=10
+        ).pack(side=tk.LEFT, padx=(0, 5))
+
+        ttk.Button(
+            button_frame,
+            text="📋 URLコピー",
+            command=lambda: self.app._copy_to_clipboard(self.video_url),
+            width=12
+        ).pack(side=tk.LEFT, padx=5)
+
+    def bind(self, video: "VideoInfo", index: int):
+        """動画の内容を表示"""
+        self.video_url = f"https://www.youtube.com/watch?v={video.video_id}"
+        self.widget.config(
+            text=f"{index + 1}. {video.title[:50]}{'...' if len(video.title) > 50 else ''}"
+        )
+        self.channel_label.config(text=f"チャンネル: {video.channel_title}")
+        published_date = video.published_at.strftime("%Y/%m/%d") if video.published_at else "N/A"
+        self.date_label.config(text=f"公開日: {published_date}")
+
+
 class PlaylistManagerGUI:
     """YouTube Playlist Manager GUI アプリケーション"""
 
@@ -426,11 +615,18 @@ class PlaylistManagerGUI:
         # 実行中フラグ
         self.is_running = False
 
+        # ワーカースレッドからのUI更新キュー（定期コールバックでまとめて反映）
+        self.ui_queue = UIUpdateQueue(self.root)
+        self.ui_queue.start()
+
+        # サムネイルローダー（取得結果はUI更新キュー経由で反映）
+        self.thumbnail_loader = ThumbnailLoader(dispatch=self.ui_queue.post)
+
         # 内部スクロール可能なウィジェットのリスト（除外用）
         self._inner_scrollable_widgets: list[tk.Widget] = []
 
         # 結果保存用
-        self.selected_videos: list[VideoInfo] = []
+        self.selected_videos: list["VideoInfo"] = []
         self.playlist_url: Optional[str] = None
 
         # 現在のプレイリスト情報（動画確認用）
@@ -438,7 +634,7 @@ class PlaylistManagerGUI:
         self.current_playlist_title: Optional[str] = None
 
         # マルチプラットフォーム検索結果
-        self.niconico_videos: list[NicoVideoInfo] = []
+        self.niconico_videos: list["NicoVideoInfo"] = []
 
         # キーワードチェックボックス変数
         self.keyword_vars: dict[str, tk.BooleanVar] = {}
@@ -448,8 +644,8 @@ class PlaylistManagerGUI:
         self.history_manager = HistoryManager()
         self.integrated_playlist_manager = IntegratedPlaylistManager()
 
-        # プラットフォームクライアント
-        self.niconico_client = NicoNicoClient()
+        # プラットフォームクライアント（初回使用時に作成）
+        self._niconico_client: Optional["NicoNicoClient"] = None
 
         # 現在の検索条件（履歴保存用）
         self.current_search_conditions: Optional[SearchConditions] = None
@@ -489,7 +685,7 @@ class PlaylistManagerGUI:
             成功した場合True
         """
         try:
-            webbrowser.open(url)
+            _open_url(url)
             return True
         except Exception as e:
             print(f"URLを開けませんでした: {url}")
@@ -893,14 +1089,8 @@ class PlaylistManagerGUI:
         # 言語サブメニュー
         language_menu = tk.Menu(settings_menu, tearoff=0)
         settings_menu.add_cascade(label=t('menu_language'), menu=language_menu)
-        language_menu.add_command(label='日本語', command=lambda: self._change_language('ja'))
-        language_menu.add_command(label='English', command=lambda: self._change_language('en'))
-        language_menu.add_command(label='简体中文', command=lambda: self._change_language('zh-CN'))
-        language_menu.add_command(label='繁體中文', command=lambda: self._change_language('zh-TW'))
-        language_menu.add_command(label='한국어', command=lambda: self._change_language('ko'))
-        language_menu.add_command(label='Español', command=lambda: self._change_language('es'))
-        language_menu.add_command(label='Français', command=lambda: self._change_language('fr'))
-        language_menu.add_command(label='Deutsch', command=lambda: self._change_language('de'))
+        for lang_code, lang_name in LANGUAGE_NAMES.items():
+            language_menu.add_command(label=lang_name, command=lambda code=lang_code: self._change_language(code))
         
         settings_menu.add_separator()
 
@@ -973,6 +1163,14 @@ class PlaylistManagerGUI:
         # プラットフォームチェックボックスの有効/無効を更新
         self._update_platform_checkboxes()
 
+    @property
+    def niconico_client(self) -> "NicoNicoClient":
+        """ニコニコ動画クライアント（初回使用時に作成）"""
+        if self._niconico_client is None:
+            from niconico_client import NicoNicoClient
+            self._niconico_client = NicoNicoClient()
+        return self._niconico_client
+
     def _check_setup(self):
         """セットアップ状態をチェックし、必要に応じてウィザードを起動"""
         if SetupStatus.needs_setup():
@@ -994,6 +1192,7 @@ class PlaylistManagerGUI:
             if success:
                 messagebox.showinfo("完了", "セットアップが完了しました！\nすぐにプラットフォームを使用できます。")
 
+        from setup_wizard import SetupWizard
         wizard = SetupWizard(self.root, on_complete=on_complete)
 
     def _reset_credentials(self):
@@ -1061,6 +1260,11 @@ class PlaylistManagerGUI:
         if TOKEN_FILE.exists():
             TOKEN_FILE.unlink()
 
+        # 共有中のYouTubeサービスも破棄する（auth読み込み済みの場合のみ）
+        auth_module = sys.modules.get("auth")
+        if auth_module is not None:
+            auth_module.reset_authenticated_service()
+
         # セットアップ状態をリセット
         SetupStatus.reset_setup()
 
@@ -2260,26 +2464,17 @@ https://account.nicovideo.jp/register
         )
         self.result_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
 
-        # 結果表示用のスクロール可能なフレーム
-        result_canvas = tk.Canvas(self.result_frame, height=150, highlightthickness=0)
-        result_scrollbar = ttk.Scrollbar(self.result_frame, orient="vertical", command=result_canvas.yview)
-        self.result_scrollable_frame = ttk.Frame(result_canvas)
-
-        self.result_scrollable_frame.bind(
-            "<Configure>",
-            lambda e: result_canvas.configure(scrollregion=result_canvas.bbox("all"))
+        # 選択された動画のリスト（表示中の行のみウィジェットを作成）
+        self.result_list = VirtualListView(
+            self.result_frame,
+            row_factory=lambda parent: ResultVideoRow(parent, self),
+            row_height=ResultVideoRow.HEIGHT,
+            height=150,
         )
-
-        result_canvas.create_window((0, 0), window=self.result_scrollable_frame, anchor="nw")
-        result_canvas.configure(yscrollcommand=result_scrollbar.set)
-
-        result_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        result_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        self.result_canvas = result_canvas
+        self.result_list.pack(fill=tk.BOTH, expand=True)
 
         # 内部スクロール可能エリアとして登録（グローバルマウスホイールハンドラで使用）
-        self._register_inner_scrollable(self.result_scrollable_frame, result_canvas)
+        self._register_inner_scrollable(self.result_list, self.result_list.canvas)
 
         # テキスト結果も残す（ログ表示用）
         self.result_text = scrolledtext.ScrolledText(
@@ -2368,7 +2563,13 @@ https://account.nicovideo.jp/register
         self.history_tree.column("era", width=60)
 
         history_scrollbar = ttk.Scrollbar(history_tree_frame, orient="vertical", command=self.history_tree.yview)
-        self.history_tree.configure(yscrollcommand=history_scrollbar.set)
+        # 履歴の変更は差分で反映し、古い履歴はスクロールに応じて読み込む
+        self.history_view = HistoryTreeView(
+            self.history_tree,
+            history_scrollbar,
+            self.history_manager,
+            dispatch=self.ui_queue.post,
+        )
 
         self.history_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         history_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -2557,6 +2758,22 @@ https://account.nicovideo.jp/register
         self.result_text.see(tk.END)
         self.result_text.config(state=tk.DISABLED)
 
+    def _append_results(self, texts: list[str]):
+        """複数行をまとめて結果テキストに追加"""
+        self._append_result("\n".join(texts))
+
+    def _post_result(self, text: str):
+        """ワーカースレッドから結果テキストへの追加を登録"""
+        self.ui_queue.post_batched(self._append_results, text)
+
+    def _post_progress(self, message: str):
+        """ワーカースレッドから進行状況の更新を登録（連続する更新は最新のみ反映）"""
+        self.ui_queue.post_batched(self._apply_latest_progress, message)
+
+    def _apply_latest_progress(self, messages: list[str]):
+        """まとめられた進行状況のうち最新のものを反映"""
+        self._update_progress(messages[-1])
+
     def _clear_result(self):
         """結果テキストをクリア"""
         self.result_text.config(state=tk.NORMAL)
@@ -2571,9 +2788,8 @@ https://account.nicovideo.jp/register
         self.current_playlist_id = None
         self.current_playlist_title = None
 
-        # 動画カードをクリア
-        for widget in self.result_scrollable_frame.winfo_children():
-            widget.destroy()
+        # 動画リストをクリア
+        self.result_list.clear()
 
     def _copy_url(self):
         """URLをクリップボードにコピー"""
@@ -2587,7 +2803,7 @@ https://account.nicovideo.jp/register
         """プレイリストをブラウザで開く"""
         url = self.url_var.get()
         if url:
-            webbrowser.open(url)
+            _open_url(url)
 
     def _view_playlist_videos(self):
         """作成したプレイリストの動画を確認"""
@@ -2769,26 +2985,12 @@ https://account.nicovideo.jp/register
     # ========================================
 
     def _refresh_history(self):
-        """履歴リストを更新"""
-        # 既存のアイテムをクリア
-        for item in self.history_tree.get_children():
-            self.history_tree.delete(item)
-
-        # 履歴を取得して表示
-        for entry in self.history_manager.get_all():
-            self.history_tree.insert(
-                "",
-                tk.END,
-                iid=entry.id,
-                values=(
-                    entry.get_formatted_date(),
-                    entry.title,
-                    entry.video_count,
-                    entry.get_platform_display(),
-                    entry.conditions.category,
-                    entry.conditions.era,
-                )
-            )
+        """履歴リストを最初のページから読み込み直す
+
+        追加・削除などの変更は HistoryTreeView が差分で反映するため、
+        通常は呼ぶ必要はない（更新ボタン用）。
+        """
+        self.history_view.reload()
 
     def _clear_history(self):
         """全履歴を削除"""
@@ -2799,7 +3001,6 @@ https://account.nicovideo.jp/register
             return
 
         count = self.history_manager.clear_all()
-        self._refresh_history()
         messagebox.showinfo("削除完了", f"{count}件の履歴を削除しました")
 
     def _export_history(self):
@@ -2809,6 +3010,7 @@ https://account.nicovideo.jp/register
             defaultextension=".json",
             filetypes=[
                 ("JSON files", "*.json"),
+                ("JSON Lines files", "*.jsonl"),
                 ("CSV files", "*.csv"),
                 ("All files", "*.*")
             ],
@@ -2825,24 +3027,70 @@ https://account.nicovideo.jp/register
             else:
                 messagebox.showerror("エラー", "CSVエクスポートに失敗しました")
         else:
-            # JSONエクスポート
-            if self.history_manager.export_to_file(path):
-                messagebox.showinfo("エクスポート完了", f"履歴を {file_path} にエクスポートしました")
-            else:
-                messagebox.showerror("エラー", "エクスポートに失敗しました")
+            # JSON/JSON Linesエクスポート（件数が多い場合に画面が止まらないよう別スレッドで書き出す）
+            def report_progress(done: int, total: int):
+                if total:
+                    self._post_progress(f"履歴をエクスポート中... {done * 100 // total}%")
+
+            def export_in_thread():
+                success = False
+                try:
+                    success = self.history_manager.export_to_file(path, progress=report_progress)
+                except Exception as e:
+                    print(f"エクスポートエラー: {e}")
+                finally:
+                    # 失敗した場合もボタンを元に戻す
+                    self.ui_queue.post(self._finish_history_export, success, file_path)
+
+            self.history_buttons['export'].config(state=tk.DISABLED)
+            threading.Thread(target=export_in_thread, daemon=True).start()
+
+    def _finish_history_export(self, success: bool, file_path: str):
+        """履歴のエクスポート完了（Tkスレッド）"""
+        self.history_buttons['export'].config(state=tk.NORMAL)
+        self._update_progress(t('progress_waiting'))
+        if success:
+            messagebox.showinfo("エクスポート完了", f"履歴を {file_path} にエクスポートしました")
+        else:
+            messagebox.showerror("エラー", "エクスポートに失敗しました")
 
     def _import_history(self):
-        """履歴をインポート"""
+        """履歴をインポート（別スレッドで1件ずつ読み込み、一覧には差分で反映される）"""
         file_path = filedialog.askopenfilename(
             title="履歴をインポート",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[
+                ("JSON files", "*.json"),
+                ("JSON Lines files", "*.jsonl"),
+                ("All files", "*.*")
+            ]
         )
         if not file_path:
             return
 
-        count = self.history_manager.import_from_file(Path(file_path), merge=True)
+        def report_progress(done: int, total: int):
+            if total:
+                self._post_progress(f"履歴をインポート中... {done * 100 // total}%")
+
+        def import_in_thread():
+            count = 0
+            try:
+                count = self.history_manager.import_from_file(
+                    Path(file_path), merge=True, progress=report_progress
+                )
+            except Exception as e:
+                print(f"インポートエラー: {e}")
+            finally:
+                # 失敗した場合もボタンを元に戻す
+                self.ui_queue.post(self._finish_history_import, count)
+
+        self.history_buttons['import'].config(state=tk.DISABLED)
+        threading.Thread(target=import_in_thread, daemon=True).start()
+
+    def _finish_history_import(self, count: int):
+        """履歴のインポート完了（Tkスレッド）"""
+        self.history_buttons['import'].config(state=tk.NORMAL)
+        self._update_progress(t('progress_waiting'))
         if count > 0:
-            self._refresh_history()
             messagebox.showinfo("インポート完了", f"{count}件の履歴をインポートしました")
         else:
             messagebox.showerror("エラー", "インポートに失敗しました（ファイル形式を確認してください）")
@@ -2888,7 +3136,7 @@ https://account.nicovideo.jp/register
             messagebox.showwarning("選択なし", "履歴を選択してください")
             return
 
-        webbrowser.open(entry.url)
+        _open_url(entry.url)
 
     def _view_history_videos(self):
         """履歴のプレイリストの動画を確認"""
@@ -2925,7 +3173,6 @@ https://account.nicovideo.jp/register
             return
 
         self.history_manager.delete(entry.id)
-        self._refresh_history()
 
     def _export_history_csv(self):
         """履歴をCSV形式でエクスポート"""
@@ -2995,7 +3242,6 @@ https://account.nicovideo.jp/register
                 self._restore_presets_data(data['presets'])
 
             messagebox.showinfo("成功", "バックアップを復元しました")
-            self._refresh_history()
         except Exception as e:
             messagebox.showerror("エラー", f"エクスポートに失敗しました:\n{str(e)}")
 
@@ -3060,7 +3306,6 @@ https://account.nicovideo.jp/register
                     self._restore_presets_data(data['presets'])
 
                 messagebox.showinfo("成功", "バックアップを復元しました")
-                self._refresh_history()
             except Exception as e:
                 messagebox.showerror("エラー", f"エクスポートに失敗しました:\n{str(e)}")
 
@@ -3084,12 +3329,10 @@ https://account.nicovideo.jp/register
 
     def _restore_history_data(self, history_data: list):
         """履歴データを復元"""
-        # 既存の履歴をクリアして新しいデータをインポート
-        self.history_manager.clear_all()
-        for entry_data in history_data:
-            entry = HistoryEntry.from_dict(entry_data)
-            self.history_manager._history.append(entry)
-        self.history_manager._save()
+        # 既存の履歴を新しいデータで置き換える
+        self.history_manager.replace_all([
+            HistoryEntry.from_dict(entry_data) for entry_data in history_data
+        ])
 
     def _restore_presets_data(self, presets_data: list):
         """プリセットデータを復元"""
@@ -3615,7 +3858,7 @@ https://account.nicovideo.jp/register
         if self.integrated_playlist_manager.export_to_html(playlist.id, Path(file_path)):
             messagebox.showinfo("エクスポート完了", f"プレイリストを {file_path} にエクスポートしました\n\nブラウザで開きますか？")
             if messagebox.askyesno("確認", "ブラウザで開きますか？"):
-                webbrowser.open(f"file://{file_path}")
+                _open_url(f"file://{file_path}")
         else:
             messagebox.showerror("エラー", "エクスポートに失敗しました")
 
@@ -3648,7 +3891,7 @@ https://account.nicovideo.jp/register
     def _open_video(self, video_id: str):
         """動画をブラウザで開く"""
         url = f"https://www.youtube.com/watch?v={video_id}"
-        webbrowser.open(url)
+        _open_url(url)
 
     def show_playlist_videos(self, playlist_id: str, playlist_title: str):
         """再生リストの動画一覧を新しいウィンドウで表示"""
@@ -3671,7 +3914,7 @@ https://account.nicovideo.jp/register
         ttk.Button(
             header_frame,
             text="🌐 YouTubeで開く",
-            command=lambda: webbrowser.open(f"https://www.youtube.com/playlist?list={playlist_id}")
+            command=lambda: _open_url(f"https://www.youtube.com/playlist?list={playlist_id}")
         ).pack(side=tk.RIGHT, padx=5)
 
         ttk.Button(
@@ -3683,55 +3926,31 @@ https://account.nicovideo.jp/register
         # セパレータ
         ttk.Separator(viewer_window, orient="horizontal").pack(fill=tk.X)
 
-        # スクロール可能なキャンバス
-        canvas_frame = ttk.Frame(viewer_window)
-        canvas_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-
-        canvas = tk.Canvas(canvas_frame, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        # 合計表示
+        total_label = ttk.Label(viewer_window, font=('', 11, 'bold'))
+        total_label.pack(anchor=tk.W, padx=15, pady=(10, 0))
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        # 動画リスト（表示中の行のみウィジェットを作成）
+        video_list = VirtualListView(
+            viewer_window,
+            row_factory=lambda parent: PlaylistVideoRow(parent, self),
+            row_height=PlaylistVideoRow.HEIGHT,
+            height=500,
         )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        # 配置
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        # マウスホイール対応
-        def _on_mousewheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-
-        # ウィンドウが閉じられたときにマウスホイールバインドを解除
-        def _on_close():
-            canvas.unbind_all("<MouseWheel>")
-            viewer_window.destroy()
-
-        viewer_window.protocol("WM_DELETE_WINDOW", _on_close)
+        video_list.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # 動画を取得して表示
-        self._load_playlist_videos(scrollable_frame, playlist_id, canvas)
+        self._load_playlist_videos(video_list, total_label, playlist_id)
 
-    def _load_playlist_videos(self, parent_frame: ttk.Frame, playlist_id: str, canvas: tk.Canvas):
+    def _load_playlist_videos(self, video_list: VirtualListView, total_label: ttk.Label, playlist_id: str):
         """再生リストから動画を取得して表示"""
         # ローディング表示
-        loading_label = ttk.Label(
-            parent_frame,
-            text="動画を読み込み中...",
-            font=('', 12)
-        )
-        loading_label.pack(pady=20)
+        video_list.show_message("動画を読み込み中...")
 
         def fetch_videos():
             """別スレッドで動画を取得"""
             try:
+                from youtube_client import YouTubeClient
                 client = YouTubeClient()
 
                 # 再生リストの動画を取得（最大100本）
@@ -3739,13 +3958,13 @@ https://account.nicovideo.jp/register
 
                 # UIスレッドで表示
                 self.root.after(0, lambda: self._display_playlist_videos(
-                    parent_frame, videos, loading_label, canvas
+                    video_list, total_label, videos
                 ))
 
             except Exception as e:
                 error_msg = str(e)
-                self.root.after(0, lambda: loading_label.config(
-                    text=f"エラー: {error_msg}",
+                self.root.after(0, lambda: video_list.show_message(
+                    f"エラー: {error_msg}",
                     foreground="red"
                 ))
 
@@ -3753,78 +3972,19 @@ https://account.nicovideo.jp/register
         thread = threading.Thread(target=fetch_videos, daemon=True)
         thread.start()
 
-    def _display_playlist_videos(self, parent_frame: ttk.Frame, videos: list,
-                                  loading_label: ttk.Label, canvas: tk.Canvas):
+    def _display_playlist_videos(self, video_list: VirtualListView, total_label: ttk.Label, videos: list):
         """動画を表示"""
-        # ローディングラベルを削除
-        loading_label.destroy()
+        if not video_list.winfo_exists():
+            # 読み込み中にウィンドウが閉じられた
+            return
 
         if not videos:
-            ttk.Label(
-                parent_frame,
-                text="動画が見つかりませんでした",
-                font=('', 11)
-            ).pack(pady=20)
+            video_list.show_message("動画が見つかりませんでした")
             return
 
         # 合計表示（上部）
-        total_label = ttk.Label(
-            parent_frame,
-            text=f"合計: {len(videos)}本の動画",
-            font=('', 11, 'bold')
-        )
-        total_label.pack(pady=(0, 10), anchor=tk.W)
-
-        # 各動画を表示
-        for idx, video in enumerate(videos, 1):
-            # 動画カード
-            card_frame = ttk.LabelFrame(
-                parent_frame,
-                text=f"{idx}. {video.title[:50]}{'...' if len(video.title) > 50 else ''}",
-                padding=10
-            )
-            card_frame.pack(fill=tk.X, padx=5, pady=5)
-
-            # 情報表示
-            info_frame = ttk.Frame(card_frame)
-            info_frame.pack(fill=tk.X)
-
-            ttk.Label(
-                info_frame,
-                text=f"チャンネル: {video.channel_title}",
-                font=('', 9)
-            ).pack(anchor="w")
-
-            published_date = video.published_at.strftime("%Y/%m/%d") if video.published_at else "N/A"
-            ttk.Label(
-                info_frame,
-                text=f"公開日: {published_date}",
-                font=('', 9),
-                foreground="gray"
-            ).pack(anchor="w")
-
-            # ボタン
-            button_frame = ttk.Frame(card_frame)
-            button_frame.pack(fill=tk.X, pady=(5, 0))
-
-            video_url = f"https://www.youtube.com/watch?v={video.video_id}"
-
-            ttk.Button(
-                button_frame,
-                text="▶ 再生",
-                command=lambda url=video_url: webbrowser.open(url),
-                width=10
-            ).pack(side=tk.LEFT, padx=(0, 5))
-
-            ttk.Button(
-                button_frame,
-                text="📋 URLコピー",
-                command=lambda url=video_url: self._copy_to_clipboard(url),
-                width=12
-            ).pack(side=tk.LEFT, padx=5)
-
-        # スクロール領域を更新
-        canvas.configure(scrollregion=canvas.bbox("all"))
+        total_label.config(text=f"合計: {len(videos)}本の動画")
+        video_list.set_items(videos)
 
     def _format_subscriber_count(self, count: Optional[int]) -> str:
         """登録者数をフォーマット"""
@@ -3846,103 +4006,6 @@ https://account.nicovideo.jp/register
             return f"{count / 1_000:.1f}K回"
         return f"{count}回"
 
-    def _create_video_card(self, video: VideoInfo, index: int):
-        """動画カードを作成（信頼性インジケーター付き）"""
-        card_frame = ttk.Frame(self.result_scrollable_frame, relief="groove", borderwidth=1)
-        card_frame.pack(fill=tk.X, pady=2, padx=2)
-
-        # 内部フレーム
-        inner_frame = ttk.Frame(card_frame, padding="5")
-        inner_frame.pack(fill=tk.X)
-
-        # サムネイル（プレースホルダー）
-        thumb_frame = ttk.Frame(inner_frame, width=120, height=68)
-        thumb_frame.pack(side=tk.LEFT, padx=(0, 10))
-        thumb_frame.pack_propagate(False)
-
-        # サムネイルボタン（クリックで再生）
-        thumb_btn = ttk.Button(
-            thumb_frame,
-            text="▶ 再生",
-            command=lambda vid=video.video_id: self._open_video(vid)
-        )
-        thumb_btn.pack(expand=True, fill=tk.BOTH)
-
-        # 動画情報
-        info_frame = ttk.Frame(inner_frame)
-        info_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-        # タイトル
-        title = video.title[:55] + "..." if len(video.title) > 55 else video.title
-
-        # 信頼性判定
-        is_official_by_id = is_official_channel_by_id(video.channel_id)
-        is_official_by_name = is_official_channel(video.channel_title)
-        is_verified = getattr(video, 'is_verified', False)
-
-        # 信頼性バッジを構築
-        badges = []
-        if is_official_by_id:
-            badges.append("⭐公式ID")
-        elif is_official_by_name:
-            badges.append("✓公式")
-        if is_verified:
-            badges.append("✓認証済")
-
-        badge_text = " ".join(badges) if badges else ""
-
-        title_label = ttk.Label(
-            info_frame,
-            text=f"{index}. {title}",
-            font=("", 9, "bold"),
-            wraplength=450
-        )
-        title_label.pack(anchor=tk.W)
-
-        # チャンネル名と信頼性インジケーター
-        channel_info = f"📺 {video.channel_title}"
-        if badge_text:
-            channel_info += f" {badge_text}"
-        channel_info += f" | 📅 {video.year}"
-
-        # 登録者数表示
-        if hasattr(video, 'subscriber_count') and video.subscriber_count:
-            channel_info += f" | 👥 {self._format_subscriber_count(video.subscriber_count)}"
-
-        # 視聴回数表示
-        if hasattr(video, 'view_count') and video.view_count:
-            channel_info += f" | 👁 {self._format_view_count(video.view_count)}"
-
-        # 色分け（公式度に応じて）
-        if is_official_by_id:
-            meta_color = "#006600"  # 濃い緑（最高信頼性）
-        elif is_official_by_name or is_verified:
-            meta_color = "#0066cc"  # 青（高信頼性）
-        else:
-            meta_color = "gray"
-
-        meta_label = ttk.Label(info_frame, text=channel_info, foreground=meta_color)
-        meta_label.pack(anchor=tk.W)
-
-        # 品質スコア表示（デバッグ用、スコアがある場合のみ）
-        if hasattr(video, 'quality_score') and video.quality_score > 0:
-            score_label = ttk.Label(
-                info_frame,
-                text=f"品質スコア: {video.quality_score}",
-                foreground="purple",
-                font=("", 8)
-            )
-            score_label.pack(anchor=tk.W)
-
-        # 再生ボタン
-        play_btn = ttk.Button(
-            inner_frame,
-            text="🌐 YouTubeで開く",
-            command=lambda vid=video.video_id: self._open_video(vid),
-            width=15
-        )
-        play_btn.pack(side=tk.RIGHT, padx=(10, 0))
-
     def _execute(self):
         """再生リスト作成を実行"""
         if self.is_running:
@@ -4048,6 +4111,10 @@ https://account.nicovideo.jp/register
         if selected_platforms is None:
             selected_platforms = ["youtube"]
 
+        # YouTube API クライアントはここで初めて読み込む（起動時間短縮のため）
+        from youtube_client import YouTubeClient, SearchPrecision
+        from playlist_manager import PlaylistManager
+
         # YouTubeが選択されているか
         youtube_selected = "youtube" in selected_platforms
         # ニコニコ動画が選択されているか
@@ -4072,18 +4139,18 @@ https://account.nicovideo.jp/register
             # 選択されたプラットフォームを表示
             platform_names_disp = {"youtube": "YouTube", "niconico": "ニコニコ動画"}
             selected_platform_names = [platform_names_disp.get(p, p) for p in selected_platforms]
-            self.root.after(0, lambda: self._append_result(f"選択されたプラットフォーム: {', '.join(selected_platform_names)}"))
-            self.root.after(0, lambda: self._append_result(f"検索条件:"))
-            self.root.after(0, lambda: self._append_result(f"  年代: {era}"))
-            self.root.after(0, lambda: self._append_result(f"  カテゴリ: {category}"))
-            self.root.after(0, lambda: self._append_result(f"  動画数: {count}"))
-            self.root.after(0, lambda: self._append_result(f"  地域: {country}" + (f" ({region_code})" if region_code else "")))
+            self._post_result(f"選択されたプラットフォーム: {', '.join(selected_platform_names)}")
+            self._post_result(f"検索条件:")
+            self._post_result(f"  年代: {era}")
+            self._post_result(f"  カテゴリ: {category}")
+            self._post_result(f"  動画数: {count}")
+            self._post_result(f"  地域: {country}" + (f" ({region_code})" if region_code else ""))
             if keyword:
-                self.root.after(0, lambda: self._append_result(f"  キーワード: {keyword}"))
-            self.root.after(0, lambda: self._append_result(f"  プライバシー: {privacy}"))
-            self.root.after(0, lambda: self._append_result(f"  公式優先: {'ON' if prefer_official else 'OFF'}"))
-            self.root.after(0, lambda: self._append_result(f"  検索精度: {precision_labels.get(search_precision, search_precision)}"))
-            self.root.after(0, lambda: self._append_result(""))
+                self._post_result(f"  キーワード: {keyword}")
+            self._post_result(f"  プライバシー: {privacy}")
+            self._post_result(f"  公式優先: {'ON' if prefer_official else 'OFF'}")
+            self._post_result(f"  検索精度: {precision_labels.get(search_precision, search_precision)}")
+            self._post_result("")
 
             # 共通の変数を初期化
             selected_videos = []
@@ -4118,18 +4185,18 @@ https://account.nicovideo.jp/register
             if region_keyword_suffix and region_keyword_suffix.lower() not in full_query.lower():
                 full_query = f"{full_query} {region_keyword_suffix}".strip()
 
-            self.root.after(0, lambda: self._append_result(f"検索クエリ: {full_query}"))
+            self._post_result(f"検索クエリ: {full_query}")
 
             # ========================================
             # YouTubeが選択されていない場合: ニコニコ動画のみの処理
             # ========================================
             if not youtube_selected:
-                self.root.after(0, lambda: self._append_result("\nYouTube: 選択されていません（スキップ）"))
+                self._post_result("\nYouTube: 選択されていません（スキップ）")
 
                 # ニコニコ動画のみの統合プレイリストを作成
                 if niconico_selected:
-                    self.root.after(0, lambda: self._append_result("\n" + "=" * 50))
-                    self.root.after(0, lambda: self._append_result("ニコニコ動画検索を開始..."))
+                    self._post_result("\n" + "=" * 50)
+                    self._post_result("ニコニコ動画検索を開始...")
 
                     integrated_title = f"{playlist_title} (ニコニコ動画)"
                     integrated_playlist = self.integrated_playlist_manager.create(
@@ -4137,7 +4204,7 @@ https://account.nicovideo.jp/register
                         description=f"年代: {era}, カテゴリ: {category}, キーワード: {keyword}"
                     )
 
-                    self.root.after(0, lambda: self._update_progress("ニコニコ動画で検索中..."))
+                    self._post_progress("ニコニコ動画で検索中...")
 
                     nico_videos = []
                     try:
@@ -4150,14 +4217,14 @@ https://account.nicovideo.jp/register
                             nico_videos.append(video)
 
                         if nico_videos:
-                            self.root.after(0, lambda: self._append_result(f"ニコニコ動画: {len(nico_videos)}本の動画が見つかりました"))
+                            self._post_result(f"ニコニコ動画: {len(nico_videos)}本の動画が見つかりました")
                             for video in nico_videos:
                                 item = create_integrated_item_from_niconico(video)
                                 integrated_playlist.add_item(item)
                         else:
-                            self.root.after(0, lambda: self._append_result("ニコニコ動画: 動画が見つかりませんでした"))
+                            self._post_result("ニコニコ動画: 動画が見つかりませんでした")
                     except Exception as e:
-                        self.root.after(0, lambda: self._append_result(f"ニコニコ動画検索エラー: {str(e)}"))
+                        self._post_result(f"ニコニコ動画検索エラー: {str(e)}")
 
                     # 統合プレイリストを保存
                     self.integrated_playlist_manager.update(integrated_playlist)
@@ -4165,27 +4232,47 @@ https://account.nicovideo.jp/register
 
                     # 結果を表示
                     counts = integrated_playlist.get_platform_counts()
-                    self.root.after(0, lambda: self._append_result("\n" + "=" * 50))
-                    self.root.after(0, lambda: self._append_result("統合プレイリスト作成完了!"))
-                    self.root.after(0, lambda: self._append_result(f"  タイトル: {integrated_title}"))
-                    self.root.after(0, lambda: self._append_result(f"  合計: {len(integrated_playlist.items)}本"))
-                    self.root.after(0, lambda: self._append_result("=" * 50))
-                    self.root.after(0, lambda: self._append_result("※ ビューワーから動画を再生できます"))
+                    self._post_result("\n" + "=" * 50)
+                    self._post_result("統合プレイリスト作成完了!")
+                    self._post_result(f"  タイトル: {integrated_title}")
+                    self._post_result(f"  合計: {len(integrated_playlist.items)}本")
+                    self._post_result("=" * 50)
+                    self._post_result("※ ビューワーから動画を再生できます")
 
                     # 統合プレイリストリストを更新
-                    self.root.after(0, self._refresh_integrated_playlists)
-                    self.root.after(0, lambda: self._update_progress("完了!"))
+                    self.ui_queue.post(self._refresh_integrated_playlists)
+                    self._post_progress("完了!")
 
                 else:
-                    self.root.after(0, lambda: self._append_result("プラットフォームが選択されていません"))
-                    self.root.after(0, lambda: self._update_progress("完了（処理なし）"))
+                    self._post_result("プラットフォームが選択されていません")
+                    self._post_progress("完了（処理なし）")
 
                 return  # YouTube以外の処理が完了したので終了
 
             # ========================================
             # YouTube検索処理
             # ========================================
-            self.root.after(0, lambda: self._update_progress("YouTube APIに接続中..."))
+            self._post_progress("YouTube APIに接続中...")
+
+            # クォータ消費を見積もり、残りが足りない場合は実行しない
+            quota_scheduler = get_quota_scheduler()
+            estimated_units = estimate_random_run_cost(
+                count,
+                include_channels=precision in (SearchPrecision.HIGH, SearchPrecision.HIGHEST),
+                precision=precision,
+                category=category,
+            )
+            remaining_units = quota_scheduler.get_remaining()
+            self._post_result(
+                f"推定クォータ消費: {estimated_units}ユニット (本日の残り: {remaining_units})"
+            )
+            if not quota_scheduler.can_afford(estimated_units):
+                self._post_progress("APIクォータ不足")
+                self._post_result(
+                    "\n本日のAPIクォータが不足しているため実行を中止しました。\n"
+                    "動画数を減らすか、太平洋時間0時のリセット後にお試しください。"
+                )
+                return
 
             client = YouTubeClient()
             manager = PlaylistManager()
@@ -4195,7 +4282,7 @@ https://account.nicovideo.jp/register
             published_after = datetime.fromisoformat(start_date)
             published_before = datetime.fromisoformat(end_date)
 
-            self.root.after(0, lambda: self._update_progress("動画を検索中..."))
+            self._post_progress("動画を検索中...")
 
             # 検索（精度に応じて異なる方法を使用）
             search_count = min(count * 5, 200)
@@ -4203,9 +4290,9 @@ https://account.nicovideo.jp/register
 
             if precision in (SearchPrecision.HIGH, SearchPrecision.HIGHEST):
                 # 高精度・最高精度検索
-                self.root.after(0, lambda: self._append_result(
+                self._post_result(
                     f"高精度検索モード: {'公式チャンネルIDから検索' if precision == SearchPrecision.HIGHEST else '公式チャンネルフィルタ'}"
-                ))
+                )
 
                 for video in client.search_videos_advanced(
                     query=full_query,
@@ -4216,13 +4303,14 @@ https://account.nicovideo.jp/register
                     region_code=region_code,
                     precision=precision,
                     category=category,
+                    pipelined=True,
                 ):
                     if not self.is_running:
                         return
                     videos.append(video)
                     if len(videos) % 10 == 0:
                         msg = f"検索中... {len(videos)}本の動画を取得"
-                        self.root.after(0, lambda m=msg: self._update_progress(m))
+                        self._post_progress(msg)
             else:
                 # 標準検索
                 for video in client.search_videos(
@@ -4232,48 +4320,48 @@ https://account.nicovideo.jp/register
                     published_before=published_before,
                     video_category_id=category_id,
                     region_code=region_code,
+                    pipelined=True,
                 ):
                     if not self.is_running:
                         return
                     videos.append(video)
                     if len(videos) % 10 == 0:
                         msg = f"検索中... {len(videos)}本の動画を取得"
-                        self.root.after(0, lambda m=msg: self._update_progress(m))
+                        self._post_progress(msg)
 
             if not videos:
-                self.root.after(0, lambda: self._update_progress("動画が見つかりませんでした"))
-                self.root.after(0, lambda: self._append_result("\n条件に合う動画が見つかりませんでした。"))
+                self._post_progress("動画が見つかりませんでした")
+                self._post_result("\n条件に合う動画が見つかりませんでした。")
                 if precision == SearchPrecision.HIGHEST:
-                    self.root.after(0, lambda: self._append_result("ヒント: 最高精度モードは登録済み公式チャンネルのみ検索します。"))
-                    self.root.after(0, lambda: self._append_result("検索精度を「標準」または「高精度」に変更してお試しください。"))
+                    self._post_result("ヒント: 最高精度モードは登録済み公式チャンネルのみ検索します。")
+                    self._post_result("検索精度を「標準」または「高精度」に変更してお試しください。")
                 else:
-                    self.root.after(0, lambda: self._append_result("検索クエリや条件を変更してお試しください。"))
-                self.root.after(0, self._finish_execution)
+                    self._post_result("検索クエリや条件を変更してお試しください。")
+                self.ui_queue.post(self._finish_execution)
                 return
 
-            self.root.after(0, lambda: self._append_result(f"\n{len(videos)}本の動画が見つかりました"))
+            self._post_result(f"\n{len(videos)}本の動画が見つかりました")
 
-            # チャンネル情報を付加して品質スコアを計算
+            # チャンネル情報（登録者数）を付加
             if precision in (SearchPrecision.HIGH, SearchPrecision.HIGHEST):
-                self.root.after(0, lambda: self._update_progress("チャンネル情報を取得中..."))
+                self._post_progress("チャンネル情報を取得中...")
                 videos = client.enrich_videos_with_channel_info(videos)
-            else:
-                # 標準モードでも品質スコアを計算
-                for video in videos:
-                    video.calculate_quality_score()
+
+            # 品質スコアを一括計算（降順の並びと公式動画数も同時に求める）
+            scoring = score_videos(videos)
 
             # 公式優先モードの場合、品質スコアでソート
             if prefer_official:
-                self.root.after(0, lambda: self._update_progress("品質スコアで並び替え中..."))
+                self._post_progress("品質スコアで並び替え中...")
 
                 # 品質スコアでソート
-                videos.sort(key=lambda v: v.quality_score, reverse=True)
+                videos = [videos[i] for i in scoring.order]
 
-                # 公式動画の数を集計（スコア50以上を公式とみなす）
-                official_count = sum(1 for v in videos if v.quality_score >= 50)
-                self.root.after(0, lambda: self._append_result(
+                # 公式動画の数（スコア50以上を公式とみなす）
+                official_count = scoring.official_count
+                self._post_result(
                     f"公式/高品質チャンネルの動画: {official_count}本"
-                ))
+                )
 
                 # ソート済みリストから選択（上位を優先）
                 if len(videos) <= count:
@@ -4303,20 +4391,19 @@ https://account.nicovideo.jp/register
 
             self.selected_videos = selected_videos
             if prefer_official:
-                self.root.after(0, lambda: self._append_result(
+                self._post_result(
                     f"{len(selected_videos)}本を品質スコア優先で選択しました\n"
-                ))
+                )
             else:
-                self.root.after(0, lambda: self._append_result(
+                self._post_result(
                     f"{len(selected_videos)}本をランダムに選択しました\n"
-                ))
+                )
 
-            # 動画カードを表示
-            for i, video in enumerate(selected_videos, 1):
-                self.root.after(0, lambda v=video, idx=i: self._create_video_card(v, idx))
+            # 動画リストを表示
+            self.ui_queue.post(self.result_list.set_items, list(selected_videos))
 
             # 再生リスト作成
-            self.root.after(0, lambda: self._update_progress("再生リストを作成中..."))
+            self._post_progress("再生リストを作成中...")
 
             playlist_title = f"Mix lists - {era} {category.capitalize()}"
             if country != "全世界":
@@ -4326,7 +4413,7 @@ https://account.nicovideo.jp/register
 
             # 詳細説明を生成（オプションに応じて）
             if add_detailed_description:
-                self.root.after(0, lambda: self._update_progress("説明文を生成中..."))
+                self._post_progress("説明文を生成中...")
                 playlist_id = manager.create_playlist_with_details(
                     title=playlist_title,
                     era=era,
@@ -4349,41 +4436,42 @@ https://account.nicovideo.jp/register
                 )
 
             # 動画を追加
-            self.root.after(0, lambda: self._update_progress("動画を追加中..."))
+            self._post_progress("動画を追加中...")
 
             video_ids = [v.video_id for v in selected_videos]
-            success = 0
-            fail = 0
 
-            for i, video_id in enumerate(video_ids):
-                if not self.is_running:
-                    return
-                if manager.add_video_to_playlist(playlist_id, video_id):
-                    success += 1
-                else:
-                    fail += 1
-                msg = f"動画を追加中... {i + 1}/{len(video_ids)}"
-                self.root.after(0, lambda m=msg: self._update_progress(m))
+            def on_add_progress(done: int, total: int):
+                msg = f"動画を追加中... {done}/{total}"
+                self._post_progress(msg)
+
+            success, fail = manager.add_videos_to_playlist(
+                playlist_id,
+                video_ids,
+                on_progress=on_add_progress,
+                should_continue=lambda: self.is_running,
+            )
+            if not self.is_running:
+                return
 
             # 結果を表示
             playlist_url = f"https://www.youtube.com/playlist?list={playlist_id}"
             self.playlist_url = playlist_url
 
-            self.root.after(0, lambda: self._update_progress("完了!"))
-            self.root.after(0, lambda: self._append_result("=" * 50))
-            self.root.after(0, lambda: self._append_result("作成完了!"))
-            self.root.after(0, lambda: self._append_result(f"  再生リスト: {playlist_title}"))
-            self.root.after(0, lambda: self._append_result(f"  追加成功: {success}本"))
+            self._post_progress("完了!")
+            self._post_result("=" * 50)
+            self._post_result("作成完了!")
+            self._post_result(f"  再生リスト: {playlist_title}")
+            self._post_result(f"  追加成功: {success}本")
             if fail > 0:
-                self.root.after(0, lambda: self._append_result(f"  追加失敗: {fail}本"))
-            self.root.after(0, lambda: self._append_result(f"  URL: {playlist_url}"))
-            self.root.after(0, lambda: self._append_result("=" * 50))
+                self._post_result(f"  追加失敗: {fail}本")
+            self._post_result(f"  URL: {playlist_url}")
+            self._post_result("=" * 50)
 
             # URLを設定
-            self.root.after(0, lambda: self.url_var.set(playlist_url))
-            self.root.after(0, lambda: self.copy_btn.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.open_btn.config(state=tk.NORMAL))
-            self.root.after(0, lambda: self.view_videos_btn.config(state=tk.NORMAL))
+            self.ui_queue.post(self.url_var.set, playlist_url)
+            self.ui_queue.post(lambda: self.copy_btn.config(state=tk.NORMAL))
+            self.ui_queue.post(lambda: self.open_btn.config(state=tk.NORMAL))
+            self.ui_queue.post(lambda: self.view_videos_btn.config(state=tk.NORMAL))
 
             # プレイリスト情報を保存（動画確認用）
             self.current_playlist_id = playlist_id
@@ -4398,15 +4486,13 @@ https://account.nicovideo.jp/register
                     video_count=success,
                     conditions=self.current_search_conditions,
                 )
-                # 履歴表示を更新
-                self.root.after(0, self._refresh_history)
 
             # ========================================
             # マルチプラットフォーム検索（ニコニコ動画）
             # ========================================
             if is_multi_platform:
-                self.root.after(0, lambda: self._append_result("\n" + "=" * 50))
-                self.root.after(0, lambda: self._append_result("マルチプラットフォーム検索を開始..."))
+                self._post_result("\n" + "=" * 50)
+                self._post_result("マルチプラットフォーム検索を開始...")
 
                 # 統合プレイリストを作成
                 integrated_title = f"{playlist_title} (統合)"
@@ -4425,8 +4511,8 @@ https://account.nicovideo.jp/register
 
                 # ニコニコ動画検索
                 if "niconico" in selected_platforms:
-                    self.root.after(0, lambda: self._update_progress("ニコニコ動画で検索中..."))
-                    self.root.after(0, lambda: self._append_result("\nニコニコ動画で検索中..."))
+                    self._post_progress("ニコニコ動画で検索中...")
+                    self._post_result("\nニコニコ動画で検索中...")
 
                     nico_videos = []
                     try:
@@ -4439,14 +4525,14 @@ https://account.nicovideo.jp/register
                             nico_videos.append(video)
 
                         if nico_videos:
-                            self.root.after(0, lambda: self._append_result(f"ニコニコ動画: {len(nico_videos)}本の動画が見つかりました"))
+                            self._post_result(f"ニコニコ動画: {len(nico_videos)}本の動画が見つかりました")
                             for video in nico_videos:
                                 item = create_integrated_item_from_niconico(video)
                                 integrated_playlist.add_item(item)
                         else:
-                            self.root.after(0, lambda: self._append_result("ニコニコ動画: 動画が見つかりませんでした"))
+                            self._post_result("ニコニコ動画: 動画が見つかりませんでした")
                     except Exception as e:
-                        self.root.after(0, lambda: self._append_result(f"ニコニコ動画検索エラー: {str(e)}"))
+                        self._post_result(f"ニコニコ動画検索エラー: {str(e)}")
 
                 # 統合プレイリストを保存
                 self.integrated_playlist_manager.update(integrated_playlist)
@@ -4454,26 +4540,26 @@ https://account.nicovideo.jp/register
 
                 # 結果を表示
                 counts = integrated_playlist.get_platform_counts()
-                self.root.after(0, lambda: self._append_result("\n" + "=" * 50))
-                self.root.after(0, lambda: self._append_result("統合プレイリスト作成完了!"))
-                self.root.after(0, lambda: self._append_result(f"  タイトル: {integrated_title}"))
-                self.root.after(0, lambda: self._append_result(f"  合計: {len(integrated_playlist.items)}本"))
+                self._post_result("\n" + "=" * 50)
+                self._post_result("統合プレイリスト作成完了!")
+                self._post_result(f"  タイトル: {integrated_title}")
+                self._post_result(f"  合計: {len(integrated_playlist.items)}本")
                 for platform, cnt in counts.items():
                     platform_names = {"youtube": "YouTube", "niconico": "ニコニコ動画"}
-                    self.root.after(0, lambda p=platform, c=cnt: self._append_result(f"    {platform_names.get(p, p)}: {c}本"))
-                self.root.after(0, lambda: self._append_result("=" * 50))
-                self.root.after(0, lambda: self._append_result("※ ビューワーから動画を再生できます"))
+                    self._post_result(f"    {platform_names.get(platform, platform)}: {cnt}本")
+                self._post_result("=" * 50)
+                self._post_result("※ ビューワーから動画を再生できます")
 
                 # 統合プレイリストリストを更新
-                self.root.after(0, self._refresh_integrated_playlists)
+                self.ui_queue.post(self._refresh_integrated_playlists)
 
         except Exception as e:
             error_msg = str(e)
-            self.root.after(0, lambda: self._update_progress("エラーが発生しました"))
-            self.root.after(0, lambda: self._append_result(f"\nエラー: {error_msg}"))
+            self._post_progress("エラーが発生しました")
+            self._post_result(f"\nエラー: {error_msg}")
 
         finally:
-            self.root.after(0, self._finish_execution)
+            self.ui_queue.post(self._finish_execution)
 
 
 def main():
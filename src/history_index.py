@@ -0,0 +1,348 @@
+"""履歴索引モジュール - 作成日時順の一覧とキーワード検索用の転置索引"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import bisect
+import re
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+
+if TYPE_CHECKING:
+    from history_manager import HistoryEntry
+
+
+# 検索用のトークン（英数字・かな・漢字の連続）
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """文字列を小文字のトークンに分割"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def date_key(entry: "HistoryEntry") -> tuple[str, str]:
+    """作成日時順の並び替えキー（作成日時が同じ場合はIDで並べる）"""
+    return (entry.created_at, entry.id)
+
+
+# 絞り込みに使う項目 -> 履歴から値を取り出す関数（値は小文字で比較する）
+FACETS: dict[str, Callable[["HistoryEntry"], str]] = {
+    "category": lambda entry: entry.conditions.category.lower(),
+    "platform": lambda entry: entry.platform.lower(),
+    "era": lambda entry: entry.conditions.era.lower(),
+    "month": lambda entry: entry.created_at[:7],  # 作成月（YYYY-MM）
+}
+
+
+class HistoryIndex:
+    """履歴の索引
+
+    - 作成日時順の一覧（追加・削除時に二分探索で位置を求めて更新する）
+    - カテゴリ・プラットフォーム・年代・作成月ごとの作成日時順の一覧（FACETS）
+    - タイトル・カテゴリ・キーワードのトークンから履歴IDを引く転置索引
+
+    検索語はトークンの一部に一致すればよい（"rock" で "rocks"、"年代" で "90年代" に一致）。
+    一致するトークンは語彙（重複しないトークン）から探すため、履歴数ではなく語彙の数に比例する。
+    転置索引は起動時間に影響しないよう、最初の検索時に作成する。
+    スレッドセーフではない（HistoryManagerのロック内で使う）。
+    """
+
+    def __init__(self):
+        self._entries: dict[str, "HistoryEntry"] = {}
+        self._by_date: list[tuple[str, str]] = []  # (作成日時, ID) の昇順
+        # 項目 -> 値 -> (作成日時, ID) の昇順
+        self._facets: dict[str, dict[str, list[tuple[str, str]]]] = {name: {} for name in FACETS}
+        # 履歴ID -> 索引に登録したときの (date_key, 各項目の値)
+        # （履歴が直接書き換えられていても、登録時の値で削除できるようにする）
+        self._entry_keys: dict[str, tuple[tuple[str, str], tuple[str, ...]]] = {}
+        self._postings: dict[str, set[str]] = {}  # トークン -> 履歴IDの集合
+        self._entry_tokens: dict[str, set[str]] = {}  # 履歴ID -> トークン（削除用）
+        self._term_cache: dict[str, tuple[str, ...]] = {}  # 検索語 -> 一致するトークン
+        self._tokens_ready = False  # 転置索引を作成済みか
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ========================================
+    # 更新
+    # ========================================
+    def rebuild(self, entries: Iterable["HistoryEntry"]) -> None:
+        """索引を作り直す"""
+        self.clear()
+        self._tokens_ready = False
+        for entry in entries:
+            self._entries[entry.id] = entry
+        for entry in self._entries.values():
+            self._entry_keys[entry.id] = (date_key(entry), _facet_values(entry))
+        self._by_date = sorted(key for key, _ in self._entry_keys.values())
+
+        # 作成日時順にたどって追加すると、値ごとの一覧も昇順になる
+        for key in self._by_date:
+            values = self._entry_keys[key[1]][1]
+            for name, value in zip(FACETS, values):
+                self._facets[name].setdefault(value, []).append(key)
+
+    def add(self, entry: "HistoryEntry") -> None:
+        """履歴を追加（同じIDがあれば置き換える）"""
+        if entry.id in self._entries:
+            self.remove(entry.id)
+        self._entries[entry.id] = entry
+        key = date_key(entry)
+        values = _facet_values(entry)
+        self._entry_keys[entry.id] = (key, values)
+
+        # 新しい履歴はほぼ末尾に入る
+        bisect.insort(self._by_date, key)
+        for name, value in zip(FACETS, values):
+            bisect.insort(self._facets[name].setdefault(value, []), key)
+        if self._tokens_ready:
+            self._index_tokens(entry)
+
+    def remove(self, entry_id: str) -> Optional["HistoryEntry"]:
+        """履歴を削除
+
+        Returns:
+            削除した履歴（ない場合はNone）
+        """
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return None
+
+        key, values = self._entry_keys.pop(entry_id)
+        _remove_sorted(self._by_date, key)
+        for name, value in zip(FACETS, values):
+            keys = self._facets[name].get(value)
+            if keys is not None:
+                _remove_sorted(keys, key)
+                if not keys:
+                    del self._facets[name][value]
+
+        for token in self._entry_tokens.pop(entry_id, ()):
+            ids = self._postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(entry_id)
+            if not ids:
+                del self._postings[token]
+                self._term_cache.clear()
+        return entry
+
+    def clear(self) -> None:
+        """索引を空にする"""
+        self._entries.clear()
+        self._by_date.clear()
+        for values in self._facets.values():
+            values.clear()
+        self._entry_keys.clear()
+        self._postings.clear()
+        self._entry_tokens.clear()
+        self._term_cache.clear()
+        self._tokens_ready = True
+
+    def _ensure_tokens(self) -> None:
+        """転置索引がなければ作成"""
+        if not self._tokens_ready:
+            for entry in self._entries.values():
+                self._index_tokens(entry)
+            self._tokens_ready = True
+
+    def _index_tokens(self, entry: "HistoryEntry") -> None:
+        tokens = set(tokenize(entry.title))
+        tokens.update(tokenize(entry.conditions.category))
+        for keyword in entry.conditions.keywords:
+            tokens.update(tokenize(keyword))
+
+        self._entry_tokens[entry.id] = tokens
+        for token in tokens:
+            ids = self._postings.get(token)
+            if ids is None:
+                self._postings[token] = {entry.id}
+                self._term_cache.clear()
+            else:
+                ids.add(entry.id)
+
+    # ========================================
+    # 参照
+    # ========================================
+    def get(self, entry_id: str) -> Optional["HistoryEntry"]:
+        """IDで履歴を取得"""
+        return self._entries.get(entry_id)
+
+    def newest_first(self) -> list["HistoryEntry"]:
+        """すべての履歴を新しい順に取得"""
+        entries = self._entries
+        return [entries[entry_id] for _, entry_id in reversed(self._by_date)]
+
+    def newest_before(
+        self,
+        before: Optional[tuple[str, str]],
+        limit: int,
+    ) -> list["HistoryEntry"]:
+        """指定した位置より古い履歴を新しい順にlimit件取得（ページ送り用）
+
+        Args:
+            before: date_key() の値（この履歴より古いものを返す、Noneの場合は最新から）
+            limit: 取得する件数
+        """
+        by_date = self._by_date
+        end = len(by_date) if before is None else bisect.bisect_left(by_date, before)
+        start = max(0, end - limit)
+        entries = self._entries
+        return [entries[entry_id] for _, entry_id in reversed(by_date[start:end])]
+
+    def oldest_first(self, count: Optional[int] = None) -> list["HistoryEntry"]:
+        """古い順に履歴を取得
+
+        Args:
+            count: 取得する件数（省略時はすべて）
+        """
+        by_date = self._by_date if count is None else self._by_date[:max(count, 0)]
+        entries = self._entries
+        return [entries[entry_id] for _, entry_id in by_date]
+
+    def filter(self, **criteria: Optional[str]) -> list["HistoryEntry"]:
+        """項目の値で絞り込む（新しい順）
+
+        Args:
+            **criteria: 項目名=値（例: category="rock", platform="youtube"）。Noneの項目は無視する
+
+        Raises:
+            ValueError: FACETSにない項目を指定した場合
+        """
+        selected = []
+        for name, value in criteria.items():
+            if name not in FACETS:
+                raise ValueError(f"不明な絞り込み項目: {name}")
+            if value is None:
+                continue
+            keys = self._facets[name].get(value.lower())
+            if not keys:
+                return []
+            selected.append((name, value.lower(), keys))
+
+        if not selected:
+            return self.newest_first()
+
+        # 最も件数の少ない一覧をたどり、残りの条件は履歴の値で確認する
+        selected.sort(key=lambda item: len(item[2]))
+        _, _, keys = selected[0]
+        entries = self._entries
+        results = [entries[entry_id] for _, entry_id in reversed(keys)]
+        if len(selected) > 1:
+            names = list(FACETS)
+            conditions = [(names.index(name), value) for name, value, _ in selected[1:]]
+            entry_keys = self._entry_keys
+            results = [
+                entry for entry in results
+                if all(entry_keys[entry.id][1][i] == value for i, value in conditions)
+            ]
+        return results
+
+    def facet_counts(self, facet: str, **criteria: Optional[str]) -> dict[str, int]:
+        """項目の値ごとの件数を取得（件数の多い順）
+
+        Args:
+            facet: 集計する項目（FACETSのキー）
+            **criteria: 絞り込み条件（filter() と同じ）
+
+        Raises:
+            ValueError: FACETSにない項目を指定した場合
+        """
+        if facet not in FACETS:
+            raise ValueError(f"不明な絞り込み項目: {facet}")
+
+        if all(value is None for value in criteria.values()):
+            counts = {value: len(keys) for value, keys in self._facets[facet].items()}
+        else:
+            position = list(FACETS).index(facet)
+            counts: dict[str, int] = {}
+            for entry in self.filter(**criteria):
+                value = self._entry_keys[entry.id][1][position]
+                counts[value] = counts.get(value, 0) + 1
+        return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+    def search(self, query: str) -> list["HistoryEntry"]:
+        """キーワードで検索（新しい順）
+
+        空白で区切った検索語がすべて含まれる履歴を返す。
+        記号を含む検索語（"j-pop" など）は、索引で絞り込んだ後に元の文字列で確認する。
+
+        Args:
+            query: 検索語（例: "90年代 rock"）
+        """
+        self._ensure_tokens()
+        matched: Optional[set[str]] = None
+        to_verify: list[str] = []
+        term_ids: list[set[str]] = []
+        for chunk in query.lower().split():
+            tokens = tokenize(chunk)
+            if tokens != [chunk]:
+                to_verify.append(chunk)
+            term_ids.extend(self._match_term(token) for token in tokens)
+
+        # 一致する履歴が少ない検索語から絞り込む
+        for ids in sorted(term_ids, key=len):
+            matched = set(ids) if matched is None else matched & ids
+            if not matched:
+                return []
+
+        if matched is None:
+            results = self.newest_first()
+        else:
+            results = self._sorted_by_date(matched)
+        if to_verify:
+            results = [e for e in results if all(_contains(e, chunk) for chunk in to_verify)]
+        return results
+
+    def _match_term(self, term: str) -> set[str]:
+        """検索語を含むトークンの履歴IDを取得"""
+        tokens = self._term_cache.get(term)
+        if tokens is None:
+            if len(self._term_cache) >= 256:
+                self._term_cache.clear()
+            tokens = tuple(token for token in self._postings if term in token)
+            self._term_cache[term] = tokens
+
+        if len(tokens) == 1:
+            return self._postings[tokens[0]]
+        ids: set[str] = set()
+        for token in tokens:
+            ids.update(self._postings[token])
+        return ids
+
+    def _sorted_by_date(self, ids: set[str]) -> list["HistoryEntry"]:
+        """履歴IDを新しい順に並べる"""
+        entries = self._entries
+        if len(ids) * 8 >= len(self._by_date):
+            # 多い場合は作成日時順の一覧をたどる（並べ替え不要）
+            return [entries[entry_id] for _, entry_id in reversed(self._by_date) if entry_id in ids]
+        results = [entries[entry_id] for entry_id in ids]
+        results.sort(key=date_key, reverse=True)
+        return results
+
+
+def _contains(entry: "HistoryEntry", keyword_lower: str) -> bool:
+    """タイトル・カテゴリ・キーワードのいずれかにkeyword_lowerが含まれるか"""
+    return (keyword_lower in entry.title.lower() or
+            keyword_lower in entry.conditions.category.lower() or
+            any(keyword_lower in kw.lower() for kw in entry.conditions.keywords))
+
+
+def _facet_values(entry: "HistoryEntry") -> tuple[str, ...]:
+    """FACETSの順に項目の値を取得"""
+    return tuple(get_value(entry) for get_value in FACETS.values())
+
+
+def _remove_sorted(keys: list[tuple[str, str]], key: tuple[str, str]) -> None:
+    """昇順のリストからkeyを削除（二分探索）"""
+    i = bisect.bisect_left(keys, key)
+    if i < len(keys) and keys[i] == key:
+        del keys[i]
@@ -13,13 +13,19 @@ if current_dir not in sys.path:
 
 import csv
 import json
+import threading
 import uuid
-from dataclasses import dataclass, asdict, field
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
-from paths import HISTORY_FILE
+from history_index import HistoryIndex
+from json_stream import (
+    JSONStreamError, ProgressCallback, iter_json_items, write_json_document, write_json_lines,
+)
+from paths import HISTORY_FILE, LEGACY_HISTORY_FILE
 
 
 @dataclass
@@ -87,7 +93,12 @@ class HistoryEntry:
             "playlist_id": self.playlist_id,
             "created_at": self.created_at,
             "video_count": self.video_count,
-            "conditions": asdict(self.conditions),
+            # asdict() は値を再帰的にdeepcopyするため遅い（インポート・エクスポートで件数分呼ばれる）
+            # SearchConditionsは入れ子を持たないので、リストだけ複製すれば同じ結果になる
+            "conditions": {
+                name: list(value) if isinstance(value, list) else value
+                for name, value in vars(self.conditions).items()
+            },
             "platform": self.platform,
         }
 
@@ -110,58 +121,304 @@ class HistoryEntry:
         return platform_names.get(self.platform, self.platform)
 
 
+def _entry_from_dict(item: dict) -> HistoryEntry:
+    """辞書から履歴を作成し、索引で使う項目の型を確認する
+
+    Raises:
+        ValueError, TypeError, AttributeError: 形式が正しくない場合
+    """
+    entry = HistoryEntry.from_dict(item)
+    # 索引で使う項目は文字列である必要がある
+    conditions = entry.conditions
+    text_fields = (
+        entry.id, entry.title, entry.created_at, entry.platform,
+        conditions.category, conditions.era,
+    )
+    if not all(isinstance(value, str) for value in text_fields) or \
+            not all(isinstance(keyword, str) for keyword in conditions.keywords):
+        raise TypeError("文字列の項目に文字列以外の値があります")
+    return entry
+
+
+def _iter_entries(items: Iterable[dict]) -> Iterator[HistoryEntry]:
+    """辞書から履歴を1件ずつ作成（形式が正しくない履歴は読み飛ばす）"""
+    for item in items:
+        try:
+            entry = _entry_from_dict(item)
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"履歴読み込みエラー（スキップ）: {e}")
+            continue
+        yield entry
+
+
+@dataclass
+class HistoryEvent:
+    """履歴の変更イベント"""
+    kind: str  # added, deleted, updated, reset（すべて置き換え・全削除）
+    entries: list[HistoryEntry] = field(default_factory=list)  # 対象の履歴（resetの場合は空）
+
+
 class HistoryManager:
-    """履歴の管理クラス"""
+    """履歴の管理クラス
+
+    履歴はJSON Lines形式のジャーナルに保存する（1行が1回の変更）。
+    - 追加・削除はジャーナルの末尾に1行追記するだけで、ファイル全体は書き直さない
+    - 不要になった行（削除済みの履歴など）が増えたら、現在の履歴だけを書き出して
+      一時ファイルから置き換える（コンパクション）
+    - 書き込み途中で終了して最後の行が壊れていても、それ以前の履歴は読み込める
+
+    ジャーナルの行:
+        {"op": "add", "entry": {...}}  履歴の追加
+        {"op": "delete", "id": "..."}  履歴の削除
+        {"op": "clear"}                すべての履歴を削除
+
+    変更は add_listener() で登録した関数に HistoryEvent として通知する。
+    通知は変更の順に、ロックを解放した後で配信する。配信するのはその時点で配信中の
+    スレッド（他のスレッドが配信中でなければ変更したスレッド）のため、リスナーは
+    どのスレッドから呼ばれてもよいように書き、Tkスレッドへの受け渡しなど短い処理のみを行うこと。
+    """
 
     DEFAULT_PATH = HISTORY_FILE
-    MAX_ENTRIES = 100  # 最大履歴数
+    LEGACY_PATH = LEGACY_HISTORY_FILE
+    MAX_ENTRIES = 50_000  # 最大履歴数
+
+    # ジャーナルの行数がこの数以上、かつ履歴数の2倍を超えたらコンパクションする
+    COMPACT_MIN_RECORDS = 1000
 
-    def __init__(self, file_path: Optional[Path] = None):
+    # インポート時にまとめてジャーナルに追記する件数
+    IMPORT_BATCH_SIZE = 1000
+
+    def __init__(self, file_path: Optional[Path] = None, legacy_path: Optional[Path] = None):
+        """
+        Args:
+            file_path: ジャーナルファイルのパス
+            legacy_path: 旧形式（history.json）のパス（ジャーナルがない場合に移行する）
+        """
         self.file_path = file_path or self.DEFAULT_PATH
-        self._history: list[HistoryEntry] = []
+        if legacy_path is not None:
+            self.legacy_path = legacy_path
+        elif file_path is None:
+            self.legacy_path = self.LEGACY_PATH
+        else:
+            self.legacy_path = self.file_path.with_suffix(".json")
+        self._index = HistoryIndex()  # 履歴の本体（作成日時順の一覧と検索用の索引）
+        self._journal_records = 0  # ジャーナルの行数
+        self._lock = threading.RLock()
+        self._listeners: list[Callable[[HistoryEvent], None]] = []
+        # 通知はロックの外で行う（リスナーがUIスレッドの処理を待つ間に
+        # UIスレッドがロックを待つとデッドロックになるため）
+        self._pending_events: deque[HistoryEvent] = deque()
+        self._delivery_lock = threading.Lock()
         self._load()
 
+    # ========================================
+    # 変更の通知
+    # ========================================
+    def add_listener(self, listener: Callable[[HistoryEvent], None]) -> None:
+        """変更の通知を受け取る関数を登録"""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[HistoryEvent], None]) -> None:
+        """登録した関数を解除"""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _emit(self, kind: str, entries: Optional[list[HistoryEntry]] = None) -> None:
+        """変更の通知を登録（ロックを保持した状態で呼び、解放後に_deliver_events()を呼ぶ）"""
+        if kind != "reset" and not entries:
+            return
+        self._pending_events.append(HistoryEvent(kind=kind, entries=list(entries or [])))
+
+    def _deliver_events(self) -> None:
+        """登録された通知をリスナーに渡す（ロックを保持していない状態で呼ぶ）
+
+        通知は登録順に1つのスレッドだけが配信する。他のスレッドが配信中の場合は
+        待たずに戻り、配信中のスレッドがまとめて配信する。
+        """
+        while True:
+            if not self._delivery_lock.acquire(blocking=False):
+                return
+            try:
+                while True:
+                    with self._lock:
+                        if not self._pending_events:
+                            break
+                        event = self._pending_events.popleft()
+                        listeners = list(self._listeners)
+                    for listener in listeners:
+                        try:
+                            listener(event)
+                        except Exception as e:
+                            print(f"履歴通知エラー: {e}")
+            finally:
+                self._delivery_lock.release()
+            # 解放する直前に登録された通知が残っていないか確認する
+            with self._lock:
+                if not self._pending_events:
+                    return
+
+    # ========================================
+    # 読み込み
+    # ========================================
     def _load(self):
-        """ファイルから履歴を読み込む"""
+        """ジャーナルを再生して履歴を読み込む"""
+        if not self.file_path.exists():
+            self._migrate_legacy()
+            return
+
+        entries: dict[str, HistoryEntry] = {}
+        records = 0
+        needs_compaction = False
         try:
-            if self.file_path.exists():
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._history = [
-                        HistoryEntry.from_dict(h) for h in data.get("history", [])
-                    ]
-        except (json.JSONDecodeError, IOError) as e:
+            with open(self.file_path, "rb") as f:
+                data = f.read()
+        except IOError as e:
             print(f"履歴読み込みエラー: {e}")
-            self._history = []
-
-    def _save(self):
-        """履歴をファイルに保存"""
+            return
+
+        # 最後の行が改行で終わっていない場合は書き込み途中で終了している
+        # （そのまま追記すると次の行とつながるため、書き直す）
+        if data and not data.endswith(b"\n"):
+            needs_compaction = True
+
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                op = record.get("op")
+                if op == "add":
+                    entry = _entry_from_dict(record["entry"])
+                    entries.pop(entry.id, None)
+                    entries[entry.id] = entry
+                elif op == "delete":
+                    entries.pop(record.get("id"), None)
+                elif op == "clear":
+                    entries.clear()
+                else:
+                    raise ValueError(f"不明な操作: {op}")
+                records += 1
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                print(f"履歴読み込みエラー（壊れた行をスキップ）: {e}")
+                needs_compaction = True
+
+        self._index.rebuild(entries.values())
+        self._journal_records = records
+
+        # 最大数を減らした場合などは、削除した履歴がジャーナルに残らないよう書き直す
+        if self._trim() or needs_compaction:
+            self._compact()
+        else:
+            self._maybe_compact()
+
+    def _migrate_legacy(self):
+        """旧形式（{"history": [...]}）のファイルをジャーナルに移行"""
+        if not self.legacy_path or not self.legacy_path.exists():
+            return
         try:
-            self.file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    {"history": [h.to_dict() for h in self._history]},
-                    f,
-                    ensure_ascii=False,
-                    indent=2,
-                )
-        except IOError as e:
-            print(f"履歴保存エラー: {e}")
+            self._index.rebuild(_iter_entries(iter_json_items(self.legacy_path, "history")))
+        except (JSONStreamError, OSError) as e:
+            print(f"履歴読み込みエラー: {e}")
+            self._index.clear()
+            return
+        # 旧形式のファイルは残す（古いバージョンに戻した場合に使える）
+        self._compact()
+
+    # ========================================
+    # 書き込み
+    # ========================================
+    def _append(self, records: list[dict]):
+        """ジャーナルに行を追記"""
+        if not records:
+            return
+        lines = "".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in records
+        )
+        with self._lock:
+            try:
+                self.file_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.file_path, "a", encoding="utf-8", newline="\n") as f:
+                    f.write(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._journal_records += len(records)
+            except OSError as e:
+                print(f"履歴保存エラー: {e}")
+                return
+            self._maybe_compact()
+
+    def _maybe_compact(self):
+        """不要な行が増えていればコンパクションする"""
+        if (self._journal_records >= self.COMPACT_MIN_RECORDS and
+                self._journal_records > len(self._index) * 2):
+            self._compact()
+
+    def _compact(self):
+        """現在の履歴だけをジャーナルに書き出す（一時ファイルから置き換える）"""
+        with self._lock:
+            tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+            try:
+                self.file_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+                    for entry in self._index.oldest_first():
+                        record = {"op": "add", "entry": entry.to_dict()}
+                        f.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+                        f.write("\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.file_path)
+                self._journal_records = len(self._index)
+            except OSError as e:
+                print(f"履歴保存エラー: {e}")
+
+    def compact(self):
+        """ジャーナルをコンパクションする"""
+        self._compact()
+
+    def _trim(self) -> list[HistoryEntry]:
+        """最大数を超えた古い履歴をメモリから削除
+
+        Returns:
+            削除した履歴
+        """
+        return self._trim_index(self._index)
+
+    def _trim_index(self, index: HistoryIndex) -> list[HistoryEntry]:
+        """索引から最大数を超えた古い履歴を削除"""
+        excess = len(index) - self.MAX_ENTRIES
+        if excess <= 0:
+            return []
+        removed = index.oldest_first(excess)
+        for entry in removed:
+            index.remove(entry.id)
+        return removed
 
     def get_all(self) -> list[HistoryEntry]:
         """すべての履歴を取得（新しい順）"""
-        return sorted(
-            self._history,
-            key=lambda h: h.created_at,
-            reverse=True,
-        )
+        with self._lock:
+            return self._index.newest_first()
 
     def get_by_id(self, entry_id: str) -> Optional[HistoryEntry]:
         """IDで履歴を取得"""
-        for entry in self._history:
-            if entry.id == entry_id:
-                return entry
-        return None
+        with self._lock:
+            return self._index.get(entry_id)
+
+    def get_page(
+        self,
+        before: Optional[tuple[str, str]] = None,
+        limit: int = 100,
+    ) -> list[HistoryEntry]:
+        """履歴を新しい順にページ単位で取得
+
+        Args:
+            before: 前のページの最後の履歴の date_key()（Noneの場合は最新から）
+            limit: 1ページの件数
+        """
+        with self._lock:
+            return self._index.newest_before(before, limit)
 
     def add(
         self,
@@ -183,109 +440,254 @@ class HistoryManager:
             conditions=conditions,
             platform=platform,
         )
-        self._history.append(entry)
+        with self._lock:
+            self._index.add(entry)
+            records = [{"op": "add", "entry": entry.to_dict()}]
+
+            # 最大数を超えた場合、古いものを削除
+            removed = self._trim()
+            for old_entry in removed:
+                records.append({"op": "delete", "id": old_entry.id})
+
+            self._append(records)
+            self._emit("added", [entry])
+            self._emit("deleted", removed)
+        self._deliver_events()
+        return entry
 
-        # 最大数を超えた場合、古いものを削除
-        if len(self._history) > self.MAX_ENTRIES:
-            self._history = sorted(
-                self._history,
-                key=lambda h: h.created_at,
-                reverse=True,
-            )[:self.MAX_ENTRIES]
+    def update(self, entry: HistoryEntry) -> bool:
+        """既存の履歴を変更（タイトルの編集など）
 
-        self._save()
-        return entry
+        Returns:
+            履歴が存在した場合True
+        """
+        with self._lock:
+            if self._index.get(entry.id) is None:
+                return False
+            self._index.add(entry)
+            # 同じIDの "add" は置き換えとして再生される
+            self._append([{"op": "add", "entry": entry.to_dict()}])
+            self._emit("updated", [entry])
+        self._deliver_events()
+        return True
 
     def delete(self, entry_id: str) -> bool:
         """履歴を削除"""
-        for i, entry in enumerate(self._history):
-            if entry.id == entry_id:
-                del self._history[i]
-                self._save()
-                return True
-        return False
+        with self._lock:
+            entry = self._index.remove(entry_id)
+            if entry is None:
+                return False
+            self._append([{"op": "delete", "id": entry_id}])
+            self._emit("deleted", [entry])
+        self._deliver_events()
+        return True
 
     def clear_all(self) -> int:
         """すべての履歴を削除"""
-        count = len(self._history)
-        self._history = []
-        self._save()
+        with self._lock:
+            count = len(self._index)
+            self._index.clear()
+            self._append([{"op": "clear"}])
+            self._emit("reset")
+        self._deliver_events()
         return count
 
+    def replace_all(self, entries: list[HistoryEntry]) -> None:
+        """すべての履歴を置き換える（バックアップからの復元など）"""
+        with self._lock:
+            self._index.rebuild(entries)
+            self._trim()
+            self._compact()
+            self._emit("reset")
+        self._deliver_events()
+
     def search(self, keyword: str) -> list[HistoryEntry]:
-        """キーワードで履歴を検索"""
-        keyword_lower = keyword.lower()
-        results = []
-        for entry in self._history:
-            if (keyword_lower in entry.title.lower() or
-                keyword_lower in entry.conditions.category.lower() or
-                any(keyword_lower in kw.lower() for kw in entry.conditions.keywords)):
-                results.append(entry)
-        return sorted(results, key=lambda h: h.created_at, reverse=True)
-
-    def export_to_file(self, file_path: Path) -> bool:
-        """履歴を別ファイルにエクスポート"""
+        """キーワードで履歴を検索（新しい順）
+
+        タイトル・カテゴリ・キーワードを対象に、空白で区切った検索語が
+        すべて含まれる履歴を返す（各語は単語の一部に一致すればよい）。
+        """
+        with self._lock:
+            return self._index.search(keyword)
+
+    def export_to_file(
+        self,
+        file_path: Path,
+        progress: Optional[ProgressCallback] = None,
+    ) -> bool:
+        """履歴を別ファイルにエクスポート
+
+        拡張子が .jsonl の場合はJSON Lines（1行に1件）、それ以外は旧形式
+        （{"history": [...]}）で、1件ずつ書き出す。
+
+        Args:
+            file_path: エクスポート先のファイルパス
+            progress: 進捗の通知（書き出した件数, 全件数）
+        """
+        with self._lock:
+            entries = self._index.oldest_first()
+        items = (h.to_dict() for h in entries)
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    {"history": [h.to_dict() for h in self._history]},
-                    f,
-                    ensure_ascii=False,
-                    indent=2,
-                )
+            if Path(file_path).suffix.lower() == ".jsonl":
+                write_json_lines(file_path, items, len(entries), progress)
+            else:
+                write_json_document(file_path, "history", items, len(entries), progress)
             return True
-        except IOError as e:
+        except OSError as e:
             print(f"エクスポートエラー: {e}")
             return False
 
-    def import_from_file(self, file_path: Path, merge: bool = True) -> int:
+    def import_from_file(
+        self,
+        file_path: Path,
+        merge: bool = True,
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
         """別ファイルから履歴をインポート
 
+        JSON Lines・旧形式（{"history": [...]}）のどちらも読み込める。
+        ファイルは1件ずつ読み込み、IMPORT_BATCH_SIZE件ごとにジャーナルへ追記する
+        （ファイル全体をメモリに読み込まず、ロックも長時間保持しない）。
+        merge=Trueで途中に形式のエラーがあった場合、それまでの履歴はインポートされる。
+        merge=Falseの場合は最後まで読み込めたときだけ置き換える（エラー時は既存の履歴を残す）。
+
         Args:
             file_path: インポート元のファイルパス
             merge: Trueの場合は既存に追加、Falseの場合は置換
+            progress: 進捗の通知（読み込んだバイト数, ファイルサイズ）
 
         Returns:
             インポートした履歴数
         """
+        items = iter_json_items(file_path, "history", progress=progress)
+
+        if not merge:
+            return self._replace_from(items)
+
+        count = 0
+        batch: list[HistoryEntry] = []
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                imported = [HistoryEntry.from_dict(h) for h in data.get("history", [])]
-
-            if merge:
-                # 既存のIDと重複しないよう新しいIDを付与
-                existing_ids = {h.id for h in self._history}
-                for entry in imported:
-                    if entry.id in existing_ids:
-                        entry.id = str(uuid.uuid4())
-                    self._history.append(entry)
-            else:
-                self._history = imported
+            for entry in _iter_entries(items):
+                batch.append(entry)
+                if len(batch) >= self.IMPORT_BATCH_SIZE:
+                    count += self._merge_batch(batch)
+                    batch = []
+        except (JSONStreamError, OSError) as e:
+            print(f"インポートエラー: {e}")
+        if batch:
+            count += self._merge_batch(batch)
+        return count
+
+    def _replace_from(self, items: Iterable[dict]) -> int:
+        """読み込んだ履歴ですべての履歴を置き換える
 
-            self._save()
-            return len(imported)
-        except (json.JSONDecodeError, IOError) as e:
+        新しい索引はロックの外で作り、最大数を超えた古い履歴は読み込みながら
+        削除する（メモリに置くのは最大 MAX_ENTRIES + IMPORT_BATCH_SIZE 件）。
+
+        Returns:
+            読み込んだ履歴数
+        """
+        replacement = HistoryIndex()
+        count = 0
+        try:
+            for entry in _iter_entries(items):
+                replacement.add(entry)
+                count += 1
+                if len(replacement) >= self.MAX_ENTRIES + self.IMPORT_BATCH_SIZE:
+                    self._trim_index(replacement)
+        except (JSONStreamError, OSError) as e:
             print(f"インポートエラー: {e}")
             return 0
+        self._trim_index(replacement)
+
+        with self._lock:
+            self._index = replacement
+            self._compact()
+            self._emit("reset")
+        self._deliver_events()
+        return count
+
+    def _merge_batch(self, imported: list[HistoryEntry]) -> int:
+        """インポートした履歴を既存の履歴に追加
+
+        Returns:
+            追加した履歴数
+        """
+        with self._lock:
+            # 既存のIDと重複しないよう新しいIDを付与
+            records = []
+            for entry in imported:
+                if self._index.get(entry.id) is not None:
+                    entry.id = str(uuid.uuid4())
+                self._index.add(entry)
+                records.append({"op": "add", "entry": entry.to_dict()})
+            removed = self._trim()
+            for old_entry in removed:
+                records.append({"op": "delete", "id": old_entry.id})
+            self._append(records)
+            # 最大数を超えてすぐに削除された履歴は通知しない
+            removed_ids = {h.id for h in removed}
+            imported_ids = {h.id for h in imported}
+            self._emit("added", [h for h in imported if h.id not in removed_ids])
+            self._emit("deleted", [h for h in removed if h.id not in imported_ids])
+        self._deliver_events()
+        return len(imported)
 
     def get_recent(self, count: int = 10) -> list[HistoryEntry]:
         """最近の履歴を取得"""
         return self.get_all()[:count]
 
     def get_by_category(self, category: str) -> list[HistoryEntry]:
-        """カテゴリで履歴をフィルタ"""
-        return [
-            h for h in self.get_all()
-            if h.conditions.category.lower() == category.lower()
-        ]
+        """カテゴリで履歴をフィルタ（新しい順）"""
+        return self.filter(category=category)
 
     def get_by_platform(self, platform: str) -> list[HistoryEntry]:
-        """プラットフォームで履歴をフィルタ"""
-        return [
-            h for h in self.get_all()
-            if h.platform.lower() == platform.lower()
-        ]
+        """プラットフォームで履歴をフィルタ（新しい順）"""
+        return self.filter(platform=platform)
+
+    def get_by_era(self, era: str) -> list[HistoryEntry]:
+        """年代で履歴をフィルタ（新しい順）"""
+        return self.filter(era=era)
+
+    def filter(
+        self,
+        category: Optional[str] = None,
+        platform: Optional[str] = None,
+        era: Optional[str] = None,
+        month: Optional[str] = None,
+    ) -> list[HistoryEntry]:
+        """条件を組み合わせて履歴をフィルタ（新しい順、大文字・小文字は区別しない）
+
+        Args:
+            category: カテゴリ
+            platform: プラットフォーム
+            era: 年代
+            month: 作成月（"2024-01" 形式）
+        """
+        with self._lock:
+            return self._index.filter(category=category, platform=platform, era=era, month=month)
+
+    def get_facet_counts(
+        self,
+        facet: str,
+        category: Optional[str] = None,
+        platform: Optional[str] = None,
+        era: Optional[str] = None,
+        month: Optional[str] = None,
+    ) -> dict[str, int]:
+        """項目の値ごとの履歴数を取得（件数の多い順、値は小文字）
+
+        Args:
+            facet: 集計する項目（"category", "platform", "era", "month"）
+            category, platform, era, month: 絞り込み条件（filter() と同じ）
+
+        Returns:
+            値 -> 履歴数（例: {"rock": 120, "pop": 80}）
+        """
+        with self._lock:
+            return self._index.facet_counts(
+                facet, category=category, platform=platform, era=era, month=month
+            )
 
     def export_to_csv(self, file_path: Path) -> bool:
         """履歴をCSV形式でエクスポート
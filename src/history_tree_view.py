@@ -0,0 +1,182 @@
+"""履歴一覧モジュール - 履歴の変更を差分でTreeviewに反映し、古い履歴はスクロールに応じて読み込む"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import bisect
+import threading
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable
+
+from history_index import date_key
+from history_manager import HistoryEntry, HistoryEvent, HistoryManager
+
+
+class HistoryTreeView:
+    """履歴のTreeviewを管理するクラス
+
+    - 最初は新しい順にpage_size件だけ表示し、末尾までスクロールしたら次のページを読み込む
+    - 追加・削除・変更はHistoryManagerの通知を受けて該当の行だけを更新する
+      （全行を削除して作り直さない）
+    - 全削除・置き換えの場合のみ最初のページから読み込み直す
+
+    HistoryManagerの通知はワーカースレッドから届くため、dispatch（例: UIUpdateQueue.post）で
+    Tkスレッドに渡してから反映する。Tkスレッドで届いた通知はその場で反映する
+    （キューの空きを待つとTkスレッド自身がキューを処理できず固まるため）。
+    そのためキューに残っている古い通知が後から届くことがあり、反映時は
+    HistoryManagerの現在の内容を正とする。
+    """
+
+    def __init__(
+        self,
+        tree: ttk.Treeview,
+        scrollbar: ttk.Scrollbar,
+        manager: HistoryManager,
+        dispatch: Callable[..., None],
+        page_size: int = 100,
+    ):
+        """
+        Args:
+            tree: 表示先のTreeview（columnsは date, title, videos, platform, category, era）
+            scrollbar: Treeviewの縦スクロールバー
+            manager: 履歴マネージャー
+            dispatch: dispatch(func, *args) でfuncをTkスレッドで実行する関数
+            page_size: 1回に読み込む件数
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.manager = manager
+        self.page_size = page_size
+        self._dispatch = dispatch
+
+        self._keys: list[tuple[str, str]] = []  # 表示中の行の date_key()（昇順）
+        self._has_more = False  # まだ読み込んでいない古い履歴があるか
+
+        self.tree.configure(yscrollcommand=self._on_yscroll)
+        manager.add_listener(self._on_history_event)
+
+    # ========================================
+    # 読み込み
+    # ========================================
+    def reload(self) -> None:
+        """表示をクリアして最初のページから読み込み直す"""
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._keys = []
+        self._has_more = True
+        self.load_more()
+
+    def load_more(self) -> int:
+        """次のページ（表示中の最も古い履歴より古いもの）を読み込む
+
+        Returns:
+            追加した行数
+        """
+        if not self._has_more:
+            return 0
+        before = self._keys[0] if self._keys else None
+        entries = self.manager.get_page(before=before, limit=self.page_size)
+        self._has_more = len(entries) >= self.page_size
+        # 通知の反映より先にページとして読み込んだ行は重複させない
+        entries = [entry for entry in entries if not self.tree.exists(entry.id)]
+
+        # entriesは新しい順のため、逆順にすると昇順の先頭に付け足せる
+        # （行の追加中にスクロール通知が来ても同じページを読み込まないよう、先に更新する）
+        self._keys[:0] = [date_key(entry) for entry in reversed(entries)]
+        for entry in entries:
+            self._insert_row(tk.END, entry)
+        return len(entries)
+
+    def _on_yscroll(self, first, last) -> None:
+        self.scrollbar.set(first, last)
+        # 末尾付近まで表示したら次のページを読み込む
+        if self._has_more and float(last) >= 0.9:
+            self.load_more()
+
+    # ========================================
+    # 変更の反映
+    # ========================================
+    def _on_history_event(self, event: HistoryEvent) -> None:
+        """HistoryManagerからの通知（通知を配信するスレッドで呼ばれる）"""
+        if threading.current_thread() is threading.main_thread():
+            self.apply_event(event)
+        else:
+            self._dispatch(self.apply_event, event)
+
+    def apply_event(self, event: HistoryEvent) -> None:
+        """変更を表示に反映（Tkスレッド）"""
+        if event.kind == "reset" or len(event.entries) > self.page_size:
+            # 大量のインポートなどは差分より読み込み直す方が速い
+            self.reload()
+        elif event.kind == "added":
+            for entry in event.entries:
+                self._add_entry(entry)
+        elif event.kind == "deleted":
+            for entry in event.entries:
+                self._remove_entry(entry)
+        elif event.kind == "updated":
+            for entry in event.entries:
+                current = self.manager.get_by_id(entry.id)
+                if current is not None and self.tree.exists(entry.id):
+                    self.tree.item(entry.id, values=self._row_values(current))
+
+    def _add_entry(self, entry: HistoryEntry) -> None:
+        # 通知より後の削除・全削除がすでに反映されていれば表示しない
+        entry = self.manager.get_by_id(entry.id)
+        if entry is None:
+            return
+        if self.tree.exists(entry.id):
+            self.tree.item(entry.id, values=self._row_values(entry))
+            return
+
+        key = date_key(entry)
+        # 未読み込みの範囲に入る履歴は、スクロールして読み込むときに表示される
+        if self._has_more and self._keys and key < self._keys[0]:
+            return
+
+        position = bisect.bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        # Treeviewは新しい順のため、自分より新しい行の数が挿入位置になる
+        self._insert_row(len(self._keys) - 1 - position, entry)
+
+    def _remove_entry(self, entry: HistoryEntry) -> None:
+        if not self.tree.exists(entry.id):
+            return
+        self.tree.delete(entry.id)
+
+        key = date_key(entry)
+        position = bisect.bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def _insert_row(self, index, entry: HistoryEntry) -> None:
+        self.tree.insert("", index, iid=entry.id, values=self._row_values(entry))
+
+    @staticmethod
+    def _row_values(entry: HistoryEntry) -> tuple:
+        return (
+            entry.get_formatted_date(),
+            entry.title,
+            entry.video_count,
+            entry.get_platform_display(),
+            entry.conditions.category,
+            entry.conditions.era,
+        )
+
+    def close(self) -> None:
+        """通知の受け取りを解除"""
+        self.manager.remove_listener(self._on_history_event)
+
+    def __len__(self) -> int:
+        """表示中の行数"""
+        return len(self._keys)
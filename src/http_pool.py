@@ -0,0 +1,324 @@
+"""HTTP接続プールモジュール - keep-alive接続を使い回すHTTPクライアント"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import gzip
+import http.client
+import io
+import json
+import threading
+import time
+import urllib.error
+import urllib.parse
+import zlib
+from dataclasses import dataclass
+from email.message import Message
+from typing import Any, Optional
+
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# リダイレクトとして扱うステータス
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+@dataclass
+class HTTPResponse:
+    """HTTPレスポンス（本文は読み込み・展開済み）"""
+    status: int
+    headers: Message
+    body: bytes
+    url: str
+
+    def text(self, encoding: str = "utf-8") -> str:
+        """本文を文字列として取得"""
+        return self.body.decode(encoding)
+
+    def json(self) -> Any:
+        """本文をJSONとして解析"""
+        return json.loads(self.body.decode("utf-8"))
+
+
+class _HostPool:
+    """1ホスト分の接続（未使用の接続と同時接続数の上限）"""
+
+    def __init__(self, max_connections: int):
+        self.idle: list[tuple[http.client.HTTPConnection, float]] = []  # (接続, 最後に使った時刻)
+        self.slots = threading.BoundedSemaphore(max_connections)
+
+
+class PooledHTTPTransport:
+    """keep-alive接続をホストごとにプールするHTTPクライアント
+
+    - 同じホストへのリクエストは未使用の接続を再利用する（TCP/TLSの接続を省略）
+    - ホストごとの同時接続数に上限を設ける（上限に達した場合は空くまで待機）
+    - gzip/deflateで圧縮されたレスポンスを展開する
+    - 400以上のステータスは urllib.error.HTTPError を送出する
+      （urllib.request.urlopen と同じ扱いになり、RetryPolicyでそのまま判定できる）
+
+    スレッドセーフで、複数のクライアント・ワーカースレッドから共有できる。
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 4,
+        timeout: float = 30.0,
+        idle_timeout: float = 30.0,
+        user_agent: str = DEFAULT_USER_AGENT,
+        max_redirects: int = 5,
+    ):
+        """
+        Args:
+            max_connections_per_host: ホストごとの同時接続数の上限
+            timeout: 接続・読み込みのタイムアウト（秒、リクエストごとに指定も可）
+            idle_timeout: 未使用の接続を保持する時間（秒、サーバー側で切断される前に破棄）
+            user_agent: 既定のUser-Agent
+            max_redirects: リダイレクトをたどる最大回数
+        """
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.user_agent = user_agent
+        self.max_redirects = max_redirects
+        self._pools: dict[tuple[str, str, int], _HostPool] = {}
+        self._lock = threading.Lock()
+
+        # 統計カウンター
+        self.requests = 0
+        self.connections_created = 0
+        self.connections_reused = 0
+
+    # ========================================
+    # リクエスト
+    # ========================================
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> HTTPResponse:
+        """GETリクエストを実行"""
+        if params:
+            separator = "&" if "?" in url else "?"
+            url = f"{url}{separator}{urllib.parse.urlencode(params)}"
+        return self.request("GET", url, headers=headers, timeout=timeout)
+
+    def get_json(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """GETリクエストを実行してJSONを返す"""
+        return self.get(url, params=params, headers=headers, timeout=timeout).json()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[float] = None,
+    ) -> HTTPResponse:
+        """リクエストを実行（リダイレクトはたどる）
+
+        Raises:
+            urllib.error.HTTPError: ステータスが400以上の場合
+            urllib.error.URLError: 接続・プロトコルのエラー
+            socket.timeout: タイムアウト
+        """
+        request_headers = {
+            "User-Agent": self.user_agent,
+            "Accept-Encoding": "gzip, deflate",
+        }
+        request_headers.update(headers or {})
+
+        for _ in range(self.max_redirects + 1):
+            response = self._send(method, url, request_headers, body, timeout or self.timeout)
+            location = response.headers.get("Location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                break
+            url = urllib.parse.urljoin(url, location)
+            if response.status == 303 or (response.status in (301, 302) and method == "POST"):
+                method, body = "GET", None
+
+        if response.status >= 400:
+            raise urllib.error.HTTPError(
+                response.url, response.status, _reason(response.status),
+                response.headers, io.BytesIO(response.body),
+            )
+        return response
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        body: Optional[bytes],
+        timeout: float,
+    ) -> HTTPResponse:
+        """1回分のリクエストを送信"""
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise urllib.error.URLError(f"unsupported URL: {url}")
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        pool = self._get_pool(key)
+        with self._lock:
+            self.requests += 1
+
+        pool.slots.acquire()
+        try:
+            # 再利用した接続がサーバー側で切断されていた場合は新しい接続で1回だけやり直す
+            for attempt in range(2):
+                conn, reused = self._checkout(key, pool, timeout)
+                try:
+                    conn.request(method, path, body=body, headers=headers)
+                    raw = conn.getresponse()
+                    data = raw.read()
+                except (ConnectionError, http.client.HTTPException) as e:
+                    conn.close()
+                    if reused and attempt == 0 and not isinstance(e, http.client.IncompleteRead):
+                        continue
+                    if isinstance(e, ConnectionError):
+                        raise
+                    raise urllib.error.URLError(e) from e
+                except OSError as e:
+                    conn.close()
+                    # urlopenと同様にタイムアウト以外はURLErrorにする
+                    if isinstance(e, TimeoutError):
+                        raise
+                    raise urllib.error.URLError(e) from e
+                except BaseException:
+                    conn.close()
+                    raise
+
+                if raw.will_close:
+                    conn.close()
+                else:
+                    self._checkin(pool, conn)
+                break
+        finally:
+            pool.slots.release()
+
+        return HTTPResponse(
+            status=raw.status,
+            headers=raw.headers,
+            body=_decode_body(data, raw.headers.get("Content-Encoding")),
+            url=url,
+        )
+
+    # ========================================
+    # 接続の管理
+    # ========================================
+    def _get_pool(self, key: tuple[str, str, int]) -> _HostPool:
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = _HostPool(self.max_connections_per_host)
+            return pool
+
+    def _checkout(
+        self,
+        key: tuple[str, str, int],
+        pool: _HostPool,
+        timeout: float,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        """未使用の接続を取り出す（ない場合は作成）
+
+        Returns:
+            (接続, 再利用した接続かどうか)
+        """
+        now = time.monotonic()
+        with self._lock:
+            while pool.idle:
+                conn, last_used = pool.idle.pop()
+                if now - last_used <= self.idle_timeout:
+                    self.connections_reused += 1
+                    conn.timeout = timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+            self.connections_created += 1
+
+        scheme, host, port = key
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        return conn, False
+
+    def _checkin(self, pool: _HostPool, conn: http.client.HTTPConnection) -> None:
+        """接続をプールに戻す"""
+        with self._lock:
+            pool.idle.append((conn, time.monotonic()))
+
+    def close(self) -> None:
+        """未使用の接続をすべて閉じる"""
+        with self._lock:
+            connections = [conn for pool in self._pools.values() for conn, _ in pool.idle]
+            for pool in self._pools.values():
+                pool.idle.clear()
+        for conn in connections:
+            conn.close()
+
+    def get_stats(self) -> dict[str, int]:
+        """リクエスト数と接続の作成・再利用数を取得"""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "connections_created": self.connections_created,
+                "connections_reused": self.connections_reused,
+                "idle_connections": sum(len(pool.idle) for pool in self._pools.values()),
+            }
+
+
+def _decode_body(data: bytes, content_encoding: Optional[str]) -> bytes:
+    """gzip/deflateで圧縮された本文を展開"""
+    encoding = (content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(data)
+        except zlib.error:
+            # zlibヘッダーなしのdeflate
+            return zlib.decompress(data, -zlib.MAX_WBITS)
+    return data
+
+
+def _reason(status: int) -> str:
+    try:
+        return http.client.responses[status]
+    except KeyError:
+        return "Unknown"
+
+
+# グローバルインスタンス
+_http_transport: Optional[PooledHTTPTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_http_transport() -> PooledHTTPTransport:
+    """PooledHTTPTransportのシングルトンインスタンスを取得"""
+    global _http_transport
+    with _transport_lock:
+        if _http_transport is None:
+            _http_transport = PooledHTTPTransport()
+        return _http_transport
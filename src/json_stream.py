@@ -0,0 +1,287 @@
+"""JSONストリーミングモジュール - 大きなJSON/JSON Linesファイルを1件ずつ読み書きする"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import codecs
+import json
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+
+# 進捗の通知（処理済みのバイト数・件数, 全体のバイト数・件数）
+ProgressCallback = Callable[[int, int], None]
+
+_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\r\n"
+_decoder = json.JSONDecoder()
+
+
+class JSONStreamError(ValueError):
+    """ファイルの形式が正しくない場合のエラー"""
+
+
+class _ChunkReader:
+    """ファイルを少しずつ読み込み、JSONの値を1つずつ取り出す"""
+
+    def __init__(self, f, total_bytes: int, progress: Optional[ProgressCallback]):
+        self._file = f
+        # BOM付きのUTF-8も読めるようにする
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._bytes_read = 0
+        self._total_bytes = total_bytes
+        self._progress = progress
+
+    def _fill(self, size: int = _CHUNK_SIZE) -> bool:
+        """バッファに読み足す（ファイルの終わりの場合はFalse）"""
+        if self._eof:
+            return False
+        data = self._file.read(size)
+        self._bytes_read += len(data)
+        try:
+            if not data:
+                self._eof = True
+                self._buffer = self._buffer[self._pos:] + self._decoder.decode(b"", final=True)
+            else:
+                # 読み終えた部分は捨てる（メモリ使用量をチャンク数個分に抑える）
+                self._buffer = self._buffer[self._pos:] + self._decoder.decode(data)
+        except UnicodeDecodeError as e:
+            raise JSONStreamError(f"UTF-8として読み込めません: {e}") from e
+        self._pos = 0
+        if self._progress is not None:
+            self._progress(self._bytes_read, self._total_bytes)
+        return bool(data)
+
+    def peek(self) -> str:
+        """空白を読み飛ばして次の文字を返す（ファイルの終わりの場合は空文字）"""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            length = len(buffer)
+            while pos < length and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < length:
+                return buffer[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """次の文字がcharであることを確認して読み進める"""
+        found = self.peek()
+        if found != char:
+            raise JSONStreamError(f"'{char}' が必要ですが '{found or 'EOF'}' でした")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """次のJSONの値を1つ読み込む"""
+        self.peek()
+        read_size = _CHUNK_SIZE
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                # 値の途中でバッファが終わっている場合は読み足して再試行する
+                # （大きな値でも再試行の回数が増えすぎないよう、読み込む量を倍にしていく）
+                if not self._fill(read_size):
+                    raise JSONStreamError(f"JSONの解析に失敗しました: {e}") from e
+                read_size *= 2
+                continue
+
+            # 数値などはバッファの終わりで途切れている可能性がある
+            if end == len(self._buffer) and not self._eof and not isinstance(value, (dict, list, str)):
+                if self._fill(read_size):
+                    continue
+            self._pos = end
+            return value
+
+
+def iter_json_items(
+    file_path: Path,
+    key: str,
+    required_field: str = "id",
+    progress: Optional[ProgressCallback] = None,
+) -> Iterator[dict]:
+    """JSONファイルから項目を1件ずつ読み込む
+
+    次の形式に対応する（形式は内容から判定する）:
+        JSON Lines: 1行に1件のオブジェクト
+        旧形式: {"<key>": [...], ...}（インデントの有無は問わない）
+        配列: [...]
+
+    ファイル全体は読み込まず、チャンク単位で解析する。
+
+    Args:
+        file_path: 読み込むファイル
+        key: 旧形式で項目の配列が入っているキー（例: "history"）
+        required_field: JSON Linesの各行に必要なキー（これがない行は項目として扱わない）
+        progress: 進捗の通知（読み込んだバイト数, ファイルサイズ）
+
+    Raises:
+        OSError: ファイルを読み込めない場合
+        JSONStreamError: 形式が正しくない場合
+    """
+    total_bytes = os.path.getsize(file_path)
+    with open(file_path, "rb") as f:
+        reader = _ChunkReader(f, total_bytes, progress)
+        first = reader.peek()
+        if first == "":
+            return
+        if first == "[":
+            yield from _iter_array(reader)
+            return
+        if first != "{":
+            raise JSONStreamError(f"JSONオブジェクトまたは配列が必要です: '{first}'")
+
+        # 最初のオブジェクトのキーを1つずつ確認する
+        # keyの配列があれば旧形式、なければJSON Linesの1行目とみなす
+        reader.expect("{")
+        record = {}
+        if reader.peek() == "}":
+            reader.expect("}")
+        else:
+            while True:
+                name = reader.value()
+                if not isinstance(name, str):
+                    raise JSONStreamError("オブジェクトのキーが文字列ではありません")
+                reader.expect(":")
+                if name == key and reader.peek() == "[":
+                    yield from _iter_array(reader)
+                    return
+                record[name] = reader.value()
+                separator = reader.peek()
+                if separator == ",":
+                    reader.expect(",")
+                    continue
+                reader.expect("}")
+                break
+
+        # JSON Lines（改行以外の空白で区切られていても読める）
+        while True:
+            if isinstance(record, dict) and required_field in record:
+                yield record
+            if reader.peek() == "":
+                return
+            record = reader.value()
+
+
+def _iter_array(reader: _ChunkReader) -> Iterator[dict]:
+    """配列の要素を1つずつ読み込む（readerは "[" の位置）"""
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.expect("]")
+        return
+    while True:
+        item = reader.value()
+        if isinstance(item, dict):
+            yield item
+        separator = reader.peek()
+        if separator == ",":
+            reader.expect(",")
+            continue
+        reader.expect("]")
+        return
+
+
+def write_json_lines(
+    file_path: Path,
+    items: Iterable[dict],
+    total: int = 0,
+    progress: Optional[ProgressCallback] = None,
+) -> int:
+    """項目をJSON Lines形式で書き出す（一時ファイルに書き込んでから置き換える）
+
+    Args:
+        file_path: 書き出し先
+        items: 書き出す項目
+        total: 項目の総数（進捗の通知用）
+        progress: 進捗の通知（書き出した件数, total）
+
+    Returns:
+        書き出した件数
+    """
+    def write_lines(f) -> int:
+        count = 0
+        for item in items:
+            f.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")))
+            f.write("\n")
+            count += 1
+            if progress is not None and count % 1000 == 0:
+                progress(count, total)
+        return count
+
+    return _write_atomic(file_path, write_lines, total, progress)
+
+
+def write_json_document(
+    file_path: Path,
+    key: str,
+    items: Iterable[dict],
+    total: int = 0,
+    progress: Optional[ProgressCallback] = None,
+) -> int:
+    """項目を旧形式（{"<key>": [...]}）で1件ずつ書き出す
+
+    json.dump(..., indent=2) と同じ形式になるため、旧バージョンでも読み込める。
+
+    Args:
+        file_path: 書き出し先
+        key: 項目の配列を入れるキー（例: "history"）
+        items: 書き出す項目
+        total: 項目の総数（進捗の通知用）
+        progress: 進捗の通知（書き出した件数, total）
+
+    Returns:
+        書き出した件数
+    """
+    def write_document(f) -> int:
+        count = 0
+        f.write("{\n  " + json.dumps(key) + ": [")
+        for item in items:
+            text = json.dumps(item, ensure_ascii=False, indent=2)
+            f.write(",\n    " if count else "\n    ")
+            f.write(text.replace("\n", "\n    "))
+            count += 1
+            if progress is not None and count % 1000 == 0:
+                progress(count, total)
+        f.write("\n  ]\n}" if count else "]\n}")
+        return count
+
+    return _write_atomic(file_path, write_document, total, progress)
+
+
+def _write_atomic(
+    file_path: Path,
+    write: Callable[[Any], int],
+    total: int,
+    progress: Optional[ProgressCallback],
+) -> int:
+    """一時ファイルに書き込んでから置き換える（途中で失敗しても元のファイルは残る）"""
+    file_path = Path(file_path)
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            count = write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+    if progress is not None:
+        progress(count, total or count)
+    return count
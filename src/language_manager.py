@@ -12,53 +12,25 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 import json
-from pathlib import Path
 from typing import Optional
 
-from paths import CONFIG_PATH, get_internal_path
+import translations
+from paths import CONFIG_PATH
 
 
 class LanguageManager:
-    """言語管理クラス"""
+    """言語管理クラス
 
-    SUPPORTED_LANGUAGES = {
-        'ja': '日本語',
-        'en': 'English'
-    }
+    翻訳の読み込みは translations モジュールに任せ、
+    このクラスは言語設定の保存・読み込みのみを行う。
+    """
+
+    SUPPORTED_LANGUAGES = translations.LANGUAGE_NAMES
 
     def __init__(self):
-        self.current_language = 'ja'  # デフォルト: 日本語
-        self.translations: dict[str, dict] = {}
-        self._load_translations()
+        self.current_language = translations.DEFAULT_LANGUAGE  # デフォルト: 日本語
         self._load_preference()
-
-    def _load_translations(self):
-        """翻訳ファイルを読み込む"""
-        # PyInstaller対応: get_internal_path()を使用
-        internal_path = get_internal_path()
-        lang_dir = internal_path / 'src' / 'languages'
-
-        print(f"[DEBUG] Language manager: internal_path = {internal_path}")
-        print(f"[DEBUG] Language manager: lang_dir = {lang_dir}")
-        print(f"[DEBUG] Language manager: lang_dir.exists() = {lang_dir.exists()}")
-
-        # フォールバック: 直接srcディレクトリ内を参照
-        if not lang_dir.exists():
-            lang_dir = Path(__file__).parent / 'languages'
-            print(f"[DEBUG] Language manager: fallback lang_dir = {lang_dir}")
-
-        for lang_code in self.SUPPORTED_LANGUAGES.keys():
-            filepath = lang_dir / f'{lang_code}.json'
-            print(f"[DEBUG] Language manager: loading {filepath} (exists={filepath.exists()})")
-
-            if filepath.exists():
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        self.translations[lang_code] = json.load(f)
-                        print(f"[DEBUG] Language manager: loaded {len(self.translations[lang_code])} translations for {lang_code}")
-                except (json.JSONDecodeError, IOError) as e:
-                    print(f"翻訳ファイル読み込みエラー ({lang_code}): {e}")
-                    self.translations[lang_code] = {}
+        translations.set_language(self.current_language)
 
     def _load_preference(self):
         """保存された言語設定を読み込む"""
@@ -95,12 +67,12 @@ class LanguageManager:
         """言語を設定する
 
         Args:
-            lang_code: 言語コード ('ja', 'en')
+            lang_code: 言語コード ('ja', 'en', 'zh-CN', 'zh-TW', 'ko', 'es', 'fr', 'de')
 
         Returns:
             設定に成功した場合True
         """
-        if lang_code in self.SUPPORTED_LANGUAGES:
+        if translations.set_language(lang_code):
             self.current_language = lang_code
             self.save_preference()
             return True
@@ -116,9 +88,9 @@ class LanguageManager:
         Returns:
             翻訳されたテキスト
         """
-        if self.current_language in self.translations:
-            return self.translations[self.current_language].get(key, default or key)
-        return default or key
+        if translations.get_current_language() != self.current_language:
+            translations.set_language(self.current_language)
+        return translations.t(key, default)
 
     def get_current_language(self) -> str:
         """現在の言語コードを取得する"""
@@ -2,6 +2,10 @@
 
 import sys
 import os
+import time
+
+# 起動時刻（--profile-startup の経過時間の基準）
+_STARTED_AT = time.perf_counter()
 
 # PyInstallerでビルドされた場合の特別な処理
 if getattr(sys, 'frozen', False):
@@ -23,19 +27,28 @@ if parent_dir not in sys.path:
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
+# --profile-startup 指定時は以降のインポート時間を計測する
+if "--profile-startup" in sys.argv:
+    from startup_profiler import start_startup_profiler
+    start_startup_profiler(_STARTED_AT)
+
 import argparse
 import random
 from datetime import datetime
 from dotenv import load_dotenv
 
-from youtube_client import YouTubeClient
-from playlist_manager import PlaylistManager
-from video_classifier import create_classifier
-from config import get_category_id, get_era_date_range, CATEGORY_NAME_TO_ID
-from setup_wizard import SetupStatus
+# YouTube APIクライアント・セットアップウィザードは起動時間短縮のため各コマンドで読み込む
+from config import get_category_id, get_era_date_range, get_official_channel_ids, CATEGORY_NAME_TO_ID
+from quota_manager import get_quota_scheduler, estimate_random_run_cost
+from retry_policy import get_retry_metrics
+from setup_status import SetupStatus
+from startup_profiler import get_startup_profiler
+from paths import STARTUP_PROFILE_FILE
+
 
 def list_liked_videos(args):
     """高く評価した動画を一覧表示"""
+    from youtube_client import YouTubeClient
     client = YouTubeClient()
     videos = list(client.get_liked_videos(max_results=args.limit))
 
@@ -48,6 +61,7 @@ def list_liked_videos(args):
 
 def list_playlists(args):
     """自分の再生リストを一覧表示"""
+    from youtube_client import YouTubeClient
     client = YouTubeClient()
     playlists = client.get_my_playlists(max_results=args.limit)
 
@@ -59,6 +73,8 @@ def list_playlists(args):
 
 def analyze_videos(args):
     """動画を年代別に分析"""
+    from youtube_client import YouTubeClient
+    from video_classifier import create_classifier
     client = YouTubeClient()
 
     # ソースを決定
@@ -91,6 +107,8 @@ def analyze_videos(args):
 
 def create_playlists(args):
     """年代別/カテゴリ別の再生リストを作成"""
+    from youtube_client import YouTubeClient
+    from playlist_manager import PlaylistManager
     client = YouTubeClient()
     manager = PlaylistManager()
 
@@ -137,6 +155,8 @@ def create_playlists(args):
 
 def random_search(args):
     """年代・カテゴリを指定してランダムに動画を選択し、再生リストを作成"""
+    from youtube_client import YouTubeClient
+    from playlist_manager import PlaylistManager
     client = YouTubeClient()
     manager = PlaylistManager()
 
@@ -181,6 +201,19 @@ def random_search(args):
     print(f"  検索クエリ: {full_query}")
     print(f"  選択数: {args.count}本\n")
 
+    # クォータ消費を見積もり、残りが足りない場合は実行しない
+    scheduler = get_quota_scheduler()
+    estimated_units = estimate_random_run_cost(args.count)
+    remaining_units = scheduler.get_remaining()
+    print(f"推定クォータ消費: {estimated_units}ユニット (本日の残り: {remaining_units}/{scheduler.daily_budget})")
+    if args.dry_run:
+        return
+    if not scheduler.can_afford(estimated_units):
+        print("エラー: 本日のAPIクォータが不足しているため実行を中止しました。")
+        print("選択数を減らすか、クォータがリセットされる太平洋時間0時以降にお試しください。")
+        sys.exit(1)
+    print()
+
     # 多めに検索してからランダムに選択
     search_count = min(args.count * 5, 200)  # 最大200本を検索
     print(f"YouTubeから動画を検索中 (最大{search_count}本)...")
@@ -234,6 +267,10 @@ def random_search(args):
         print(f"  追加失敗: {fail}本")
     print(f"  URL: https://www.youtube.com/playlist?list={playlist_id}")
 
+    retry_stats = get_retry_metrics().get_stats().get("youtube", {})
+    if retry_stats.get("retries"):
+        print(f"  API再試行: {retry_stats['retries']}回 (失敗: {retry_stats.get('failures', 0)}回)")
+
     print(f"\n選択された動画:")
     for i, video in enumerate(selected_videos[:10], 1):
         print(f"  {i:2}. [{video.year}] {video.title[:50]}...")
@@ -248,6 +285,11 @@ def main():
     parser = argparse.ArgumentParser(
         description="YouTube再生リスト管理ツール - 年代別・ジャンル別に再生リストを作成",
     )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="起動時のモジュールごとのインポート時間を計測して表示",
+    )
     subparsers = parser.add_subparsers(dest="command", help="コマンド")
 
     # list-liked コマンド
@@ -325,8 +367,38 @@ def main():
         default="private",
         help="再生リストのプライバシー設定",
     )
+    random_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="APIを呼び出さずにクォータ消費の見積もりのみ表示",
+    )
     random_parser.set_defaults(func=random_search)
 
+    # quota コマンド
+    quota_parser = subparsers.add_parser(
+        "quota",
+        help="YouTube APIクォータの使用状況を表示",
+    )
+    quota_parser.add_argument(
+        "--estimate",
+        type=int,
+        metavar="COUNT",
+        help="randomコマンドでCOUNT本選択した場合の消費ユニットを見積もる",
+    )
+    quota_parser.set_defaults(func=show_quota)
+
+    # prefetch-channels コマンド
+    prefetch_parser = subparsers.add_parser(
+        "prefetch-channels",
+        help="公式チャンネル情報を事前に取得してキャッシュする",
+    )
+    prefetch_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="キャッシュ済みのチャンネルも取得し直す",
+    )
+    prefetch_parser.set_defaults(func=prefetch_channels)
+
     # setup コマンド
     setup_parser = subparsers.add_parser(
         "setup",
@@ -364,6 +436,66 @@ def main():
         return
 
     args.func(args)
+    report_startup_profile("コマンド完了")
+
+
+def report_startup_profile(label: str) -> None:
+    """--profile-startup 指定時に起動プロファイルを表示・保存"""
+    profiler = get_startup_profiler()
+    if profiler is None or not profiler.installed:
+        # 計測していない、または表示済み
+        return
+    profiler.mark(label)
+    profiler.uninstall()
+
+    report = profiler.format_report()
+    # 翻訳ファイルの読み込み時間も表示する
+    from translations import get_load_stats
+    for code, stats in get_load_stats().items():
+        report += f"\n翻訳 ({code}): {stats['load_ms']:.1f}ms ({stats['source']}, {stats['keys']}キー)"
+
+    print(report)
+    # GUI版（コンソールなし）でも確認できるようファイルにも保存する
+    try:
+        STARTUP_PROFILE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        STARTUP_PROFILE_FILE.write_text(report, encoding="utf-8")
+        print(f"起動プロファイルを保存しました: {STARTUP_PROFILE_FILE}")
+    except OSError as e:
+        print(f"起動プロファイル保存エラー: {e}")
+
+
+def show_quota(args):
+    """APIクォータの使用状況を表示"""
+    scheduler = get_quota_scheduler()
+    used = scheduler.get_usage_today()
+
+    print("\nAPIクォータ使用状況（本日）:")
+    print(f"  使用: {used}ユニット / 上限: {scheduler.daily_budget}ユニット")
+    print(f"  残り: {scheduler.get_remaining()}ユニット")
+
+    by_method = scheduler.get_usage_by_method()
+    if by_method:
+        print("\nメソッド別:")
+        for method, units in sorted(by_method.items(), key=lambda x: x[1], reverse=True):
+            print(f"  {method}: {units}ユニット")
+
+    if args.estimate:
+        estimated_units = estimate_random_run_cost(args.estimate)
+        verdict = "実行可能" if scheduler.can_afford(estimated_units) else "クォータ不足"
+        print(f"\nrandom --count {args.estimate} の推定消費: {estimated_units}ユニット ({verdict})")
+
+
+def prefetch_channels(args):
+    """公式チャンネル情報をキャッシュに取得"""
+    channel_ids = list(get_official_channel_ids())
+    print(f"公式チャンネル情報を取得中 ({len(channel_ids)}件)...")
+
+    from youtube_client import YouTubeClient
+    client = YouTubeClient()
+    fetched = client.prefetch_channels(channel_ids, force=args.force)
+
+    print(f"APIから取得: {fetched}チャンネル")
+    print("以降の高精度検索ではキャッシュ済みのチャンネル情報を使用します。")
 
 
 def run_setup_command(args):
@@ -412,6 +544,12 @@ def run_gui_command(args):
     style.configure("TButton", padding=5)
 
     app = PlaylistManagerGUI(root, skip_setup_check=args.skip_setup)
+
+    profiler = get_startup_profiler()
+    if profiler is not None:
+        profiler.mark("GUI作成完了")
+        # 最初のウィンドウが描画された後（アイドル時）に記録する
+        root.after_idle(report_startup_profile, "最初のウィンドウ表示")
     root.mainloop()
 
 
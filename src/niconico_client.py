@@ -1,6 +1,5 @@
 """ニコニコ動画 API クライアントモジュール"""
 
-import json
 import urllib.request
 import urllib.parse
 import http.cookiejar
@@ -9,6 +8,11 @@ from datetime import datetime
 from typing import Optional, Generator
 import os
 import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from http_pool import PooledHTTPTransport, get_http_transport
+from retry_policy import RetryPolicy, get_retry_policy
 
 
 @dataclass
@@ -29,6 +33,8 @@ class NicoVideoInfo:
     url: str
     tags: list[str]
     platform: str = "niconico"
+    # 説明文・タグを取得済みか（"minimal"プロファイルで検索した場合はFalse）
+    details_loaded: bool = True
 
     def to_dict(self) -> dict:
         return {
@@ -47,6 +53,7 @@ class NicoVideoInfo:
             "url": self.url,
             "tags": self.tags,
             "platform": self.platform,
+            "details_loaded": self.details_loaded,
         }
 
     @classmethod
@@ -67,6 +74,7 @@ class NicoVideoInfo:
             url=data.get("url", ""),
             tags=data.get("tags", []),
             platform=data.get("platform", "niconico"),
+            details_loaded=data.get("details_loaded", True),
         )
 
 
@@ -86,13 +94,51 @@ class NicoNicoClient:
     # 動画情報取得API（ログイン不要の公開情報のみ）
     VIDEO_INFO_URL = "https://ext.nicovideo.jp/api/getthumbinfo/"
 
-    def __init__(self, email: Optional[str] = None, password: Optional[str] = None):
+    # スナップショット検索APIの制限
+    # _limit は最大100、_offset は最大100,000
+    # _context（40文字以内のアプリ名）は必須
+    PAGE_SIZE = 100
+    MAX_OFFSET = 100_000
+    API_CONTEXT = "youtube-playlist-manager"
+
+    # 同時に取得するページ数の上限
+    # APIに高い負荷をかけないよう少数に抑える
+    MAX_CONCURRENT_PAGES = 3
+
+    # 検索結果に含めるフィールド（fields）のプロファイル
+    # minimal: 一覧表示・選択用（説明文とタグは含めない。必要な場合は load_details() で取得）
+    # full: エクスポート用（説明文とタグを含む。説明文はHTMLで大きい場合がある）
+    FIELD_PROFILES = {
+        "minimal": (
+            "contentId", "title", "userId", "channelId",
+            "viewCounter", "mylistCounter", "commentCounter",
+            "thumbnailUrl", "startTime", "lengthSeconds",
+        ),
+        "full": (
+            "contentId", "title", "description", "userId", "channelId",
+            "viewCounter", "mylistCounter", "commentCounter",
+            "thumbnailUrl", "startTime", "lengthSeconds", "tags",
+        ),
+    }
+    DEFAULT_FIELD_PROFILE = "minimal"
+
+    def __init__(
+        self,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        transport: Optional[PooledHTTPTransport] = None,
+    ):
         """
         Args:
             email: ニコニコアカウントのメールアドレス（オプション）
             password: パスワード（オプション）
                       環境変数 NICONICO_EMAIL, NICONICO_PASSWORD からも取得可能
+            retry_policy: 一時的なエラーの再試行ポリシー（省略時は既定のポリシー）
+            transport: HTTP接続プール（省略時は共有のプール）
         """
+        self.retry_policy = retry_policy or get_retry_policy()
+        self.transport = transport or get_http_transport()
         self.email = email or os.getenv("NICONICO_EMAIL")
         self.password = password or os.getenv("NICONICO_PASSWORD")
         self._session_cookie = None
@@ -156,26 +202,38 @@ class NicoNicoClient:
         except (ValueError, AttributeError):
             return 0
 
-    def _parse_snapshot_video(self, data: dict) -> NicoVideoInfo:
-        """スナップショットAPIレスポンスからVideoInfoを作成"""
-        # 投稿日時をパース
-        start_time = data.get("startTime", "")
-        try:
-            dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-            year = dt.year
-            published_at = dt.isoformat()
-        except (ValueError, AttributeError):
-            year = 0
+    def _parse_snapshot_video(self, data: dict, details_loaded: bool = True) -> NicoVideoInfo:
+        """スナップショットAPIレスポンスからVideoInfoを作成
+
+        Args:
+            data: 1件分の動画データ
+            details_loaded: 説明文・タグを含むフィールドで検索したか
+        """
+        # 投稿日時（APIは "2020-01-01T00:00:00+09:00" 形式で返すため、年は先頭4文字から取る）
+        start_time = data.get("startTime") or ""
+        year_str = start_time[:4]
+        if len(start_time) >= 19 and year_str.isdigit() and not start_time.endswith("Z"):
+            year = int(year_str)
             published_at = start_time
+        else:
+            try:
+                dt = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
+                year = dt.year
+                published_at = dt.isoformat()
+            except (ValueError, AttributeError):
+                year = 0
+                published_at = start_time
 
         video_id = data.get("contentId", "")
+        uploader_id = data.get("channelId") or data.get("userId") or ""
+        tags = data.get("tags")
 
         return NicoVideoInfo(
             video_id=video_id,
             title=data.get("title", ""),
-            description=data.get("description", "") or "",
-            channel_title=data.get("channelId", "") or data.get("userId", "") or "Unknown",
-            channel_id=str(data.get("channelId", "") or data.get("userId", "")),
+            description=data.get("description") or "",
+            channel_title=uploader_id or "Unknown",
+            channel_id=str(uploader_id),
             published_at=published_at,
             year=year,
             duration=data.get("lengthSeconds", 0),
@@ -184,7 +242,8 @@ class NicoNicoClient:
             comment_count=data.get("commentCounter", 0),
             thumbnail_url=data.get("thumbnailUrl", ""),
             url=f"https://www.nicovideo.jp/watch/{video_id}",
-            tags=data.get("tags", "").split(" ") if data.get("tags") else [],
+            tags=tags.split(" ") if tags else [],
+            details_loaded=details_loaded,
         )
 
     def search_videos(
@@ -194,9 +253,17 @@ class NicoNicoClient:
         sort: str = "-viewCounter",
         targets: str = "title,description,tags",
         genre_keyword: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        field_profile: Optional[str] = None,
     ) -> Generator[NicoVideoInfo, None, None]:
         """動画を検索（スナップショット検索API）
 
+        100件を超える場合は、複数ページ（_offset）を同時に取得して
+        先頭から順番に返す。件数が足りないページがあればそこで終了する。
+
+        既定の "minimal" プロファイルでは説明文とタグを取得しない
+        （details_loaded=False）。必要な動画だけ load_details() で取得する。
+
         Args:
             query: 検索クエリ
             max_results: 最大結果数
@@ -208,71 +275,143 @@ class NicoNicoClient:
                   +startTime: 投稿日時昇順
             targets: 検索対象 (title, description, tags)
             genre_keyword: ジャンルキーワード（例: "音楽", "ゲーム"）
+            concurrency: 同時に取得するページ数（省略時はMAX_CONCURRENT_PAGES、1で逐次取得）
+            field_profile: 取得するフィールド（"minimal" または "full"、省略時はDEFAULT_FIELD_PROFILE）
 
         Yields:
             NicoVideoInfo
         """
+        field_profile = field_profile or self.DEFAULT_FIELD_PROFILE
+        if field_profile not in self.FIELD_PROFILES:
+            raise ValueError(f"不明なフィールドプロファイル: {field_profile}")
+        fields = self.FIELD_PROFILES[field_profile]
+
         params = {
             "q": query,
             "targets": targets,
-            "fields": "contentId,title,description,userId,channelId,viewCounter,mylistCounter,commentCounter,thumbnailUrl,startTime,lengthSeconds,tags",
+            "fields": ",".join(fields),
             "_sort": sort,
-            "_limit": min(max_results, 100),  # APIの最大は100
-            "_context": "youtube-playlist-manager",
+            "_context": self.API_CONTEXT,
         }
 
         if genre_keyword:
             params["q"] = f"{query} {genre_keyword}"
 
-        url = f"{self.SNAPSHOT_API_URL}?{urllib.parse.urlencode(params)}"
+        # 取得するページ（offset, limit）
+        max_results = min(max_results, self.MAX_OFFSET + self.PAGE_SIZE)
+        pages = [
+            (offset, min(self.PAGE_SIZE, max_results - offset))
+            for offset in range(0, max_results, self.PAGE_SIZE)
+        ]
+        if concurrency is None:
+            concurrency = self.MAX_CONCURRENT_PAGES
+        concurrency = max(1, min(concurrency, self.MAX_CONCURRENT_PAGES, len(pages) or 1))
+        details_loaded = "description" in fields and "tags" in fields
 
         try:
-            request = urllib.request.Request(
-                url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                }
-            )
+            if concurrency == 1:
+                for offset, limit in pages:
+                    page = self._fetch_snapshot_page(params, offset, limit)
+                    if page is None:
+                        break
+                    videos, _ = page
+                    for video_data in videos:
+                        yield self._parse_snapshot_video(video_data, details_loaded)
+                    if len(videos) < limit:  # これ以上結果がない
+                        break
+                return
 
-            offset = 0
-            total_fetched = 0
+            yield from self._search_pages_concurrently(params, pages, concurrency, details_loaded)
 
-            while total_fetched < max_results:
-                params["_offset"] = offset
-                url = f"{self.SNAPSHOT_API_URL}?{urllib.parse.urlencode(params)}"
-                request = urllib.request.Request(
-                    url,
-                    headers={
-                        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                    }
-                )
+        except urllib.error.HTTPError as e:
+            print(f"ニコニコAPI HTTPエラー: {e.code} - {e.reason}")
+        except Exception as e:
+            print(f"ニコニコAPI エラー: {e}")
 
-                with urllib.request.urlopen(request, timeout=30) as response:
-                    result = json.loads(response.read().decode("utf-8"))
+    def _search_pages_concurrently(
+        self,
+        params: dict,
+        pages: list[tuple[int, int]],
+        concurrency: int,
+        details_loaded: bool,
+    ) -> Generator[NicoVideoInfo, None, None]:
+        """複数ページを同時に取得し、offset順に返す
 
-                if result.get("meta", {}).get("status") != 200:
-                    print(f"ニコニコAPI エラー: {result.get('meta', {}).get('errorMessage', 'Unknown error')}")
-                    break
+        常に最大concurrencyページを先読みし、先頭のページが届いた順に返す。
+        件数が足りないページ、または総件数（totalCount）に達した時点で
+        残りのページは取得しない。
+        """
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="niconico-page")
+        in_flight: deque[tuple[int, int, Future]] = deque()
+        next_page = 0
+        total_count: Optional[int] = None
+
+        def submit_more() -> None:
+            nonlocal next_page
+            while len(in_flight) < concurrency and next_page < len(pages):
+                offset, limit = pages[next_page]
+                if total_count is not None and offset >= total_count:
+                    return
+                future = executor.submit(self._fetch_snapshot_page, params, offset, limit)
+                in_flight.append((offset, limit, future))
+                next_page += 1
 
-                videos = result.get("data", [])
-                if not videos:
+        try:
+            submit_more()
+            while in_flight:
+                offset, limit, future = in_flight.popleft()
+                page = future.result()
+                if page is None:
                     break
+                videos, page_total = page
+                if page_total is not None:
+                    total_count = page_total
+
+                is_last = len(videos) < limit  # これ以上結果がない
+                if not is_last:
+                    # 呼び出し側の処理中も次のページを取得しておく
+                    submit_more()
 
                 for video_data in videos:
-                    if total_fetched >= max_results:
-                        break
-                    yield self._parse_snapshot_video(video_data)
-                    total_fetched += 1
+                    yield self._parse_snapshot_video(video_data, details_loaded)
 
-                if len(videos) < 100:  # これ以上結果がない
+                if is_last:
                     break
+        finally:
+            # 途中で終了した場合、未着手のページは取得しない
+            for _, _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
 
-                offset += 100
+    def _fetch_snapshot_page(
+        self,
+        params: dict,
+        offset: int,
+        limit: int,
+    ) -> Optional[tuple[list[dict], Optional[int]]]:
+        """スナップショット検索の1ページを取得
 
-        except urllib.error.HTTPError as e:
-            print(f"ニコニコAPI HTTPエラー: {e.code} - {e.reason}")
-        except Exception as e:
-            print(f"ニコニコAPI エラー: {e}")
+        Returns:
+            (動画データのリスト, 総件数)、APIがエラーを返した場合はNone
+        """
+        page_params = dict(params, _offset=offset, _limit=limit)
+        # ページごとに同じkeep-alive接続を使い回す
+        result = self._fetch_json(self.SNAPSHOT_API_URL, page_params)
+
+        meta = result.get("meta", {})
+        if meta.get("status") != 200:
+            print(f"ニコニコAPI エラー: {meta.get('errorMessage', 'Unknown error')}")
+            return None
+
+        return result.get("data", []), meta.get("totalCount")
+
+    def _fetch_json(self, url: str, params: Optional[dict] = None) -> dict:
+        """JSONを取得（503などの一時的なエラーは再試行）"""
+        params = dict(params or {})
+        return self.retry_policy.call(
+            lambda: self.transport.get_json(url, params=params),
+            label="niconico",
+        )
 
     def get_video_info(self, video_id: str) -> Optional[NicoVideoInfo]:
         """動画IDから動画情報を取得（getthumbinfo API）
@@ -286,49 +425,43 @@ class NicoNicoClient:
         url = f"{self.VIDEO_INFO_URL}{video_id}"
 
         try:
-            request = urllib.request.Request(
-                url,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                }
+            response = self.transport.get(url)
+
+            # XMLレスポンスをパース（簡易的な実装）
+            xml_content = response.text()
+
+            # 正規表現で主要な情報を抽出
+            def extract_tag(tag_name: str) -> str:
+                match = re.search(f"<{tag_name}>(.*?)</{tag_name}>", xml_content, re.DOTALL)
+                return match.group(1) if match else ""
+
+            # 投稿日時をパース
+            first_retrieve = extract_tag("first_retrieve")
+            try:
+                dt = datetime.fromisoformat(first_retrieve.replace("+09:00", "+09:00"))
+                year = dt.year
+                published_at = dt.isoformat()
+            except (ValueError, AttributeError):
+                year = 0
+                published_at = first_retrieve
+
+            return NicoVideoInfo(
+                video_id=video_id,
+                title=extract_tag("title"),
+                description=extract_tag("description"),
+                channel_title=extract_tag("user_nickname") or extract_tag("ch_name") or "Unknown",
+                channel_id=extract_tag("user_id") or extract_tag("ch_id") or "",
+                published_at=published_at,
+                year=year,
+                duration=self._parse_duration(extract_tag("length")),
+                view_count=int(extract_tag("view_counter") or 0),
+                like_count=int(extract_tag("mylist_counter") or 0),
+                comment_count=int(extract_tag("comment_num") or 0),
+                thumbnail_url=extract_tag("thumbnail_url"),
+                url=f"https://www.nicovideo.jp/watch/{video_id}",
+                tags=re.findall(r'<tag[^>]*>([^<]+)</tag>', xml_content),
             )
 
-            with urllib.request.urlopen(request, timeout=30) as response:
-                # XMLレスポンスをパース（簡易的な実装）
-                xml_content = response.read().decode("utf-8")
-
-                # 正規表現で主要な情報を抽出
-                def extract_tag(tag_name: str) -> str:
-                    match = re.search(f"<{tag_name}>(.*?)</{tag_name}>", xml_content, re.DOTALL)
-                    return match.group(1) if match else ""
-
-                # 投稿日時をパース
-                first_retrieve = extract_tag("first_retrieve")
-                try:
-                    dt = datetime.fromisoformat(first_retrieve.replace("+09:00", "+09:00"))
-                    year = dt.year
-                    published_at = dt.isoformat()
-                except (ValueError, AttributeError):
-                    year = 0
-                    published_at = first_retrieve
-
-                return NicoVideoInfo(
-                    video_id=video_id,
-                    title=extract_tag("title"),
-                    description=extract_tag("description"),
-                    channel_title=extract_tag("user_nickname") or extract_tag("ch_name") or "Unknown",
-                    channel_id=extract_tag("user_id") or extract_tag("ch_id") or "",
-                    published_at=published_at,
-                    year=year,
-                    duration=self._parse_duration(extract_tag("length")),
-                    view_count=int(extract_tag("view_counter") or 0),
-                    like_count=int(extract_tag("mylist_counter") or 0),
-                    comment_count=int(extract_tag("comment_num") or 0),
-                    thumbnail_url=extract_tag("thumbnail_url"),
-                    url=f"https://www.nicovideo.jp/watch/{video_id}",
-                    tags=re.findall(r'<tag[^>]*>([^<]+)</tag>', xml_content),
-                )
-
         except urllib.error.HTTPError as e:
             if e.code == 404:
                 print(f"動画が見つかりません: {video_id}")
@@ -339,11 +472,31 @@ class NicoNicoClient:
             print(f"ニコニコAPI エラー: {e}")
             return None
 
+    def load_details(self, video: NicoVideoInfo) -> NicoVideoInfo:
+        """説明文・タグを取得していない動画に、getthumbinfo APIで取得して補う
+
+        Args:
+            video: search_videos() の結果
+
+        Returns:
+            同じNicoVideoInfo（取得に失敗した場合は変更しない）
+        """
+        if video.details_loaded:
+            return video
+
+        info = self.get_video_info(video.video_id)
+        if info is not None:
+            video.description = info.description
+            video.tags = info.tags
+            video.details_loaded = True
+        return video
+
     def search_by_tag(
         self,
         tag: str,
         max_results: int = 50,
         sort: str = "-viewCounter",
+        field_profile: Optional[str] = None,
     ) -> Generator[NicoVideoInfo, None, None]:
         """タグで動画を検索
 
@@ -351,6 +504,7 @@ class NicoNicoClient:
             tag: 検索タグ
             max_results: 最大結果数
             sort: ソート順
+            field_profile: 取得するフィールド（"minimal" または "full"）
 
         Yields:
             NicoVideoInfo
@@ -361,6 +515,7 @@ class NicoNicoClient:
             max_results=max_results,
             sort=sort,
             targets="tags",
+            field_profile=field_profile,
         )
 
     def is_logged_in(self) -> bool:
@@ -381,5 +536,7 @@ if __name__ == "__main__":
         print(f"- {video.title}")
         print(f"  URL: {video.url}")
         print(f"  再生数: {video.view_count}")
+        # 一覧の検索では説明文・タグを取得しないため、表示する動画だけ取得する
+        client.load_details(video)
         print(f"  タグ: {', '.join(video.tags[:5])}")
         print()
@@ -53,8 +53,15 @@ VIMEO_TOKEN_FILE = CONFIG_PATH / 'vimeo_token.txt'
 NICONICO_AUTH_FILE = CONFIG_PATH / 'niconico_auth.json'
 SETUP_COMPLETE_FILE = CONFIG_PATH / 'setup_complete.json'
 PRESETS_FILE = CONFIG_PATH / 'presets.json'
-HISTORY_FILE = CONFIG_PATH / 'history.json'
+HISTORY_FILE = CONFIG_PATH / 'history.jsonl'
+LEGACY_HISTORY_FILE = CONFIG_PATH / 'history.json'  # 旧形式（初回読み込み時に移行）
 INTEGRATED_PLAYLISTS_FILE = CONFIG_PATH / 'integrated_playlists.json'
+VIDEO_CACHE_FILE = CONFIG_PATH / 'video_cache.sqlite3'
+CHANNEL_CACHE_FILE = CONFIG_PATH / 'channel_cache.sqlite3'
+THUMBNAIL_CACHE_PATH = CONFIG_PATH / 'thumbnails'
+QUOTA_LEDGER_FILE = CONFIG_PATH / 'quota_ledger.json'
+STARTUP_PROFILE_FILE = CONFIG_PATH / 'startup_profile.txt'
+DISCOVERY_CACHE_PATH = CONFIG_PATH / 'discovery'
 
 
 def ensure_directories() -> None:
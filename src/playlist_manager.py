@@ -2,6 +2,7 @@
 
 import sys
 import os
+import threading
 
 # 親ディレクトリをパスに追加（通常のPython実行用）
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -12,10 +13,12 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 from googleapiclient.discovery import Resource
 
 from auth import get_authenticated_service
+from batch_inserter import BatchInserter, InsertResult
+from quota_manager import QuotaScheduler, get_quota_scheduler
 from youtube_client import VideoInfo, YouTubeClient
 from video_classifier import VideoClassifier, create_classifier
 from description_generator import DescriptionGenerator
@@ -33,10 +36,19 @@ class PlaylistCreationResult:
 class PlaylistManager:
     """再生リストの作成・管理を行うクラス"""
 
-    def __init__(self, service: Optional[Resource] = None):
+    def __init__(
+        self,
+        service: Optional[Resource] = None,
+        quota_scheduler: Optional[QuotaScheduler] = None,
+    ):
         self._service = service
+        self._quota = quota_scheduler or get_quota_scheduler()
         self._description_generator = DescriptionGenerator()
 
+        # タイトル -> 再生リストIDのインデックス（初回検索時に構築）
+        self._title_index: Optional[dict[str, list[str]]] = None
+        self._index_lock = threading.Lock()
+
     @property
     def service(self) -> Resource:
         """遅延初期化されたYouTubeサービスを取得"""
@@ -44,6 +56,10 @@ class PlaylistManager:
             self._service = get_authenticated_service()
         return self._service
 
+    def _execute(self, request) -> dict:
+        """クォータを予約してAPIリクエストを実行"""
+        return self._quota.execute(request)
+
     def create_playlist(
         self,
         title: str,
@@ -63,8 +79,10 @@ class PlaylistManager:
                 },
             },
         )
-        response = request.execute()
-        return response["id"]
+        response = self._execute(request)
+        playlist_id = response["id"]
+        self._add_to_index(title, playlist_id)
+        return playlist_id
 
     def create_playlist_with_details(
         self,
@@ -141,47 +159,125 @@ class PlaylistManager:
                     },
                 },
             )
-            request.execute()
+            self._execute(request)
             return True
         except Exception as e:
             print(f"動画追加エラー (video_id={video_id}): {e}")
             return False
 
     def add_videos_to_playlist(
-        self, playlist_id: str, video_ids: list[str]
+        self,
+        playlist_id: str,
+        video_ids: list[str],
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        should_continue: Optional[Callable[[], bool]] = None,
     ) -> tuple[int, int]:
         """複数の動画を再生リストに追加
 
+        Args:
+            playlist_id: 追加先の再生リストID
+            video_ids: 追加する動画IDのリスト
+            on_progress: 進捗コールバック (追加済み数, 総数)
+            should_continue: Falseを返した場合、残りの追加を中止する
+
         Returns:
             (成功数, 失敗数)
         """
-        success_count = 0
-        fail_count = 0
-        for video_id in video_ids:
-            if self.add_video_to_playlist(playlist_id, video_id):
-                success_count += 1
-            else:
-                fail_count += 1
-        return success_count, fail_count
+        results = self.insert_videos(
+            playlist_id,
+            video_ids,
+            on_progress=on_progress,
+            should_continue=should_continue,
+        )
+        success_count = sum(1 for r in results if r.success)
+        return success_count, len(results) - success_count
+
+    def insert_videos(
+        self,
+        playlist_id: str,
+        video_ids: list[str],
+        preserve_order: bool = True,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        should_continue: Optional[Callable[[], bool]] = None,
+    ) -> list[InsertResult]:
+        """複数の動画をまとめて再生リストに追加し、動画ごとの結果を返す
+
+        Args:
+            playlist_id: 追加先の再生リストID
+            video_ids: 追加する動画IDのリスト（この順番で並ぶ）
+            preserve_order: 追加後に要求順どおりに並び替えるか
+            on_progress: 進捗コールバック (追加済み数, 総数)
+            should_continue: Falseを返した場合、残りの追加を中止する
+
+        Returns:
+            動画ごとのInsertResult
+        """
+        if not video_ids:
+            return []
+        inserter = BatchInserter(self.service, quota_scheduler=self._quota)
+        return inserter.insert_videos(
+            playlist_id,
+            video_ids,
+            preserve_order=preserve_order,
+            on_progress=on_progress,
+            should_continue=should_continue,
+        )
 
     def delete_playlist(self, playlist_id: str) -> bool:
         """再生リストを削除"""
         try:
             request = self.service.playlists().delete(id=playlist_id)
-            request.execute()
+            self._execute(request)
+            self._remove_from_index(playlist_id)
             return True
         except Exception as e:
             print(f"再生リスト削除エラー: {e}")
             return False
 
     def find_playlist_by_title(self, title: str) -> Optional[str]:
-        """タイトルで再生リストを検索"""
-        client = YouTubeClient(self.service)
-        playlists = client.get_my_playlists(max_results=200)
-        for playlist in playlists:
-            if playlist.title == title:
-                return playlist.playlist_id
-        return None
+        """タイトルで再生リストを検索
+
+        初回呼び出し時に自分の再生リストをすべて取得してインデックスを構築し、
+        以降はAPIを呼ばずにインデックスから検索する。
+        """
+        playlist_ids = self._get_title_index().get(title)
+        return playlist_ids[0] if playlist_ids else None
+
+    def refresh_playlist_index(self) -> None:
+        """再生リストのインデックスを破棄（次回検索時に再取得）
+
+        YouTube上で直接再生リストを変更した場合などに呼び出す。
+        """
+        with self._index_lock:
+            self._title_index = None
+
+    def _get_title_index(self) -> dict[str, list[str]]:
+        """タイトル -> 再生リストIDのインデックスを取得（未構築の場合は構築）"""
+        with self._index_lock:
+            if self._title_index is None:
+                client = YouTubeClient(self.service, quota_scheduler=self._quota)
+                index: dict[str, list[str]] = {}
+                for playlist in client.get_my_playlists(max_results=None):
+                    index.setdefault(playlist.title, []).append(playlist.playlist_id)
+                self._title_index = index
+            return self._title_index
+
+    def _add_to_index(self, title: str, playlist_id: str) -> None:
+        """作成した再生リストをインデックスに追加"""
+        with self._index_lock:
+            if self._title_index is not None:
+                self._title_index.setdefault(title, []).append(playlist_id)
+
+    def _remove_from_index(self, playlist_id: str) -> None:
+        """削除した再生リストをインデックスから除外"""
+        with self._index_lock:
+            if self._title_index is None:
+                return
+            for title, playlist_ids in list(self._title_index.items()):
+                if playlist_id in playlist_ids:
+                    playlist_ids.remove(playlist_id)
+                    if not playlist_ids:
+                        del self._title_index[title]
 
     def get_or_create_playlist(
         self,
@@ -18,6 +18,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from json_stream import (
+    JSONStreamError, ProgressCallback, iter_json_items, write_json_document, write_json_lines,
+)
 from paths import PRESETS_FILE
 
 
@@ -176,48 +179,72 @@ class PresetManager:
         """プリセット名のリストを取得"""
         return [p.name for p in self._presets]
 
-    def export_to_file(self, file_path: Path) -> bool:
-        """プリセットを別ファイルにエクスポート"""
+    def export_to_file(
+        self,
+        file_path: Path,
+        progress: Optional[ProgressCallback] = None,
+    ) -> bool:
+        """プリセットを別ファイルにエクスポート
+
+        拡張子が .jsonl の場合はJSON Lines（1行に1件）、それ以外は旧形式
+        （{"presets": [...]}）で書き出す。
+
+        Args:
+            file_path: エクスポート先のファイルパス
+            progress: 進捗の通知（書き出した件数, 全件数）
+        """
+        presets = self._presets.copy()
+        items = (p.to_dict() for p in presets)
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(
-                    {"presets": [p.to_dict() for p in self._presets]},
-                    f,
-                    ensure_ascii=False,
-                    indent=2,
-                )
+            if Path(file_path).suffix.lower() == ".jsonl":
+                write_json_lines(file_path, items, len(presets), progress)
+            else:
+                write_json_document(file_path, "presets", items, len(presets), progress)
             return True
-        except IOError as e:
+        except OSError as e:
             print(f"エクスポートエラー: {e}")
             return False
 
-    def import_from_file(self, file_path: Path, merge: bool = True) -> int:
+    def import_from_file(
+        self,
+        file_path: Path,
+        merge: bool = True,
+        progress: Optional[ProgressCallback] = None,
+    ) -> int:
         """別ファイルからプリセットをインポート
 
+        JSON Lines・旧形式（{"presets": [...]}）のどちらも読み込める。
+
         Args:
             file_path: インポート元のファイルパス
             merge: Trueの場合は既存に追加、Falseの場合は置換
+            progress: 進捗の通知（読み込んだバイト数, ファイルサイズ）
 
         Returns:
             インポートしたプリセット数
         """
+        imported = []
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                imported = [Preset.from_dict(p) for p in data.get("presets", [])]
-
-            if merge:
-                # 既存のIDと重複しないよう新しいIDを付与
-                existing_ids = {p.id for p in self._presets}
-                for preset in imported:
-                    if preset.id in existing_ids:
-                        preset.id = str(uuid.uuid4())
-                    self._presets.append(preset)
-            else:
-                self._presets = imported
-
-            self._save()
-            return len(imported)
-        except (json.JSONDecodeError, IOError) as e:
+            for item in iter_json_items(file_path, "presets", progress=progress):
+                try:
+                    imported.append(Preset.from_dict(item))
+                except (ValueError, TypeError, AttributeError) as e:
+                    # 形式が正しくないプリセットは読み飛ばす
+                    print(f"プリセット読み込みエラー（スキップ）: {e}")
+        except (JSONStreamError, OSError) as e:
             print(f"インポートエラー: {e}")
             return 0
+
+        if merge:
+            # 既存のIDと重複しないよう新しいIDを付与（インポートするもの同士の重複も含む）
+            existing_ids = {p.id for p in self._presets}
+            for preset in imported:
+                if preset.id in existing_ids:
+                    preset.id = str(uuid.uuid4())
+                existing_ids.add(preset.id)
+                self._presets.append(preset)
+        else:
+            self._presets = imported
+
+        self._save()
+        return len(imported)
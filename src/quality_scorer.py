@@ -0,0 +1,166 @@
+"""品質スコア一括計算モジュール - 動画リストの品質スコアをまとめて計算"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from config import (
+    is_official_channel_by_id,
+    is_official_channel,
+    get_official_channel_score,
+)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# この値以上のスコアを公式/高品質とみなす
+OFFICIAL_SCORE_THRESHOLD = 50
+
+# 品質スコアの上限
+MAX_QUALITY_SCORE = 250
+
+
+@dataclass
+class ScoringResult:
+    """一括スコア計算の結果"""
+    scores: list[int]      # 入力順の品質スコア
+    order: list[int]       # スコア降順に並べたインデックス（同点は入力順）
+    official_count: int    # スコアがしきい値以上の動画数
+
+
+def _build_columns(videos: Sequence) -> dict[str, list[int]]:
+    """動画リストから列ごとの配列を作成
+
+    公式チャンネルの判定はチャンネルごとに1回だけ行い、同じチャンネルの動画では
+    結果を使い回す。動画ごとに判定するのはタイトルを含む公式スコアだけ。
+    """
+    channel_flags: dict[tuple, tuple[int, int]] = {}
+    official_id = []
+    official_name = []
+    name_score = []
+    verified = []
+    subscribers = []
+    views = []
+    for video in videos:
+        channel = (video.channel_id, video.channel_title)
+        flags = channel_flags.get(channel)
+        if flags is None:
+            flags = channel_flags[channel] = (
+                int(is_official_channel_by_id(video.channel_id)),
+                int(is_official_channel(video.channel_title)),
+            )
+        official_id.append(flags[0])
+        official_name.append(flags[1])
+        name_score.append(get_official_channel_score(video.channel_title, video.title))
+        verified.append(int(bool(video.is_verified)))
+        subscribers.append(video.subscriber_count or 0)
+        views.append(video.view_count or 0)
+    return {
+        "official_id": official_id,
+        "official_name": official_name,
+        "name_score": name_score,
+        "verified": verified,
+        "subscribers": subscribers,
+        "views": views,
+    }
+
+
+def _score_numpy(columns: dict[str, list[int]]) -> list[int]:
+    """NumPyでスコアを一括計算"""
+    subscribers = np.asarray(columns["subscribers"], dtype=np.int64)
+    views = np.asarray(columns["views"], dtype=np.int64)
+    scores = (
+        100 * np.asarray(columns["official_id"], dtype=np.int64)
+        + 50 * np.asarray(columns["official_name"], dtype=np.int64)
+        + np.asarray(columns["name_score"], dtype=np.int64) // 2
+        + 50 * np.asarray(columns["verified"], dtype=np.int64)
+        + np.where(subscribers >= 1_000_000, 30, np.where(subscribers >= 100_000, 15, 0))
+        + np.where(views >= 1_000_000, 20, np.where(views >= 100_000, 10, 0))
+    )
+    return np.minimum(scores, MAX_QUALITY_SCORE).tolist()
+
+
+def _score_python(columns: dict[str, list[int]]) -> list[int]:
+    """純Pythonでスコアを計算（NumPyがない場合）"""
+    scores = []
+    for official_id, official_name, name_score, verified, subscribers, views in zip(
+        columns["official_id"],
+        columns["official_name"],
+        columns["name_score"],
+        columns["verified"],
+        columns["subscribers"],
+        columns["views"],
+    ):
+        score = 100 * official_id + 50 * official_name + name_score // 2 + 50 * verified
+        if subscribers >= 1_000_000:
+            score += 30
+        elif subscribers >= 100_000:
+            score += 15
+        if views >= 1_000_000:
+            score += 20
+        elif views >= 100_000:
+            score += 10
+        scores.append(min(score, MAX_QUALITY_SCORE))
+    return scores
+
+
+def score_video(video) -> int:
+    """1件の動画の品質スコアを計算（VideoInfo.calculate_quality_score から使う）
+
+    score_videos と同じ計算を1行だけで行い、video.quality_score も更新する。
+    """
+    video.quality_score = _score_python(_build_columns([video]))[0]
+    return video.quality_score
+
+
+def score_videos(
+    videos: Sequence,
+    official_threshold: int = OFFICIAL_SCORE_THRESHOLD,
+    use_numpy: Optional[bool] = None,
+) -> ScoringResult:
+    """動画リストの品質スコアをまとめて計算
+
+    スコアの基準は VideoInfo.calculate_quality_score を参照。
+    各動画の quality_score も更新する。
+
+    Args:
+        videos: VideoInfoのリスト
+        official_threshold: 公式/高品質とみなすスコア
+        use_numpy: NumPyを使用するか（Noneの場合は利用可能なら使用）
+
+    Returns:
+        ScoringResult（スコア、降順インデックス、公式動画数）
+    """
+    if not videos:
+        return ScoringResult(scores=[], order=[], official_count=0)
+
+    columns = _build_columns(videos)
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    if use_numpy and NUMPY_AVAILABLE:
+        scores = _score_numpy(columns)
+        order = np.argsort(-np.asarray(scores), kind="stable").tolist()
+    else:
+        scores = _score_python(columns)
+        order = sorted(range(len(scores)), key=lambda i: -scores[i])
+
+    for video, score in zip(videos, scores):
+        video.quality_score = score
+
+    official_count = sum(1 for score in scores if score >= official_threshold)
+    return ScoringResult(scores=scores, order=order, official_count=official_count)
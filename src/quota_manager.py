@@ -0,0 +1,378 @@
+"""APIクォータ管理モジュール - YouTube Data APIのユニット消費を記録・制御"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import atexit
+import json
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Optional
+
+from config import HIGH_PRECISION_SEARCH_FACTOR, get_official_channel_ids
+from paths import QUOTA_LEDGER_FILE
+from retry_policy import RetryPolicy, get_retry_policy
+
+try:
+    from zoneinfo import ZoneInfo
+    _QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except Exception:
+    # tzdataがない環境（Windowsなど）では太平洋標準時で近似
+    _QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+
+# メソッドごとのクォータコスト（ユニット）
+# https://developers.google.com/youtube/v3/determine_quota_cost
+API_COSTS = {
+    "youtube.search.list": 100,
+    "youtube.videos.list": 1,
+    "youtube.channels.list": 1,
+    "youtube.playlists.list": 1,
+    "youtube.playlistItems.list": 1,
+    "youtube.playlists.insert": 50,
+    "youtube.playlists.update": 50,
+    "youtube.playlists.delete": 50,
+    "youtube.playlistItems.insert": 50,
+    "youtube.playlistItems.update": 50,
+    "youtube.playlistItems.delete": 50,
+}
+
+# 未知のメソッドに適用するコスト
+DEFAULT_COST = 1
+
+# 1日あたりのデフォルト上限（YouTube Data APIの標準割り当て）
+DEFAULT_DAILY_BUDGET = 10_000
+
+# 保存する日数
+LEDGER_RETENTION_DAYS = 30
+
+
+class QuotaExceededError(Exception):
+    """実行するとクォータ上限を超える場合の例外"""
+
+    def __init__(self, method: str, cost: int, remaining: int):
+        self.method = method
+        self.cost = cost
+        self.remaining = remaining
+        super().__init__(
+            f"APIクォータ上限に達するため実行を中止しました "
+            f"({method}: {cost}ユニット必要, 残り{remaining}ユニット)"
+        )
+
+
+def get_method_cost(method: str) -> int:
+    """メソッドIDのクォータコストを取得"""
+    return API_COSTS.get(method, DEFAULT_COST)
+
+
+def get_quota_date() -> str:
+    """クォータ集計日を取得（YouTubeのクォータは太平洋時間0時にリセット）"""
+    return datetime.now(_QUOTA_TIMEZONE).strftime("%Y-%m-%d")
+
+
+class QuotaScheduler:
+    """YouTube APIリクエストのユニット消費を管理するクラス
+
+    すべてのリクエストはexecute()またはreserve()を経由し、
+    実行前に日次の上限を確認する。使用量は日付ごとに台帳ファイルへ保存する。
+    """
+
+    SAVE_INTERVAL = 2.0  # 台帳を保存する最小間隔（秒）
+
+    def __init__(
+        self,
+        ledger_path: Optional[Path] = None,
+        daily_budget: Optional[int] = None,
+        max_units_per_minute: Optional[int] = None,
+    ):
+        """
+        Args:
+            ledger_path: 台帳ファイルのパス
+            daily_budget: 1日あたりの上限ユニット数
+                          環境変数 YOUTUBE_DAILY_QUOTA からも取得可能
+            max_units_per_minute: 1分あたりの上限ユニット数（超える場合は待機）
+                                  環境変数 YOUTUBE_QUOTA_PER_MINUTE からも取得可能
+        """
+        self.ledger_path = ledger_path or QUOTA_LEDGER_FILE
+        self.daily_budget = daily_budget or int(
+            os.getenv("YOUTUBE_DAILY_QUOTA", DEFAULT_DAILY_BUDGET)
+        )
+        per_minute = max_units_per_minute or os.getenv("YOUTUBE_QUOTA_PER_MINUTE")
+        self.max_units_per_minute = int(per_minute) if per_minute else None
+
+        self._lock = threading.Lock()
+        self._ledger: dict[str, dict] = {}
+        self._recent: deque[tuple[float, int]] = deque()  # (時刻, ユニット) 直近1分間
+        self._dirty = False
+        self._last_save = 0.0
+        self._load()
+
+    # ========================================
+    # 台帳
+    # ========================================
+    def _load(self):
+        """台帳ファイルを読み込む"""
+        try:
+            if self.ledger_path.exists():
+                with open(self.ledger_path, "r", encoding="utf-8") as f:
+                    self._ledger = json.load(f).get("days", {})
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"クォータ台帳読み込みエラー: {e}")
+            self._ledger = {}
+
+    def _save(self):
+        """台帳ファイルに保存（古い日付は削除）"""
+        cutoff = (datetime.now(_QUOTA_TIMEZONE) - timedelta(days=LEDGER_RETENTION_DAYS)).strftime("%Y-%m-%d")
+        with self._lock:
+            self._ledger = {day: usage for day, usage in self._ledger.items() if day >= cutoff}
+            data = {"days": self._ledger}
+            self._dirty = False
+            self._last_save = time.monotonic()
+            try:
+                self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.ledger_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+            except IOError as e:
+                print(f"クォータ台帳保存エラー: {e}")
+
+    def flush(self):
+        """未保存の使用量を台帳に書き込む"""
+        if self._dirty:
+            self._save()
+
+    def _today_usage(self) -> dict:
+        """今日の使用量レコードを取得（ロック内で呼び出す）"""
+        return self._ledger.setdefault(get_quota_date(), {"total": 0, "by_method": {}})
+
+    # ========================================
+    # 予約・実行
+    # ========================================
+    def reserve(self, method: str, count: int = 1) -> int:
+        """リクエストのユニットを予約して台帳に記録
+
+        Args:
+            method: メソッドID（例: "youtube.search.list"）
+            count: リクエスト数
+
+        Returns:
+            消費したユニット数
+
+        Raises:
+            QuotaExceededError: 日次上限を超える場合
+        """
+        cost = get_method_cost(method) * count
+        self._throttle(cost)
+
+        with self._lock:
+            usage = self._today_usage()
+            remaining = self.daily_budget - usage["total"]
+            if cost > remaining:
+                raise QuotaExceededError(method, cost, max(remaining, 0))
+
+            usage["total"] += cost
+            by_method = usage["by_method"]
+            by_method[method] = by_method.get(method, 0) + cost
+            self._recent.append((time.monotonic(), cost))
+            self._dirty = True
+            should_save = time.monotonic() - self._last_save >= self.SAVE_INTERVAL
+
+        if should_save:
+            self._save()
+        return cost
+
+    def refund(self, method: str, count: int = 1) -> int:
+        """予約したが送信しなかったリクエストのユニットを台帳から戻す
+
+        Args:
+            method: メソッドID（reserve()と同じもの）
+            count: 送信しなかったリクエスト数
+
+        Returns:
+            戻したユニット数
+        """
+        cost = get_method_cost(method) * count
+        with self._lock:
+            usage = self._today_usage()
+            by_method = usage["by_method"]
+            cost = min(cost, by_method.get(method, 0))
+            if cost <= 0:
+                return 0
+            usage["total"] -= cost
+            by_method[method] -= cost
+            self._dirty = True
+        return cost
+
+    def _throttle(self, cost: int):
+        """1分あたりの上限を超える場合は待機"""
+        if not self.max_units_per_minute:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._recent and now - self._recent[0][0] >= 60:
+                    self._recent.popleft()
+                used = sum(units for _, units in self._recent)
+                if used + cost <= self.max_units_per_minute or not self._recent:
+                    return
+                wait = 60 - (now - self._recent[0][0])
+            time.sleep(max(wait, 0.05))
+
+    def execute(
+        self,
+        request,
+        http=None,
+        retry_policy: Optional[RetryPolicy] = None,
+        reserved: bool = False,
+    ) -> dict:
+        """ユニットを予約してからAPIリクエストを実行
+
+        レート制限（403 rateLimitExceeded・429）や5xxエラーの場合は
+        RetryPolicyに従って待機・再試行する。再試行ごとにユニットを予約する。
+
+        Args:
+            request: googleapiclientのHttpRequest
+            http: 使用するHTTPトランスポート（省略時はリクエスト既定）
+            retry_policy: 再試行ポリシー（省略時は既定のポリシー）
+            reserved: Trueの場合、最初の試行のユニットはreserve()で予約済みとして扱う
+        """
+        method = getattr(request, "methodId", None) or "unknown"
+
+        def attempt() -> dict:
+            nonlocal reserved
+            if reserved:
+                reserved = False
+            else:
+                self.reserve(method)
+            if http is None:
+                return request.execute()
+            return request.execute(http=http)
+
+        return (retry_policy or get_retry_policy()).call(attempt, label="youtube")
+
+    # ========================================
+    # 使用量・見積もり
+    # ========================================
+    def get_usage_today(self) -> int:
+        """今日の使用ユニット数を取得"""
+        with self._lock:
+            return self._ledger.get(get_quota_date(), {}).get("total", 0)
+
+    def get_remaining(self) -> int:
+        """今日の残りユニット数を取得"""
+        return max(self.daily_budget - self.get_usage_today(), 0)
+
+    def get_usage_by_method(self) -> dict[str, int]:
+        """今日のメソッド別使用ユニット数を取得"""
+        with self._lock:
+            return dict(self._ledger.get(get_quota_date(), {}).get("by_method", {}))
+
+    def get_history(self) -> dict[str, int]:
+        """日付別の使用ユニット数を取得"""
+        with self._lock:
+            return {day: usage.get("total", 0) for day, usage in sorted(self._ledger.items())}
+
+    def can_afford(self, units: int) -> bool:
+        """指定ユニット数を今日の残りで実行できるか"""
+        return units <= self.get_remaining()
+
+
+def estimate_search_cost(
+    max_results: int,
+    include_channels: bool = False,
+    precision=None,
+    category: Optional[str] = None,
+) -> int:
+    """検索のクォータコストを見積もる
+
+    YouTubeClient.search_videos_advanced と同じ方法で検索する場合の件数で見積もる。
+        標準: max_results件を50件ずつ検索
+        高精度: 絞り込みで減るため max_results×HIGH_PRECISION_SEARCH_FACTOR件を検索
+        最高精度: 公式チャンネルごとに最低1回検索
+
+    Args:
+        max_results: 取得する最大動画数
+        include_channels: チャンネル情報の取得（高精度検索）を含めるか
+        precision: 検索精度（SearchPrecisionまたはその値、None=標準）
+        category: カテゴリ名（最高精度で検索する公式チャンネルの選択に使う）
+    """
+    # youtube_clientはこのモジュールをインポートするため、列挙値の値で比較する
+    level = getattr(precision, "value", precision) or "standard"
+    # 取得した動画のチャンネル情報は50件ずつ取得する
+    channel_pages = max(math.ceil(max_results / 50), 1)
+
+    if level == "high":
+        pages = max(math.ceil(max_results * HIGH_PRECISION_SEARCH_FACTOR / 50), 1)
+    elif level == "highest":
+        channel_count = len(get_official_channel_ids(category))
+        if not channel_count:
+            # 公式チャンネルがない場合は検索しない
+            return 0
+        pages = max(channel_count, math.ceil(max_results / 50))
+    else:
+        pages = max(math.ceil(max_results / 50), 1)
+
+    cost = pages * get_method_cost("youtube.search.list")
+    cost += pages * get_method_cost("youtube.videos.list")
+    if include_channels:
+        cost += channel_pages * get_method_cost("youtube.channels.list")
+    return cost
+
+
+def estimate_playlist_creation_cost(video_count: int, preserve_order: bool = True) -> int:
+    """再生リスト作成と動画追加のクォータコストを見積もる
+
+    preserve_order=Trueの場合は、追加後の並び替えで全動画を移動する
+    最悪の場合（video_count-1回の playlistItems.update）を含める。
+    """
+    cost = get_method_cost("youtube.playlists.insert")
+    cost += video_count * get_method_cost("youtube.playlistItems.insert")
+    if preserve_order and video_count:
+        cost += math.ceil(video_count / 50) * get_method_cost("youtube.playlistItems.list")
+        cost += (video_count - 1) * get_method_cost("youtube.playlistItems.update")
+    return cost
+
+
+def estimate_random_run_cost(
+    count: int,
+    include_channels: bool = False,
+    precision=None,
+    category: Optional[str] = None,
+) -> int:
+    """ランダム選択で再生リストを作成する実行全体のクォータコストを見積もる
+
+    Args:
+        count: 再生リストに追加する動画数（検索はcount×5本、最大200本）
+        include_channels: チャンネル情報の取得（高精度検索）を含めるか
+        precision: 検索精度（SearchPrecisionまたはその値、None=標準）
+        category: カテゴリ名（最高精度の見積もりに使う）
+    """
+    search_count = min(count * 5, 200)
+    return (
+        estimate_search_cost(search_count, include_channels, precision, category)
+        + estimate_playlist_creation_cost(count)
+    )
+
+
+# グローバルインスタンス
+_quota_scheduler: Optional[QuotaScheduler] = None
+
+
+def get_quota_scheduler() -> QuotaScheduler:
+    """QuotaSchedulerのシングルトンインスタンスを取得"""
+    global _quota_scheduler
+    if _quota_scheduler is None:
+        _quota_scheduler = QuotaScheduler()
+        atexit.register(_quota_scheduler.flush)
+    return _quota_scheduler
@@ -0,0 +1,223 @@
+"""リトライ制御モジュール - 一時的なAPIエラーを指数バックオフで再試行"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import json
+import random
+import socket
+import threading
+import time
+import urllib.error
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# 再試行するHTTPステータス
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+
+# 403でも再試行する理由（YouTube Data APIのerrors[].reason）
+# quotaExceeded（日次クォータ超過）は待っても回復しないため含めない
+RETRYABLE_REASONS = {
+    "rateLimitExceeded",
+    "userRateLimitExceeded",
+    "backendError",
+    "internalError",
+}
+
+
+def _get_status_and_headers(error: Exception) -> tuple[Optional[int], dict]:
+    """例外からHTTPステータスとヘッダーを取得"""
+    # googleapiclient.errors.HttpError
+    resp = getattr(error, "resp", None)
+    if resp is not None:
+        status = getattr(resp, "status", None)
+        headers = {str(k).lower(): v for k, v in dict(resp).items()} if hasattr(resp, "items") else {}
+        return (int(status) if status is not None else None), headers
+
+    # urllib.error.HTTPError
+    if isinstance(error, urllib.error.HTTPError):
+        headers = {k.lower(): v for k, v in (error.headers or {}).items()}
+        return error.code, headers
+
+    return None, {}
+
+
+def _get_error_reasons(error: Exception) -> set[str]:
+    """googleapiclientのHttpErrorからerrors[].reasonを取得"""
+    content = getattr(error, "content", None)
+    if not content:
+        return set()
+    try:
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+        data = json.loads(content)
+    except (ValueError, UnicodeDecodeError):
+        return set()
+    errors = data.get("error", {}).get("errors", []) if isinstance(data, dict) else []
+    return {e.get("reason", "") for e in errors if isinstance(e, dict)}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-Afterヘッダー（秒数またはHTTP日付）を秒数に変換"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_error(error: Exception) -> tuple[bool, Optional[float]]:
+    """例外が再試行可能かを判定
+
+    Returns:
+        (再試行可能か, Retry-Afterで指定された待機秒数)
+    """
+    status, headers = _get_status_and_headers(error)
+    if status is not None:
+        retry_after = parse_retry_after(headers.get("retry-after"))
+        if status in RETRYABLE_STATUSES:
+            return True, retry_after
+        if status == 403:
+            return bool(_get_error_reasons(error) & RETRYABLE_REASONS), retry_after
+        return False, None
+
+    # 通信エラー（タイムアウト・接続リセットなど）は再試行する
+    if isinstance(error, (urllib.error.URLError, socket.timeout, ConnectionError, TimeoutError)):
+        return True, None
+    return False, None
+
+
+def is_retryable(error: Exception) -> bool:
+    """例外が再試行可能かどうか"""
+    return classify_error(error)[0]
+
+
+class RetryMetrics:
+    """リトライ回数の集計（スレッドセーフ）"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[str, int]] = {}
+
+    def _record(self, label: str, key: str):
+        with self._lock:
+            counters = self._counters.setdefault(
+                label, {"calls": 0, "retries": 0, "failures": 0}
+            )
+            counters[key] += 1
+
+    def record_call(self, label: str):
+        self._record(label, "calls")
+
+    def record_retry(self, label: str):
+        self._record(label, "retries")
+
+    def record_failure(self, label: str):
+        self._record(label, "failures")
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """ラベル別の集計を取得
+
+        Returns:
+            ラベル -> {calls: 呼び出し数, retries: 再試行回数, failures: 最終的な失敗数}
+        """
+        with self._lock:
+            return {label: dict(counters) for label, counters in self._counters.items()}
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+
+class RetryPolicy:
+    """指数バックオフ（フルジッター）による再試行ポリシー
+
+    再試行可能なエラー（429・5xx・403 rateLimitExceeded・通信エラー）のみ
+    再試行し、Retry-Afterヘッダーがある場合はその秒数を優先する。
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 32.0,
+        metrics: Optional[RetryMetrics] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.metrics = metrics or get_retry_metrics()
+        self._sleep = sleep
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """attempt回目（0始まり）の失敗後の待機秒数を計算"""
+        if retry_after is not None:
+            return min(retry_after, self.max_delay * 4)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def call(self, func: Callable[[], T], label: str = "default") -> T:
+        """関数を実行し、再試行可能なエラーの場合は待機して再実行
+
+        Args:
+            func: 実行する関数（引数なし）
+            label: メトリクス集計用のラベル（例: "youtube", "niconico"）
+
+        Raises:
+            再試行不可能なエラー、または最大試行回数に達した場合の最後のエラー
+        """
+        self.metrics.record_call(label)
+        attempt = 0
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                retryable, retry_after = classify_error(e)
+                if not retryable or attempt + 1 >= self.max_attempts:
+                    self.metrics.record_failure(label)
+                    raise
+                delay = self.get_delay(attempt, retry_after)
+                self.metrics.record_retry(label)
+                print(f"一時的なエラーのため{delay:.1f}秒後に再試行します ({label}, {attempt + 1}回目): {e}")
+                self._sleep(delay)
+                attempt += 1
+
+
+# グローバルインスタンス
+_retry_metrics: Optional[RetryMetrics] = None
+_retry_policy: Optional[RetryPolicy] = None
+
+
+def get_retry_metrics() -> RetryMetrics:
+    """RetryMetricsのシングルトンインスタンスを取得"""
+    global _retry_metrics
+    if _retry_metrics is None:
+        _retry_metrics = RetryMetrics()
+    return _retry_metrics
+
+
+def get_retry_policy() -> RetryPolicy:
+    """既定のRetryPolicyを取得"""
+    global _retry_policy
+    if _retry_policy is None:
+        _retry_policy = RetryPolicy()
+    return _retry_policy
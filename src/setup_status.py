@@ -0,0 +1,73 @@
+"""セットアップ状態モジュール - 初回セットアップの完了状態を確認"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import json
+
+from paths import (
+    CONFIG_PATH as CONFIG_DIR,
+    CLIENT_SECRET_FILE,
+    TOKEN_FILE,
+    SETUP_COMPLETE_FILE,
+)
+
+
+class SetupStatus:
+    """セットアップ状態管理"""
+
+    @staticmethod
+    def is_setup_complete() -> bool:
+        """セットアップが完了しているかチェック"""
+        if not SETUP_COMPLETE_FILE.exists():
+            return False
+        try:
+            with open(SETUP_COMPLETE_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+                return data.get("setup_complete", False)
+        except (json.JSONDecodeError, IOError):
+            return False
+
+    @staticmethod
+    def mark_setup_complete():
+        """セットアップ完了をマーク"""
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        with open(SETUP_COMPLETE_FILE, "w", encoding="utf-8") as f:
+            json.dump({
+                "setup_complete": True,
+                "version": "1.0",
+            }, f, indent=2)
+
+    @staticmethod
+    def reset_setup():
+        """セットアップ状態をリセット"""
+        if SETUP_COMPLETE_FILE.exists():
+            SETUP_COMPLETE_FILE.unlink()
+
+    @staticmethod
+    def has_client_secret() -> bool:
+        """client_secret.json が存在するかチェック"""
+        return CLIENT_SECRET_FILE.exists()
+
+    @staticmethod
+    def has_token() -> bool:
+        """token.pickle が存在するかチェック"""
+        return TOKEN_FILE.exists()
+
+    @staticmethod
+    def needs_setup() -> bool:
+        """セットアップが必要かチェック"""
+        if SetupStatus.is_setup_complete():
+            return False
+        # client_secret.json がない場合はセットアップ必要
+        if not SetupStatus.has_client_secret():
+            return True
+        return False
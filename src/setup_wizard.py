@@ -24,63 +24,10 @@ from paths import (
     CREDENTIALS_PATH as CREDENTIALS_DIR,
     CONFIG_PATH as CONFIG_DIR,
     CLIENT_SECRET_FILE,
-    TOKEN_FILE,
     NICONICO_AUTH_FILE,
-    SETUP_COMPLETE_FILE,
     ensure_directories,
 )
-
-
-class SetupStatus:
-    """セットアップ状態管理"""
-
-    @staticmethod
-    def is_setup_complete() -> bool:
-        """セットアップが完了しているかチェック"""
-        if not SETUP_COMPLETE_FILE.exists():
-            return False
-        try:
-            with open(SETUP_COMPLETE_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data.get("setup_complete", False)
-        except (json.JSONDecodeError, IOError):
-            return False
-
-    @staticmethod
-    def mark_setup_complete():
-        """セットアップ完了をマーク"""
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(SETUP_COMPLETE_FILE, "w", encoding="utf-8") as f:
-            json.dump({
-                "setup_complete": True,
-                "version": "1.0",
-            }, f, indent=2)
-
-    @staticmethod
-    def reset_setup():
-        """セットアップ状態をリセット"""
-        if SETUP_COMPLETE_FILE.exists():
-            SETUP_COMPLETE_FILE.unlink()
-
-    @staticmethod
-    def has_client_secret() -> bool:
-        """client_secret.json が存在するかチェック"""
-        return CLIENT_SECRET_FILE.exists()
-
-    @staticmethod
-    def has_token() -> bool:
-        """token.pickle が存在するかチェック"""
-        return TOKEN_FILE.exists()
-
-    @staticmethod
-    def needs_setup() -> bool:
-        """セットアップが必要かチェック"""
-        if SetupStatus.is_setup_complete():
-            return False
-        # client_secret.json がない場合はセットアップ必要
-        if not SetupStatus.has_client_secret():
-            return True
-        return False
+from setup_status import SetupStatus
 
 
 class SetupWizard:
@@ -728,12 +675,14 @@ class SetupWizard:
     def _run_youtube_auth(self):
         """YouTube認証を実行（バックグラウンド）"""
         try:
-            from auth import YouTubeAuthenticator
+            from auth import YouTubeAuthenticator, reset_authenticated_service
 
             authenticator = YouTubeAuthenticator()
             credentials = authenticator.get_credentials()
 
             if credentials:
+                # 以前の認証情報で作成済みのサービスを使わないようにする
+                reset_authenticated_service()
                 self.auth_success = True
                 self.window.after(0, lambda: self.auth_status_var.set("✓ 認証成功！"))
                 self.window.after(0, lambda: self.auth_status_label.config(foreground="green"))
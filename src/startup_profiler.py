@@ -0,0 +1,210 @@
+"""起動時間計測モジュール - モジュールごとのインポート時間と起動の各段階を記録"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ImportRecord:
+    """1モジュールのインポート時間"""
+    name: str
+    self_time: float  # このモジュール自身の実行時間（秒、子モジュールを除く）
+    total_time: float  # 子モジュールのインポートを含む時間（秒）
+
+
+class _TimedLoader:
+    """ローダーをラップして exec_module の時間を計測する"""
+
+    def __init__(self, loader, profiler: "StartupProfiler", name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+        self._create_time = 0.0
+
+    def create_module(self, spec):
+        # 拡張モジュールは create_module で初期化されるため、その時間も含める
+        started = time.perf_counter()
+        try:
+            return self._loader.create_module(spec)
+        finally:
+            self._create_time = time.perf_counter() - started
+
+    def exec_module(self, module):
+        self._profiler._enter(self._create_time)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(self._name)
+
+    def __getattr__(self, name):
+        # get_data / get_resource_reader などは元のローダーに任せる
+        return getattr(self._loader, name)
+
+
+class StartupProfiler:
+    """起動時のインポート時間を計測するプロファイラー
+
+    sys.meta_path の先頭にファインダーを追加し、以降にインポートされる
+    モジュールの実行時間を記録する。PyInstallerでビルドしたEXEでも動作する
+    （-X importtime は実行ファイルに渡せないため）。
+    """
+
+    def __init__(self, started_at: Optional[float] = None):
+        """
+        Args:
+            started_at: 起動時刻（time.perf_counter()の値、省略時は現在時刻）
+        """
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        self.records: list[ImportRecord] = []
+        self.marks: list[tuple[str, float]] = []  # (段階名, 起動からの経過秒)
+        self._local = threading.local()
+        self.installed = False
+
+    # ========================================
+    # インポートフック
+    # ========================================
+    def install(self) -> None:
+        """インポートの計測を開始"""
+        if not self.installed:
+            sys.meta_path.insert(0, self)
+            self.installed = True
+
+    def uninstall(self) -> None:
+        """インポートの計測を終了"""
+        if self.installed:
+            try:
+                sys.meta_path.remove(self)
+            except ValueError:
+                pass
+            self.installed = False
+
+    def find_spec(self, fullname, path, target=None):
+        """他のファインダーで見つけたspecのローダーを計測用に差し替える"""
+        if getattr(self._local, "finding", False):
+            return None
+
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def _enter(self, elapsed: float = 0.0) -> None:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        # [開始時刻, 子モジュールのインポートに使った時間]
+        stack.append([time.perf_counter() - elapsed, 0.0])
+
+    def _exit(self, name: str) -> None:
+        stack = self._local.stack
+        started, child_time = stack.pop()
+        total = time.perf_counter() - started
+        if stack:
+            stack[-1][1] += total
+        self.records.append(ImportRecord(name=name, self_time=total - child_time, total_time=total))
+
+    # ========================================
+    # 起動の段階
+    # ========================================
+    def mark(self, label: str) -> float:
+        """起動の段階を記録（例: "window_shown"）
+
+        Returns:
+            起動からの経過時間（秒）
+        """
+        elapsed = time.perf_counter() - self.started_at
+        self.marks.append((label, elapsed))
+        return elapsed
+
+    # ========================================
+    # 結果
+    # ========================================
+    def get_stats(self) -> dict:
+        """計測結果を取得"""
+        top_level = [r for r in self.records if "." not in r.name]
+        return {
+            "modules": len(self.records),
+            "import_time": sum(r.self_time for r in self.records),
+            "top_level_import_time": sum(r.total_time for r in top_level),
+            "marks": list(self.marks),
+        }
+
+    def format_report(self, limit: int = 25) -> str:
+        """計測結果をテキストで整形
+
+        Args:
+            limit: 表示するモジュール数（自身の実行時間が長い順）
+        """
+        stats = self.get_stats()
+        lines = [
+            "",
+            "=" * 60,
+            "起動プロファイル",
+            "=" * 60,
+            f"インポートしたモジュール: {stats['modules']}件 / 合計 {stats['import_time'] * 1000:.1f}ms",
+        ]
+
+        if self.marks:
+            lines.append("")
+            lines.append("起動の段階（起動からの経過時間）:")
+            for label, elapsed in self.marks:
+                lines.append(f"  {elapsed * 1000:8.1f}ms  {label}")
+
+        slowest = sorted(self.records, key=lambda r: r.self_time, reverse=True)[:limit]
+        if slowest:
+            lines.append("")
+            lines.append(f"インポート時間 上位{len(slowest)}件:")
+            lines.append(f"  {'自身(ms)':>9}  {'累積(ms)':>9}  モジュール")
+            for record in slowest:
+                lines.append(
+                    f"  {record.self_time * 1000:9.1f}  {record.total_time * 1000:9.1f}  {record.name}"
+                )
+        lines.append("=" * 60)
+        return "\n".join(lines)
+
+    def print_report(self, limit: int = 25) -> None:
+        """計測結果を表示"""
+        print(self.format_report(limit))
+
+
+# グローバルインスタンス（--profile-startup 指定時のみ作成）
+_startup_profiler: Optional[StartupProfiler] = None
+
+
+def start_startup_profiler(started_at: Optional[float] = None) -> StartupProfiler:
+    """起動プロファイラーを作成して計測を開始"""
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = StartupProfiler(started_at)
+        _startup_profiler.install()
+    return _startup_profiler
+
+
+def get_startup_profiler() -> Optional[StartupProfiler]:
+    """起動プロファイラーを取得（計測していない場合はNone）"""
+    return _startup_profiler
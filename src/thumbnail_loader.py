@@ -0,0 +1,256 @@
+"""サムネイル読み込みモジュール - バックグラウンドで取得・キャッシュしてTkに表示"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import base64
+import hashlib
+import io
+import threading
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from paths import THUMBNAIL_CACHE_PATH
+from retry_policy import RetryPolicy
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+# Pillowなしでも Tk が直接表示できる形式
+_PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+_GIF_MAGICS = (b"GIF87a", b"GIF89a")
+
+
+def get_youtube_thumbnail_url(video_id: str) -> str:
+    """YouTube動画のサムネイルURL（320x180）を取得"""
+    return f"https://i.ytimg.com/vi/{video_id}/mqdefault.jpg"
+
+
+def _create_photo_image(data: str):
+    """Base64エンコードされた画像からPhotoImageを作成（Tkスレッドで呼ぶ）"""
+    import tkinter as tk
+    return tk.PhotoImage(data=data)
+
+
+class ThumbnailLoader:
+    """サムネイルをバックグラウンドで取得するローダー
+
+    - 取得・デコード・縮小はワーカースレッドで行い、Tkスレッドをブロックしない
+    - 取得した画像はURLとは別に内容のハッシュで保存する（同じ画像は1ファイル）
+    - 作成済みのPhotoImageは件数上限つきのLRUで保持する
+    - 待機中のリクエストが多すぎる場合は古いものから破棄する
+      （スクロールで画面外に出た行の取得を後回しにしないため、新しい順に処理）
+
+    request() と結果のコールバックはTkスレッドで実行される。
+    ワーカーからTkスレッドへの受け渡しには dispatch（例: UIUpdateQueue.post）を使う。
+    """
+
+    def __init__(
+        self,
+        dispatch: Callable[..., None],
+        cache_dir: Optional[Path] = None,
+        max_workers: int = 4,
+        max_memory_items: int = 300,
+        max_pending: int = 64,
+        size: tuple[int, int] = (120, 68),
+        timeout: float = 10.0,
+        image_factory: Optional[Callable[[str], Any]] = None,
+    ):
+        """
+        Args:
+            dispatch: dispatch(func, *args) でfuncをTkスレッドで実行する関数
+            cache_dir: ディスクキャッシュのディレクトリ
+            max_workers: 取得を行うワーカースレッド数
+            max_memory_items: メモリに保持するPhotoImageの最大数
+            max_pending: 待機できるリクエストの最大数
+            size: 表示サイズ（幅, 高さ）
+            timeout: 1回の取得のタイムアウト（秒）
+            image_factory: Base64画像から表示用オブジェクトを作成する関数（テスト用）
+        """
+        self._dispatch = dispatch
+        self.cache_dir = cache_dir or THUMBNAIL_CACHE_PATH
+        self.max_workers = max_workers
+        self.max_memory_items = max_memory_items
+        self.max_pending = max_pending
+        self.size = size
+        self.timeout = timeout
+        self._image_factory = image_factory or _create_photo_image
+        self._retry_policy = RetryPolicy(max_attempts=2, base_delay=0.5)
+
+        # Tkスレッドのみが操作する
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._waiters: dict[str, list[Callable[[Any], None]]] = {}
+
+        # ワーカーと共有する（_condで保護）
+        self._pending: deque[str] = deque()
+        self._cond = threading.Condition()
+        self._workers: list[threading.Thread] = []
+        self._closed = False
+
+    # ========================================
+    # Tkスレッド側
+    # ========================================
+    def request(self, url: str, callback: Callable[[Any], None]) -> None:
+        """サムネイルを要求（読み込み後にcallback(image)をTkスレッドで呼ぶ）
+
+        メモリにある場合はすぐにcallbackを呼ぶ。取得に失敗した場合は呼ばない。
+        """
+        if not url or self._closed:
+            return
+
+        image = self._memory.get(url)
+        if image is not None:
+            self._memory.move_to_end(url)
+            callback(image)
+            return
+
+        waiters = self._waiters.get(url)
+        if waiters is not None:
+            waiters.append(callback)
+            with self._cond:
+                # 再び要求されたURLは優先する
+                if url in self._pending:
+                    self._pending.remove(url)
+                    self._pending.append(url)
+            return
+
+        self._waiters[url] = [callback]
+        with self._cond:
+            self._pending.append(url)
+            while len(self._pending) > self.max_pending:
+                dropped = self._pending.popleft()
+                self._waiters.pop(dropped, None)
+            self._ensure_workers()
+            self._cond.notify()
+
+    def _complete(self, url: str, data: Optional[str]) -> None:
+        """ワーカーの結果を反映（Tkスレッド）"""
+        callbacks = self._waiters.pop(url, [])
+        if data is None or self._closed:
+            return
+        try:
+            image = self._image_factory(data)
+        except Exception as e:
+            print(f"サムネイル表示エラー ({url}): {e}")
+            return
+
+        self._memory[url] = image
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+        for callback in callbacks:
+            callback(image)
+
+    def close(self) -> None:
+        """ワーカーを停止"""
+        with self._cond:
+            self._closed = True
+            self._pending.clear()
+            self._cond.notify_all()
+
+    # ========================================
+    # ワーカー側
+    # ========================================
+    def _ensure_workers(self) -> None:
+        """ワーカースレッドを起動（_condを保持した状態で呼ぶ）"""
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f"thumbnail-{len(self._workers)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                # 新しく要求されたもの（画面に表示中の行）から処理する
+                url = self._pending.pop()
+
+            try:
+                data = self._decode(self._load_bytes(url))
+            except Exception as e:
+                print(f"サムネイル取得エラー ({url}): {e}")
+                data = None
+            self._dispatch(self._complete, url, data)
+
+    def _load_bytes(self, url: str) -> bytes:
+        """ディスクキャッシュまたはネットワークから画像を取得"""
+        index_path = self._index_path(url)
+        try:
+            content_hash = index_path.read_text(encoding="utf-8").strip()
+            return self._object_path(content_hash).read_bytes()
+        except (OSError, ValueError):
+            pass
+
+        data = self._retry_policy.call(lambda: self._fetch(url), label="thumbnail")
+        self._store(url, data)
+        return data
+
+    def _fetch(self, url: str) -> bytes:
+        # urllib.request は読み込みに時間がかかるため、起動時ではなく最初の取得時に読み込む
+        import urllib.request
+        request = urllib.request.Request(url, headers={"User-Agent": "youtube-playlist-manager"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return response.read()
+
+    def _store(self, url: str, data: bytes) -> None:
+        """画像を内容のハッシュで保存し、URLから参照できるようにする"""
+        content_hash = hashlib.sha256(data).hexdigest()
+        try:
+            object_path = self._object_path(content_hash)
+            if not object_path.exists():
+                _write_atomic(object_path, data)
+            _write_atomic(self._index_path(url), content_hash.encode("utf-8"))
+        except OSError as e:
+            print(f"サムネイルキャッシュ保存エラー: {e}")
+
+    def _index_path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / "index" / key[:2] / key
+
+    def _object_path(self, content_hash: str) -> Path:
+        if len(content_hash) != 64:
+            raise ValueError("invalid content hash")
+        return self.cache_dir / "objects" / content_hash[:2] / content_hash
+
+    def _decode(self, data: bytes) -> str:
+        """画像を表示サイズに縮小し、TkのPhotoImageで読めるBase64文字列にする"""
+        if PIL_AVAILABLE:
+            with Image.open(io.BytesIO(data)) as image:
+                image = image.convert("RGB")
+                image.thumbnail(self.size)
+                buffer = io.BytesIO()
+                image.save(buffer, format="PNG")
+            return base64.b64encode(buffer.getvalue()).decode("ascii")
+
+        # Pillowがない場合はTkが直接読めるPNG/GIFのみ表示する
+        if data.startswith(_PNG_MAGIC) or data.startswith(_GIF_MAGICS):
+            return base64.b64encode(data).decode("ascii")
+        raise ValueError("JPEGサムネイルの表示にはPillowが必要です")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """一時ファイルに書き込んでから置き換える"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,149 @@
+"""UI更新キューモジュール - ワーカースレッドからTkへの更新をまとめて反映"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+# 通常の更新（func(*args)を実行）
+_CALL = 0
+# まとめて反映する更新（連続する同じfuncの引数をリストにまとめて1回呼ぶ）
+_BATCHED = 1
+
+
+class UIUpdateQueue:
+    """スレッドセーフなUI更新キュー
+
+    ワーカースレッドは post() / post_batched() で更新を登録し、
+    Tkのメインスレッドで動く定期コールバックが1フレーム分の時間内で
+    まとめて反映する。キューが満杯の場合はワーカー側が待機する（バックプレッシャー）。
+
+    Tkスレッド自身が登録する場合は待機しない（待つとキューを処理するスレッドが
+    止まったままになる）。キューが満杯ならTkスレッド専用の退避先に追加し、
+    キューの後に順番どおり反映する。
+    """
+
+    def __init__(
+        self,
+        root,
+        interval_ms: int = 16,
+        frame_budget_ms: float = 8.0,
+        maxsize: int = 500,
+    ):
+        """
+        Args:
+            root: Tkのルートウィジェット
+            interval_ms: キューを確認する間隔（16ms ≒ 60fps）
+            frame_budget_ms: 1回のコールバックで更新に使う最大時間
+            maxsize: キューの最大件数（超えるとワーカースレッドのpost()が待機する）
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self.frame_budget = frame_budget_ms / 1000
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._pending: deque = deque()  # 前回のフレームで処理しきれなかった更新
+        self._overflow: deque = deque()  # キューが満杯のときにTkスレッドが登録した更新
+        self._after_id = None
+        self._closed = False
+
+    def start(self) -> None:
+        """定期コールバックを開始"""
+        self._closed = False
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def stop(self) -> None:
+        """定期コールバックを停止（待機中のワーカーも解放する）"""
+        self._closed = True
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def post(self, func: Callable, *args: Any) -> None:
+        """メインスレッドで func(*args) を実行するよう登録"""
+        self._put((_CALL, func, args))
+
+    def post_batched(self, func: Callable[[list], Any], item: Any) -> None:
+        """連続する同じfuncの更新をまとめて func([item, ...]) で実行するよう登録
+
+        ログ行の追加や進捗表示など、1件ずつ反映する必要がない更新に使う。
+        """
+        self._put((_BATCHED, func, item))
+
+    def _put(self, entry: tuple) -> None:
+        """キューに追加（満杯の場合は空くまで待機。Tkスレッドは待機しない）"""
+        if threading.current_thread() is threading.main_thread():
+            # 退避中の更新があれば、順番が入れ替わらないよう後ろに並べる
+            if not self._overflow:
+                try:
+                    self._queue.put_nowait(entry)
+                    return
+                except queue.Full:
+                    pass
+            self._overflow.append(entry)
+            return
+
+        while not self._closed:
+            try:
+                self._queue.put(entry, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _drain(self) -> None:
+        """キューの更新を1フレーム分の時間内で反映"""
+        self._after_id = None
+        deadline = time.perf_counter() + self.frame_budget
+
+        while time.perf_counter() < deadline:
+            if not self._pending:
+                self._pending = self._take_available()
+                if not self._pending:
+                    break
+            kind, func, payload = self._pending.popleft()
+            if kind == _BATCHED:
+                items = [payload]
+                # 連続する同じfuncの更新をまとめる
+                while self._pending and self._pending[0][0] == _BATCHED and self._pending[0][1] == func:
+                    items.append(self._pending.popleft()[2])
+                self._apply(func, (items,))
+            else:
+                self._apply(func, payload)
+
+        if not self._closed:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def _take_available(self) -> deque:
+        """キューにある更新をすべて取り出す（Tkスレッドの退避分はその後に続ける）"""
+        entries = deque()
+        while True:
+            try:
+                entries.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        entries.extend(self._overflow)
+        self._overflow.clear()
+        return entries
+
+    @staticmethod
+    def _apply(func: Callable, args: tuple) -> None:
+        """更新を実行（例外でコールバックが止まらないようにする）"""
+        try:
+            func(*args)
+        except Exception as e:
+            print(f"UI更新エラー: {e}")
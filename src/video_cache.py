@@ -0,0 +1,235 @@
+"""動画メタデータキャッシュモジュール - videos().list の結果をローカルに保存"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from paths import VIDEO_CACHE_FILE
+
+
+# part別の有効期限（秒）
+# snippet（タイトル・公開日など）はほぼ変わらないため長め、
+# statistics（視聴回数など）は変動するため短めに設定
+DEFAULT_PART_TTLS = {
+    "snippet": 7 * 24 * 60 * 60,      # 7日
+    "contentDetails": 7 * 24 * 60 * 60,
+    "status": 24 * 60 * 60,           # 1日
+    "statistics": 6 * 60 * 60,        # 6時間
+}
+
+# 未定義のpartに使用する有効期限
+DEFAULT_TTL = 24 * 60 * 60
+
+
+class VideoCache:
+    """動画IDとpartをキーにしたSQLiteキャッシュ
+
+    APIレスポンスの各itemをpart単位で保存し、
+    取得時はすべてのpartが有効期限内の場合のみヒットとみなす。
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        part_ttls: Optional[dict[str, int]] = None,
+    ):
+        self.db_path = db_path or VIDEO_CACHE_FILE
+        self.part_ttls = {**DEFAULT_PART_TTLS, **(part_ttls or {})}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # 統計カウンター
+        self.hits = 0
+        self.misses = 0
+        self.requests_saved = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """データベース接続を取得（初回のみテーブルを作成）"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS video_parts (
+                    video_id TEXT NOT NULL,
+                    part TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (video_id, part)
+                )
+                """
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get_ttl(self, part: str) -> int:
+        """partの有効期限（秒）を取得"""
+        return self.part_ttls.get(part, DEFAULT_TTL)
+
+    def get_many(self, video_ids: list[str], parts: list[str]) -> dict[str, dict]:
+        """キャッシュ済みの動画itemを取得
+
+        Args:
+            video_ids: 動画IDのリスト
+            parts: 必要なpartのリスト（例: ["snippet", "statistics"]）
+
+        Returns:
+            動画ID -> APIレスポンス形式のitem（ヒットしたもののみ）
+        """
+        if not video_ids:
+            return {}
+
+        now = time.time()
+        found: dict[str, dict] = {}
+        try:
+            with self._lock:
+                conn = self._connect()
+                placeholders = ",".join("?" for _ in video_ids)
+                part_placeholders = ",".join("?" for _ in parts)
+                rows = conn.execute(
+                    f"SELECT video_id, part, data, fetched_at FROM video_parts "
+                    f"WHERE video_id IN ({placeholders}) AND part IN ({part_placeholders})",
+                    [*video_ids, *parts],
+                ).fetchall()
+        except sqlite3.Error as e:
+            print(f"動画キャッシュ読み込みエラー: {e}")
+            rows = []
+
+        fresh_parts: dict[str, dict[str, object]] = {}
+        for video_id, part, data, fetched_at in rows:
+            if now - fetched_at > self.get_ttl(part):
+                continue
+            fresh_parts.setdefault(video_id, {})[part] = json.loads(data)
+
+        for video_id in video_ids:
+            cached = fresh_parts.get(video_id, {})
+            if all(part in cached for part in parts):
+                found[video_id] = {"id": video_id, **cached}
+
+        hit_count = len(found)
+        with self._lock:
+            self.hits += hit_count
+            self.misses += len(set(video_ids)) - hit_count
+        return found
+
+    def put_many(self, items: list[dict], parts: list[str]) -> None:
+        """APIレスポンスのitemをpart単位で保存
+
+        Args:
+            items: videos().list レスポンスの items
+            parts: リクエストしたpartのリスト
+        """
+        now = time.time()
+        rows = [
+            (item["id"], part, json.dumps(item[part], ensure_ascii=False), now)
+            for item in items
+            for part in parts
+            if part in item
+        ]
+        if not rows:
+            return
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.executemany(
+                    "INSERT OR REPLACE INTO video_parts (video_id, part, data, fetched_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"動画キャッシュ保存エラー: {e}")
+
+    def record_saved_request(self, count: int = 1) -> None:
+        """キャッシュによって省略したAPIリクエスト数を記録"""
+        with self._lock:
+            self.requests_saved += count
+
+    def purge_expired(self) -> int:
+        """期限切れのエントリーを削除
+
+        Returns:
+            削除した件数
+        """
+        now = time.time()
+        removed = 0
+        try:
+            with self._lock:
+                conn = self._connect()
+                for part, ttl in self.part_ttls.items():
+                    cursor = conn.execute(
+                        "DELETE FROM video_parts WHERE part = ? AND fetched_at < ?",
+                        (part, now - ttl),
+                    )
+                    removed += cursor.rowcount
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"動画キャッシュ削除エラー: {e}")
+        return removed
+
+    def clear(self) -> None:
+        """キャッシュをすべて削除"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM video_parts")
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"動画キャッシュ削除エラー: {e}")
+
+    def get_stats(self) -> dict[str, int]:
+        """ヒット/ミス統計を取得
+
+        Returns:
+            hits: キャッシュヒットした動画数
+            misses: APIから取得した動画数
+            requests_saved: 省略できた videos().list 呼び出し数（= 節約したクォータ単位）
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "requests_saved": self.requests_saved,
+            }
+
+    def reset_stats(self) -> None:
+        """統計カウンターをリセット"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.requests_saved = 0
+
+    def close(self) -> None:
+        """データベース接続を閉じる"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# グローバルインスタンス
+_video_cache: Optional[VideoCache] = None
+
+
+def get_video_cache() -> VideoCache:
+    """VideoCacheのシングルトンインスタンスを取得"""
+    global _video_cache
+    if _video_cache is None:
+        _video_cache = VideoCache()
+    return _video_cache
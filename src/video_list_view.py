@@ -0,0 +1,200 @@
+"""仮想スクロールリストモジュール - 表示中の行だけウィジェットを作成するリスト"""
+
+import sys
+import os
+
+# 親ディレクトリをパスに追加（通常のPython実行用）
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Optional, Protocol
+
+
+class ListRow(Protocol):
+    """VirtualListViewの行として使えるオブジェクト"""
+    widget: tk.Widget
+
+    def bind(self, item: Any, index: int) -> None:
+        """行に項目の内容を表示（indexは0始まり）"""
+        ...
+
+
+class VirtualListView(ttk.Frame):
+    """表示中の行だけウィジェットを作成する仮想スクロールリスト
+
+    行ウィジェットは画面に収まる数だけ作成して使い回し、
+    スクロール時は位置と表示内容のみを差し替える。
+    項目が20件でも2,000件でも、作成されるウィジェット数は変わらない。
+    """
+
+    def __init__(
+        self,
+        parent,
+        row_factory: Callable[[tk.Widget], ListRow],
+        row_height: int,
+        height: int = 150,
+        row_gap: int = 4,
+        **kwargs,
+    ):
+        """
+        Args:
+            parent: 親ウィジェット
+            row_factory: 行オブジェクトを作成する関数（引数は親ウィジェット）
+            row_height: 1行の高さ（px、行間を含む）
+            height: リストの初期の高さ（px）
+            row_gap: 行間（px）
+        """
+        super().__init__(parent, **kwargs)
+        self.row_factory = row_factory
+        self.row_height = row_height
+        self.row_gap = row_gap
+
+        self._items: list = []
+        self._rows: list[tuple[ListRow, int]] = []  # (行オブジェクト, キャンバス上のウィンドウID)
+        self._bound: dict[int, int] = {}  # 行の番号 -> 表示中の項目のインデックス
+        self._message_id: Optional[int] = None
+
+        self.canvas = tk.Canvas(
+            self,
+            height=height,
+            highlightthickness=0,
+            yscrollincrement=max(row_height // 4, 1),
+        )
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.bind_scroll_events(self.canvas)
+
+    # ========================================
+    # 項目の操作
+    # ========================================
+    def set_items(self, items: list) -> None:
+        """表示する項目を置き換えて先頭にスクロール"""
+        self._items = list(items)
+        self._bound.clear()
+        self.hide_message()
+        self._update_scrollregion()
+        self.canvas.yview_moveto(0)
+        self._refresh()
+
+    def extend(self, items: list) -> None:
+        """項目を末尾に追加"""
+        self._items.extend(items)
+        self.hide_message()
+        self._update_scrollregion()
+        self._refresh()
+
+    def clear(self) -> None:
+        """すべての項目を削除"""
+        self.set_items([])
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def show_message(self, text: str, foreground: str = "gray") -> None:
+        """項目の代わりにメッセージを表示（読み込み中・エラーなど）"""
+        self.hide_message()
+        self._message_id = self.canvas.create_text(
+            10, 10, text=text, anchor="nw", fill=foreground, font=("", 11),
+        )
+
+    def hide_message(self) -> None:
+        """メッセージを消去"""
+        if self._message_id is not None:
+            self.canvas.delete(self._message_id)
+            self._message_id = None
+
+    # ========================================
+    # スクロール
+    # ========================================
+    def bind_scroll_events(self, widget: tk.Widget) -> None:
+        """ウィジェットとその子要素でマウスホイールがこのリストをスクロールするようにする"""
+        widget.bind("<MouseWheel>", self._on_mousewheel)
+        widget.bind("<Button-4>", self._on_mousewheel)
+        widget.bind("<Button-5>", self._on_mousewheel)
+        for child in widget.winfo_children():
+            self.bind_scroll_events(child)
+
+    def _on_mousewheel(self, event):
+        if getattr(event, "num", None) == 4:
+            delta = -1
+        elif getattr(event, "num", None) == 5:
+            delta = 1
+        else:
+            delta = int(-1 * (event.delta / 120)) or (-1 if event.delta > 0 else 1)
+        self.canvas.yview_scroll(delta * 4, "units")
+        return "break"
+
+    def _on_yscroll(self, first, last) -> None:
+        """キャンバスの表示位置が変わったときに行を差し替える"""
+        self.scrollbar.set(first, last)
+        self._refresh()
+
+    def _on_configure(self, event) -> None:
+        """リストの幅・高さが変わったときに行を合わせる"""
+        for _, window_id in self._rows:
+            self.canvas.itemconfigure(window_id, width=event.width)
+        self._update_scrollregion()
+        self._refresh()
+
+    def _update_scrollregion(self) -> None:
+        width = self.canvas.winfo_width()
+        self.canvas.configure(scrollregion=(0, 0, width, len(self._items) * self.row_height))
+
+    # ========================================
+    # 行の再利用
+    # ========================================
+    def _ensure_rows(self, count: int) -> None:
+        """行オブジェクトをcount個まで作成"""
+        if len(self._rows) >= count:
+            return
+        width = self.canvas.winfo_width()
+        while len(self._rows) < count:
+            row = self.row_factory(self.canvas)
+            window_id = self.canvas.create_window(
+                0, -self.row_height * 2,
+                window=row.widget,
+                anchor="nw",
+                width=width,
+                height=self.row_height - self.row_gap,
+            )
+            self.bind_scroll_events(row.widget)
+            self._rows.append((row, window_id))
+        # 行数が変わると項目と行の対応が変わるため、すべて再表示する
+        self._bound.clear()
+
+    def _refresh(self) -> None:
+        """表示範囲の項目を行に割り当てる"""
+        top = self.canvas.canvasy(0)
+        view_height = max(self.canvas.winfo_height(), int(self.canvas.cget("height")))
+        first = max(int(top // self.row_height), 0)
+        last = min(int((top + view_height) // self.row_height) + 1, len(self._items))
+
+        self._ensure_rows(last - first)
+        pool_size = len(self._rows)
+        visible_slots = set()
+        for index in range(first, last):
+            # 項目のインデックスから行を決める（1行スクロールしても差し替えは1行のみ）
+            slot = index % pool_size
+            visible_slots.add(slot)
+            row, window_id = self._rows[slot]
+            if self._bound.get(slot) != index:
+                row.bind(self._items[index], index)
+                self._bound[slot] = index
+            self.canvas.coords(window_id, 0, index * self.row_height)
+
+        for slot, (_, window_id) in enumerate(self._rows):
+            if slot not in visible_slots:
+                # 表示範囲外（スクロール領域の上）に退避
+                self.canvas.coords(window_id, 0, -self.row_height * 2)
+                self._bound.pop(slot, None)
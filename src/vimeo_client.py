@@ -1,13 +1,14 @@
 """Vimeo API クライアントモジュール"""
 
-import json
-import urllib.request
-import urllib.parse
+import urllib.error
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Generator
 import os
 
+from http_pool import PooledHTTPTransport, get_http_transport
+from retry_policy import RetryPolicy, get_retry_policy
+
 
 @dataclass
 class VimeoVideoInfo:
@@ -73,12 +74,21 @@ class VimeoClient:
 
     BASE_URL = "https://api.vimeo.com"
 
-    def __init__(self, access_token: Optional[str] = None):
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        transport: Optional[PooledHTTPTransport] = None,
+    ):
         """
         Args:
             access_token: Vimeo APIアクセストークン
                           環境変数 VIMEO_ACCESS_TOKEN からも取得可能
+            retry_policy: 一時的なエラーの再試行ポリシー（省略時は既定のポリシー）
+            transport: HTTP接続プール（省略時は共有のプール）
         """
+        self.retry_policy = retry_policy or get_retry_policy()
+        self.transport = transport or get_http_transport()
         self.access_token = access_token or os.getenv("VIMEO_ACCESS_TOKEN")
         if not self.access_token:
             print("警告: Vimeoアクセストークンが設定されていません")
@@ -89,18 +99,17 @@ class VimeoClient:
             return None
 
         url = f"{self.BASE_URL}{endpoint}"
-        if params:
-            url += "?" + urllib.parse.urlencode(params)
-
         headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Accept": "application/vnd.vimeo.*+json;version=3.4",
         }
 
+        def fetch() -> dict:
+            return self.transport.get_json(url, params=params, headers=headers)
+
         try:
-            request = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(request, timeout=30) as response:
-                return json.loads(response.read().decode("utf-8"))
+            # 429（レート制限）や5xxはRetry-Afterに従って再試行する
+            return self.retry_policy.call(fetch, label="vimeo")
         except urllib.error.HTTPError as e:
             print(f"Vimeo API HTTPエラー: {e.code} - {e.reason}")
             return None
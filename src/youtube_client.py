@@ -11,22 +11,32 @@ if parent_dir not in sys.path:
 if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
-from dataclasses import dataclass, field
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Optional, Iterator
 from enum import Enum
 from googleapiclient.discovery import Resource
 
-from auth import get_authenticated_service
+from auth import get_authenticated_service, create_authorized_http
+from video_cache import VideoCache, get_video_cache
+from channel_cache import ChannelCache, get_channel_cache
+from quota_manager import QuotaScheduler, get_quota_scheduler
+from quality_scorer import score_video
 from config import (
     get_official_channel_ids,
-    is_official_channel_by_id,
     is_official_channel,
-    get_official_channel_score,
-    ALL_OFFICIAL_CHANNEL_IDS,
+    HIGH_PRECISION_SEARCH_FACTOR,
 )
 
 
+# チャンネル並行検索でワーカーの終了を通知する番兵
+_CHANNEL_DONE = object()
+
+
 class SearchPrecision(Enum):
     """検索精度レベル"""
     STANDARD = "standard"        # 通常の検索 + 公式優先
@@ -76,6 +86,7 @@ class VideoInfo:
         スコアリング基準:
         - 公式チャンネル（IDベース）: +100点
         - 公式チャンネル（名前ベース）: +50点
+        - タイトル・チャンネル名ベースの公式スコア: その半分
         - 認証済み: +50点
         - 登録者100万人以上: +30点
         - 登録者10万人以上: +15点
@@ -85,40 +96,8 @@ class VideoInfo:
         Returns:
             品質スコア（0-250）
         """
-        score = 0
-
-        # 公式チャンネルID判定（最高スコア）
-        if is_official_channel_by_id(self.channel_id):
-            score += 100
-
-        # 公式チャンネル名判定
-        if is_official_channel(self.channel_title):
-            score += 50
-
-        # タイトル・チャンネル名ベースの公式スコア
-        name_score = get_official_channel_score(self.channel_title, self.title)
-        score += name_score // 2  # 重複を避けるため半分
-
-        # 認証済みチャンネル
-        if self.is_verified:
-            score += 50
-
-        # 登録者数
-        if self.subscriber_count:
-            if self.subscriber_count >= 1_000_000:
-                score += 30
-            elif self.subscriber_count >= 100_000:
-                score += 15
-
-        # 視聴回数
-        if self.view_count:
-            if self.view_count >= 1_000_000:
-                score += 20
-            elif self.view_count >= 100_000:
-                score += 10
-
-        self.quality_score = min(score, 250)
-        return self.quality_score
+        # 一括計算（quality_scorer.score_videos）と同じ式を1件分で使う
+        return score_video(self)
 
 
 @dataclass
@@ -133,8 +112,28 @@ class PlaylistInfo:
 class YouTubeClient:
     """YouTube Data API v3のラッパークラス"""
 
-    def __init__(self, service: Optional[Resource] = None):
+    # パイプラインモードで詳細取得を先行実行するワーカー数
+    PIPELINE_WORKERS = 2
+
+    # 最高精度検索で同時に検索する公式チャンネル数
+    CHANNEL_FANOUT_WORKERS = 8
+    # 最高精度検索で1リクエストあたりに予約する最小件数
+    # （小さくしすぎると検索リクエスト（1回100ユニット）の回数が増える）
+    CHANNEL_FANOUT_MIN_PAGE_SIZE = 5
+
+    def __init__(
+        self,
+        service: Optional[Resource] = None,
+        video_cache: Optional[VideoCache] = None,
+        use_cache: bool = True,
+        quota_scheduler: Optional[QuotaScheduler] = None,
+        channel_cache: Optional[ChannelCache] = None,
+    ):
         self._service = service
+        self._video_cache = (video_cache or get_video_cache()) if use_cache else None
+        self._channel_cache = (channel_cache or get_channel_cache()) if use_cache else None
+        self._quota = quota_scheduler or get_quota_scheduler()
+        self._thread_local = threading.local()
 
     @property
     def service(self) -> Resource:
@@ -143,6 +142,23 @@ class YouTubeClient:
             self._service = get_authenticated_service()
         return self._service
 
+    def _get_thread_http(self):
+        """スレッドごとの認証済みHTTPトランスポートを取得
+
+        httplib2はスレッドセーフではないため、ワーカースレッドから
+        リクエストを実行する場合はスレッドごとに専用のHttpを使用する。
+        作成できない場合はNone（サービス既定のHttpを使用）。
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = create_authorized_http(self.service)
+            self._thread_local.http = http
+        return http
+
+    def _execute(self, request) -> dict:
+        """クォータを予約してAPIリクエストを実行（スレッドごとのHttpを使用）"""
+        return self._quota.execute(request, http=self._get_thread_http())
+
     def get_liked_videos(self, max_results: int = 50) -> Iterator[VideoInfo]:
         """高く評価した動画を取得"""
         return self._get_playlist_videos("LL", max_results)
@@ -167,7 +183,7 @@ class YouTubeClient:
                 maxResults=min(50, max_results - fetched_count),
                 pageToken=next_page_token,
             )
-            response = request.execute()
+            response = self._execute(request)
 
             video_ids = [
                 item["contentDetails"]["videoId"]
@@ -193,6 +209,8 @@ class YouTubeClient:
     ) -> list[VideoInfo]:
         """複数の動画IDから詳細情報を取得
 
+        キャッシュが有効な場合、有効期限内の動画はAPIを呼び出さずに返す。
+
         Args:
             video_ids: 動画IDのリスト
             include_statistics: 統計情報（視聴回数など）を含めるか
@@ -204,59 +222,98 @@ class YouTubeClient:
         if include_statistics:
             parts.append("statistics")
 
-        request = self.service.videos().list(
-            part=",".join(parts),
-            id=",".join(video_ids),
-        )
-        response = request.execute()
+        # キャッシュ済みの動画を取得し、未取得・期限切れのIDのみAPIに問い合わせる
+        cached_items: dict[str, dict] = {}
+        if self._video_cache is not None:
+            cached_items = self._video_cache.get_many(video_ids, parts)
+
+        missing_ids = list(dict.fromkeys(
+            video_id for video_id in video_ids if video_id not in cached_items
+        ))
+        fetched_items: dict[str, dict] = {}
+        for i in range(0, len(missing_ids), 50):
+            batch = missing_ids[i:i+50]
+            request = self.service.videos().list(
+                part=",".join(parts),
+                id=",".join(batch),
+            )
+            response = self._execute(request)
+            items = response.get("items", [])
+            for item in items:
+                fetched_items[item["id"]] = item
+            if self._video_cache is not None:
+                self._video_cache.put_many(items, parts)
+
+        if self._video_cache is not None:
+            # キャッシュがなければ必要だったリクエスト数との差分を記録
+            required_requests = (len(set(video_ids)) + 49) // 50
+            issued_requests = (len(missing_ids) + 49) // 50
+            self._video_cache.record_saved_request(required_requests - issued_requests)
 
         videos = []
-        for item in response.get("items", []):
-            snippet = item["snippet"]
-            published_at = datetime.fromisoformat(
-                snippet["publishedAt"].replace("Z", "+00:00")
-            )
+        for video_id in video_ids:
+            item = cached_items.get(video_id) or fetched_items.get(video_id)
+            if item is not None:
+                videos.append(self._parse_video_item(item, include_statistics))
+        return videos
 
-            # 統計情報を取得
-            view_count = None
-            like_count = None
-            if include_statistics and "statistics" in item:
-                stats = item["statistics"]
-                view_count = int(stats.get("viewCount", 0)) if stats.get("viewCount") else None
-                like_count = int(stats.get("likeCount", 0)) if stats.get("likeCount") else None
+    def _parse_video_item(self, item: dict, include_statistics: bool = False) -> VideoInfo:
+        """videos().list レスポンスのitemからVideoInfoを作成"""
+        snippet = item["snippet"]
+        published_at = datetime.fromisoformat(
+            snippet["publishedAt"].replace("Z", "+00:00")
+        )
 
-            videos.append(VideoInfo(
-                video_id=item["id"],
-                title=snippet["title"],
-                description=snippet.get("description", ""),
-                published_at=published_at,
-                channel_id=snippet["channelId"],
-                channel_title=snippet["channelTitle"],
-                category_id=int(snippet.get("categoryId")) if snippet.get("categoryId") else None,
-                tags=snippet.get("tags"),
-                view_count=view_count,
-                like_count=like_count,
-            ))
-        return videos
+        # 統計情報を取得
+        view_count = None
+        like_count = None
+        if include_statistics and "statistics" in item:
+            stats = item["statistics"]
+            view_count = int(stats.get("viewCount", 0)) if stats.get("viewCount") else None
+            like_count = int(stats.get("likeCount", 0)) if stats.get("likeCount") else None
+
+        return VideoInfo(
+            video_id=item["id"],
+            title=snippet["title"],
+            description=snippet.get("description", ""),
+            published_at=published_at,
+            channel_id=snippet["channelId"],
+            channel_title=snippet["channelTitle"],
+            category_id=int(snippet.get("categoryId")) if snippet.get("categoryId") else None,
+            tags=snippet.get("tags"),
+            view_count=view_count,
+            like_count=like_count,
+        )
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """動画キャッシュのヒット/ミス統計を取得"""
+        if self._video_cache is None:
+            return {"hits": 0, "misses": 0, "requests_saved": 0}
+        return self._video_cache.get_stats()
 
     def get_video_info(self, video_id: str) -> Optional[VideoInfo]:
         """単一の動画情報を取得"""
         videos = self._get_videos_details([video_id])
         return videos[0] if videos else None
 
-    def get_my_playlists(self, max_results: int = 50) -> list[PlaylistInfo]:
-        """自分の再生リスト一覧を取得"""
+    def get_my_playlists(self, max_results: Optional[int] = 50) -> list[PlaylistInfo]:
+        """自分の再生リスト一覧を取得
+
+        Args:
+            max_results: 取得する最大件数（Noneの場合はすべてのページを取得）
+        """
         playlists = []
         next_page_token = None
 
-        while len(playlists) < max_results:
+        while max_results is None or len(playlists) < max_results:
+            page_size = 50 if max_results is None else min(50, max_results - len(playlists))
             request = self.service.playlists().list(
                 part="snippet,contentDetails",
                 mine=True,
-                maxResults=min(50, max_results - len(playlists)),
+                maxResults=page_size,
                 pageToken=next_page_token,
             )
-            response = request.execute()
+            response = self._execute(request)
 
             for item in response.get("items", []):
                 playlists.append(PlaylistInfo(
@@ -280,6 +337,7 @@ class YouTubeClient:
         published_before: Optional[datetime] = None,
         video_category_id: Optional[str] = None,
         region_code: Optional[str] = None,
+        pipelined: bool = False,
     ) -> Iterator[VideoInfo]:
         """動画を検索
 
@@ -290,31 +348,59 @@ class YouTubeClient:
             published_before: この日時以前に公開された動画
             video_category_id: YouTubeカテゴリID（例: "10"=Music, "24"=Entertainment）
             region_code: ISO 3166-1 alpha-2国コード（例: "JP"=日本, "US"=アメリカ）
+            pipelined: Trueの場合、検索ページ取得と詳細取得を並行実行する
         """
+        request_params = {
+            "part": "snippet",
+            "q": query,
+            "type": "video",
+        }
+        if published_after:
+            request_params["publishedAfter"] = published_after.isoformat() + "Z"
+        if published_before:
+            request_params["publishedBefore"] = published_before.isoformat() + "Z"
+        if video_category_id:
+            request_params["videoCategoryId"] = video_category_id
+        if region_code:
+            request_params["regionCode"] = region_code
+
+        yield from self._iter_search_results(
+            request_params,
+            max_results,
+            pipelined=pipelined,
+        )
+
+    def _iter_search_results(
+        self,
+        request_params: dict,
+        max_results: int,
+        include_statistics: bool = False,
+        pipelined: bool = False,
+    ) -> Iterator[VideoInfo]:
+        """search().list をページングしながら動画詳細を取得するジェネレータ
+
+        Args:
+            request_params: search().list のパラメータ（maxResults/pageTokenを除く）
+            max_results: 取得する最大動画数
+            include_statistics: 統計情報を含めるか
+            pipelined: Trueの場合、前ページの詳細取得中に次ページの検索を先行実行する
+        """
+        if pipelined:
+            yield from self._iter_search_results_pipelined(
+                request_params, max_results, include_statistics
+            )
+            return
+
         next_page_token = None
         fetched_count = 0
 
         while fetched_count < max_results:
-            request_params = {
-                "part": "snippet",
-                "q": query,
-                "type": "video",
-                "maxResults": min(50, max_results - fetched_count),
-            }
-
+            params = dict(request_params, maxResults=min(50, max_results - fetched_count))
             if next_page_token:
-                request_params["pageToken"] = next_page_token
-            if published_after:
-                request_params["publishedAfter"] = published_after.isoformat() + "Z"
-            if published_before:
-                request_params["publishedBefore"] = published_before.isoformat() + "Z"
-            if video_category_id:
-                request_params["videoCategoryId"] = video_category_id
-            if region_code:
-                request_params["regionCode"] = region_code
-
-            request = self.service.search().list(**request_params)
-            response = request.execute()
+                params["pageToken"] = next_page_token
+
+            request = self.service.search().list(**params)
+            response = self._execute(request)
 
             video_ids = [
                 item["id"]["videoId"]
@@ -322,7 +408,7 @@ class YouTubeClient:
             ]
 
             if video_ids:
-                videos_details = self._get_videos_details(video_ids)
+                videos_details = self._get_videos_details(video_ids, include_statistics=include_statistics)
                 for video in videos_details:
                     yield video
                     fetched_count += 1
@@ -333,6 +419,69 @@ class YouTubeClient:
             if not next_page_token:
                 break
 
+    def _iter_search_results_pipelined(
+        self,
+        request_params: dict,
+        max_results: int,
+        include_statistics: bool = False,
+    ) -> Iterator[VideoInfo]:
+        """検索ページ取得と動画詳細取得をパイプライン化したジェネレータ
+
+        ページNの詳細取得をスレッドプールで実行している間にページN+1を検索する。
+        詳細取得の結果はページ順に取り出すため、出力順は逐次版と同じ。
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=self.PIPELINE_WORKERS,
+            thread_name_prefix="youtube-search",
+        )
+        pending: deque[tuple[Future, int]] = deque()
+        next_page_token = None
+        paging_done = False
+        fetched_count = 0
+
+        try:
+            while fetched_count < max_results:
+                # 取得予定数 = 取得済み + 詳細取得中のID数
+                expected_count = fetched_count + sum(size for _, size in pending)
+
+                if not paging_done and expected_count < max_results:
+                    params = dict(request_params, maxResults=min(50, max_results - expected_count))
+                    if next_page_token:
+                        params["pageToken"] = next_page_token
+
+                    request = self.service.search().list(**params)
+                    response = self._execute(request)
+
+                    video_ids = [
+                        item["id"]["videoId"]
+                        for item in response.get("items", [])
+                    ]
+                    if video_ids:
+                        future = executor.submit(
+                            self._get_videos_details, video_ids, include_statistics
+                        )
+                        pending.append((future, len(video_ids)))
+
+                    next_page_token = response.get("nextPageToken")
+                    if not next_page_token:
+                        paging_done = True
+
+                    # 先行ページが1つだけの間は次ページの検索を続ける
+                    if len(pending) < 2 and not paging_done:
+                        continue
+
+                if not pending:
+                    break
+
+                future, _ = pending.popleft()
+                for video in future.result():
+                    yield video
+                    fetched_count += 1
+                    if fetched_count >= max_results:
+                        break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def get_channel_info(self, channel_ids: list[str]) -> dict[str, ChannelInfo]:
         """チャンネル情報を取得
 
@@ -349,7 +498,7 @@ class YouTubeClient:
             part="snippet,statistics,status",
             id=",".join(channel_ids[:50]),
         )
-        response = request.execute()
+        response = self._execute(request)
 
         channels = {}
         for item in response.get("items", []):
@@ -374,6 +523,66 @@ class YouTubeClient:
 
         return channels
 
+    def get_channel_info_cached(self, channel_ids: list[str]) -> dict[str, ChannelInfo]:
+        """チャンネル情報をキャッシュ優先で取得
+
+        キャッシュにない（または期限切れの）チャンネルのみ50件ずつAPIから取得し、
+        取得結果をキャッシュに保存する。
+
+        Args:
+            channel_ids: チャンネルIDのリスト（件数制限なし）
+
+        Returns:
+            チャンネルID -> ChannelInfo のマッピング
+        """
+        channel_ids = list(dict.fromkeys(channel_ids))
+        channels: dict[str, ChannelInfo] = {}
+        if self._channel_cache is not None:
+            for channel_id, data in self._channel_cache.get_many(channel_ids).items():
+                channels[channel_id] = ChannelInfo(**data)
+
+        missing_ids = [channel_id for channel_id in channel_ids if channel_id not in channels]
+        for i in range(0, len(missing_ids), 50):
+            fetched = self.get_channel_info(missing_ids[i:i+50])
+            if self._channel_cache is not None:
+                self._channel_cache.put_many({
+                    channel_id: asdict(channel) for channel_id, channel in fetched.items()
+                })
+            channels.update(fetched)
+
+        return channels
+
+    def prefetch_channels(
+        self,
+        channel_ids: Optional[list[str]] = None,
+        force: bool = False,
+    ) -> int:
+        """チャンネル情報をまとめて取得してキャッシュを温める
+
+        Args:
+            channel_ids: 取得するチャンネルID（省略時はすべての公式チャンネル）
+            force: Trueの場合、キャッシュ済みのチャンネルも取得し直す
+
+        Returns:
+            APIから取得したチャンネル数
+        """
+        if self._channel_cache is None:
+            return 0
+        if channel_ids is None:
+            channel_ids = list(get_official_channel_ids())
+        channel_ids = list(dict.fromkeys(channel_ids))
+        if not force:
+            channel_ids = self._channel_cache.get_missing(channel_ids)
+
+        fetched_count = 0
+        for i in range(0, len(channel_ids), 50):
+            fetched = self.get_channel_info(channel_ids[i:i+50])
+            self._channel_cache.put_many({
+                channel_id: asdict(channel) for channel_id, channel in fetched.items()
+            })
+            fetched_count += len(fetched)
+        return fetched_count
+
     def search_videos_from_channels(
         self,
         channel_ids: list[str],
@@ -381,6 +590,7 @@ class YouTubeClient:
         max_results: int = 50,
         published_after: Optional[datetime] = None,
         published_before: Optional[datetime] = None,
+        max_workers: int = 1,
     ) -> Iterator[VideoInfo]:
         """指定チャンネルから動画を検索（高精度検索用）
 
@@ -390,51 +600,158 @@ class YouTubeClient:
             max_results: 取得する最大動画数
             published_after: この日時以降に公開された動画
             published_before: この日時以前に公開された動画
+            max_workers: 同時に検索するチャンネル数（1の場合は1チャンネルずつ順番に検索）
         """
+        base_params = {
+            "part": "snippet",
+            "type": "video",
+            "order": "relevance" if query else "date",
+        }
+        if query:
+            base_params["q"] = query
+        if published_after:
+            base_params["publishedAfter"] = published_after.isoformat() + "Z"
+        if published_before:
+            base_params["publishedBefore"] = published_before.isoformat() + "Z"
+
+        if max_workers > 1 and len(channel_ids) > 1:
+            yield from self._search_channels_fanout(
+                channel_ids, base_params, max_results, max_workers
+            )
+            return
+
         fetched_count = 0
 
         for channel_id in channel_ids:
             if fetched_count >= max_results:
                 break
 
-            next_page_token = None
-            while fetched_count < max_results:
-                request_params = {
-                    "part": "snippet",
-                    "channelId": channel_id,
-                    "type": "video",
-                    "maxResults": min(50, max_results - fetched_count),
-                    "order": "relevance" if query else "date",
-                }
-
-                if query:
-                    request_params["q"] = query
-                if next_page_token:
-                    request_params["pageToken"] = next_page_token
-                if published_after:
-                    request_params["publishedAfter"] = published_after.isoformat() + "Z"
-                if published_before:
-                    request_params["publishedBefore"] = published_before.isoformat() + "Z"
-
-                request = self.service.search().list(**request_params)
-                response = request.execute()
-
-                video_ids = [
-                    item["id"]["videoId"]
-                    for item in response.get("items", [])
-                ]
-
-                if video_ids:
-                    videos_details = self._get_videos_details(video_ids, include_statistics=True)
-                    for video in videos_details:
-                        yield video
-                        fetched_count += 1
-                        if fetched_count >= max_results:
-                            break
-
-                next_page_token = response.get("nextPageToken")
-                if not next_page_token:
-                    break
+            for video in self._iter_search_results(
+                dict(base_params, channelId=channel_id),
+                max_results - fetched_count,
+                include_statistics=True,
+            ):
+                yield video
+                fetched_count += 1
+
+    def _search_channels_fanout(
+        self,
+        channel_ids: list[str],
+        base_params: dict,
+        max_results: int,
+        max_workers: int,
+    ) -> Iterator[VideoInfo]:
+        """複数チャンネルを並行して検索し、取得できた順に結果を返す
+
+        各ワーカーは1チャンネルを担当してページングし、取得した動画を
+        キューに流す。max_resultsに達した時点で全ワーカーを停止する。
+        各ページの取得件数をワーカー間で予約し、max_resultsを超える
+        余分な検索リクエスト（1回100ユニット）を発行しないようにする。
+        残りの件数は検索中のチャンネルで分け合うため、最初の検索は
+        各チャンネルで同時に実行される（結果はチャンネルの順ではなく取得できた順）。
+        """
+        results: queue.Queue = queue.Queue()
+        condition = threading.Condition()
+        state = {
+            "claimed": 0,    # キューに投入済みの動画数
+            "reserved": 0,   # 検索中のリクエストで予約済みの件数
+            "active": len(channel_ids),  # 検索が終わっていないチャンネル数
+            "stopped": False,
+        }
+
+        def reserve() -> int:
+            """次のページで取得する件数を予約（0の場合は終了）"""
+            with condition:
+                while not state["stopped"]:
+                    remaining = max_results - state["claimed"] - state["reserved"]
+                    if remaining > 0:
+                        # 未取得の件数を同時に検索するチャンネルで均等に分ける
+                        workers = max(min(max_workers, state["active"]), 1)
+                        share = -(-(max_results - state["claimed"]) // workers)
+                        size = max(share, self.CHANNEL_FANOUT_MIN_PAGE_SIZE)
+                        size = min(size, remaining, 50)
+                        state["reserved"] += size
+                        return size
+                    if state["reserved"] == 0:
+                        return 0
+                    # 他ワーカーの結果が不足した場合に備えて待機
+                    condition.wait()
+                return 0
+
+        def release(size: int, fetched: int) -> None:
+            with condition:
+                state["reserved"] -= size
+                state["claimed"] += fetched
+                condition.notify_all()
+
+        def search_channel(channel_id: str) -> None:
+            try:
+                next_page_token = None
+                while True:
+                    size = reserve()
+                    if size <= 0:
+                        break
+
+                    fetched = 0
+                    try:
+                        params = dict(base_params, channelId=channel_id, maxResults=size)
+                        if next_page_token:
+                            params["pageToken"] = next_page_token
+
+                        request = self.service.search().list(**params)
+                        response = self._execute(request)
+
+                        video_ids = [
+                            item["id"]["videoId"]
+                            for item in response.get("items", [])
+                        ]
+                        if video_ids:
+                            videos = self._get_videos_details(video_ids, include_statistics=True)
+                            fetched = len(videos)
+                            results.put(videos)
+                    finally:
+                        release(size, fetched)
+
+                    next_page_token = response.get("nextPageToken")
+                    if not next_page_token:
+                        break
+            except Exception as e:
+                results.put(e)
+            finally:
+                with condition:
+                    state["active"] -= 1
+                    condition.notify_all()
+                results.put(_CHANNEL_DONE)
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="youtube-channel",
+        )
+        fetched_count = 0
+        done_count = 0
+
+        try:
+            for channel_id in channel_ids:
+                executor.submit(search_channel, channel_id)
+
+            while done_count < len(channel_ids) and fetched_count < max_results:
+                item = results.get()
+                if item is _CHANNEL_DONE:
+                    done_count += 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+
+                for video in item:
+                    yield video
+                    fetched_count += 1
+                    if fetched_count >= max_results:
+                        break
+        finally:
+            with condition:
+                state["stopped"] = True
+                condition.notify_all()
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def search_videos_advanced(
         self,
@@ -446,6 +763,8 @@ class YouTubeClient:
         region_code: Optional[str] = None,
         precision: SearchPrecision = SearchPrecision.STANDARD,
         category: Optional[str] = None,
+        pipelined: bool = False,
+        channel_workers: Optional[int] = None,
     ) -> Iterator[VideoInfo]:
         """高精度検索オプション付きの動画検索
 
@@ -458,6 +777,9 @@ class YouTubeClient:
             region_code: 地域コード
             precision: 検索精度レベル
             category: カテゴリ名（公式チャンネルフィルタ用）
+            pipelined: Trueの場合、検索ページ取得と詳細取得を並行実行する
+            channel_workers: 最高精度検索で同時に検索するチャンネル数
+                             （None=CHANNEL_FANOUT_WORKERS, 1=順番に検索）
         """
         if precision == SearchPrecision.HIGHEST:
             # 最高精度: 公式チャンネルIDから直接検索
@@ -469,6 +791,7 @@ class YouTubeClient:
                     max_results=max_results,
                     published_after=published_after,
                     published_before=published_before,
+                    max_workers=channel_workers or self.CHANNEL_FANOUT_WORKERS,
                 )
             return
 
@@ -476,7 +799,7 @@ class YouTubeClient:
             # 高精度: 通常検索後、公式チャンネルのみフィルタ
             official_ids = set(get_official_channel_ids(category).keys())
             filtered_count = 0
-            search_count = max_results * 5  # フィルタで減るため多めに取得
+            search_count = max_results * HIGH_PRECISION_SEARCH_FACTOR  # フィルタで減るため多めに取得
 
             for video in self.search_videos(
                 query=query,
@@ -485,6 +808,7 @@ class YouTubeClient:
                 published_before=published_before,
                 video_category_id=video_category_id,
                 region_code=region_code,
+                pipelined=pipelined,
             ):
                 if video.channel_id in official_ids or is_official_channel(video.channel_title):
                     yield video
@@ -494,47 +818,26 @@ class YouTubeClient:
             return
 
         # 標準精度: 通常検索（統計情報付き）
-        next_page_token = None
-        fetched_count = 0
-
-        while fetched_count < max_results:
-            request_params = {
-                "part": "snippet",
-                "q": query,
-                "type": "video",
-                "maxResults": min(50, max_results - fetched_count),
-            }
-
-            if next_page_token:
-                request_params["pageToken"] = next_page_token
-            if published_after:
-                request_params["publishedAfter"] = published_after.isoformat() + "Z"
-            if published_before:
-                request_params["publishedBefore"] = published_before.isoformat() + "Z"
-            if video_category_id:
-                request_params["videoCategoryId"] = video_category_id
-            if region_code:
-                request_params["regionCode"] = region_code
-
-            request = self.service.search().list(**request_params)
-            response = request.execute()
-
-            video_ids = [
-                item["id"]["videoId"]
-                for item in response.get("items", [])
-            ]
-
-            if video_ids:
-                videos_details = self._get_videos_details(video_ids, include_statistics=True)
-                for video in videos_details:
-                    yield video
-                    fetched_count += 1
-                    if fetched_count >= max_results:
-                        break
-
-            next_page_token = response.get("nextPageToken")
-            if not next_page_token:
-                break
+        request_params = {
+            "part": "snippet",
+            "q": query,
+            "type": "video",
+        }
+        if published_after:
+            request_params["publishedAfter"] = published_after.isoformat() + "Z"
+        if published_before:
+            request_params["publishedBefore"] = published_before.isoformat() + "Z"
+        if video_category_id:
+            request_params["videoCategoryId"] = video_category_id
+        if region_code:
+            request_params["regionCode"] = region_code
+
+        yield from self._iter_search_results(
+            request_params,
+            max_results,
+            include_statistics=True,
+            pipelined=pipelined,
+        )
 
     def enrich_videos_with_channel_info(
         self,
@@ -542,6 +845,8 @@ class YouTubeClient:
     ) -> list[VideoInfo]:
         """動画リストにチャンネル情報を付加
 
+        品質スコアは計算しない（付加した後に quality_scorer.score_videos() でまとめて計算する）。
+
         Args:
             videos: 動画リスト
 
@@ -552,21 +857,14 @@ class YouTubeClient:
             return videos
 
         # ユニークなチャンネルIDを収集
-        channel_ids = list(set(v.channel_id for v in videos))
+        channel_ids = list(dict.fromkeys(v.channel_id for v in videos))
 
-        # チャンネル情報を取得（50件ずつ）
-        all_channels = {}
-        for i in range(0, len(channel_ids), 50):
-            batch = channel_ids[i:i+50]
-            channels = self.get_channel_info(batch)
-            all_channels.update(channels)
+        # チャンネル情報を取得（キャッシュにないもののみ50件ずつAPIから取得）
+        all_channels = self.get_channel_info_cached(channel_ids)
 
         # 動画にチャンネル情報を付加
         for video in videos:
             if video.channel_id in all_channels:
-                channel = all_channels[video.channel_id]
-                video.subscriber_count = channel.subscriber_count
-                # 品質スコアを計算
-                video.calculate_quality_score()
+                video.subscriber_count = all_channels[video.channel_id].subscriber_count
 
         return videos
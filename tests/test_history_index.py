@@ -0,0 +1,182 @@
+"""HistoryIndex のテスト - 検索・絞り込み・集計を全件の走査と比較する"""
+
+import random
+import re
+
+import pytest
+
+from history_index import FACETS, HistoryIndex
+from history_manager import HistoryEntry, SearchConditions
+
+
+TITLE_WORDS = ["rock", "rocks", "pop", "j-pop", "90年代", "年代", "jazz", "live", "mix", "#4999"]
+CATEGORIES = ["Rock", "rock", "Pop", "Jazz", "アニメ"]
+ERAS = ["1980s", "1990s", "2000s", ""]
+PLATFORMS = ["youtube", "YouTube", "niconico", "vimeo"]
+MONTHS = ["2023-12", "2024-01", "2024-02"]
+
+QUERIES = [
+    "", "rock", "ROCK", "roc", "ock", "pop", "j-pop", "j-", "-", "90年代", "年代", "年",
+    "rock pop", "rock jazz live", "#4999", "4999", "#", "アニメ", "アニメ rock", "nothing",
+    "  rock   mix  ",
+]
+
+
+def make_entry(rng: random.Random, i: int) -> HistoryEntry:
+    return HistoryEntry(
+        id=f"id{i}",
+        title=" ".join(rng.sample(TITLE_WORDS, rng.randint(0, 3))),
+        url="",
+        playlist_id="",
+        # 作成日時が重複する履歴も作る（IDで並ぶ）
+        created_at=f"{rng.choice(MONTHS)}-{rng.randint(1, 28):02d}T00:00:0{rng.randint(0, 2)}",
+        video_count=1,
+        conditions=SearchConditions(
+            era=rng.choice(ERAS),
+            category=rng.choice(CATEGORIES),
+            keywords=rng.sample(TITLE_WORDS, rng.randint(0, 2)),
+        ),
+        platform=rng.choice(PLATFORMS),
+    )
+
+
+def newest_first(entries) -> list[str]:
+    return [e.id for e in sorted(entries, key=lambda e: (e.created_at, e.id), reverse=True)]
+
+
+def brute_search(entries, query: str) -> list[str]:
+    """検索語ごとに、各トークンが履歴のいずれかのトークンに含まれ、
+    記号を含む検索語は元の文字列も含まれる履歴を返す"""
+    def matches(entry, chunk):
+        texts = [entry.title, entry.conditions.category, *entry.conditions.keywords]
+        entry_tokens = [t for text in texts for t in re.findall(r"\w+", text.lower())]
+        query_tokens = re.findall(r"\w+", chunk)
+        if not all(any(q in t for t in entry_tokens) for q in query_tokens):
+            return False
+        if query_tokens != [chunk]:
+            return any(chunk in text.lower() for text in texts)
+        return True
+
+    chunks = query.lower().split()
+    return newest_first(e for e in entries if all(matches(e, c) for c in chunks))
+
+
+def brute_filter(entries, **criteria) -> list[str]:
+    def matches(entry):
+        return all(
+            value is None or FACETS[name](entry) == value.lower()
+            for name, value in criteria.items()
+        )
+    return newest_first(e for e in entries if matches(e))
+
+
+def brute_counts(entries, facet: str, **criteria) -> dict[str, int]:
+    selected = set(brute_filter(entries, **criteria))
+    counts: dict[str, int] = {}
+    for entry in entries:
+        if entry.id in selected:
+            value = FACETS[facet](entry)
+            counts[value] = counts.get(value, 0) + 1
+    return counts
+
+
+def criteria_cases():
+    yield {}
+    yield {"category": None}
+    for category in ["rock", "POP", "アニメ", "none"]:
+        yield {"category": category}
+        yield {"category": category, "platform": "youtube"}
+    yield {"era": "1990s", "month": "2024-01"}
+    yield {"platform": "niconico", "era": "", "category": "jazz"}
+
+
+def assert_consistent(index: HistoryIndex, entries: dict[str, HistoryEntry]) -> None:
+    values = list(entries.values())
+    assert len(index) == len(values)
+    assert [e.id for e in index.newest_first()] == newest_first(values)
+    assert [e.id for e in index.oldest_first()] == list(reversed(newest_first(values)))
+    for query in QUERIES:
+        assert [e.id for e in index.search(query)] == brute_search(values, query), query
+    for criteria in criteria_cases():
+        assert [e.id for e in index.filter(**criteria)] == brute_filter(values, **criteria), criteria
+        for facet in FACETS:
+            counts = index.facet_counts(facet, **criteria)
+            assert counts == brute_counts(values, facet, **criteria), (facet, criteria)
+            # 件数の多い順（同数の場合は値の順）
+            assert list(counts.items()) == sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
+
+
+@pytest.mark.parametrize("search_first", [False, True])
+def test_matches_brute_force_through_changes(search_first):
+    rng = random.Random(7)
+    entries = {f"id{i}": make_entry(rng, i) for i in range(300)}
+    index = HistoryIndex()
+    index.rebuild(entries.values())
+    if search_first:
+        # 転置索引を作成した後の追加・削除も反映されること
+        index.search("rock")
+    assert_consistent(index, entries)
+
+    for step in range(400):
+        action = rng.random()
+        if action < 0.4 and entries:
+            entry_id = rng.choice(list(entries))
+            assert index.remove(entry_id) is entries.pop(entry_id)
+        elif action < 0.7 and entries:
+            # 同じIDの再追加は置き換え（値が変わっても古い値の一覧に残らない）
+            entry_id = rng.choice(list(entries))
+            replacement = make_entry(rng, 0)
+            replacement.id = entry_id
+            entries[entry_id] = replacement
+            index.add(replacement)
+        else:
+            entry = make_entry(rng, 1000 + step)
+            entries[entry.id] = entry
+            index.add(entry)
+        if step % 50 == 0:
+            assert_consistent(index, entries)
+    assert_consistent(index, entries)
+
+    # 削除した値の一覧は残らない
+    for entry_id in list(entries):
+        index.remove(entry_id)
+    assert_consistent(index, {})
+    assert all(index.facet_counts(facet) == {} for facet in FACETS)
+
+
+def test_remove_uses_values_at_insert_time():
+    """索引に登録した後で履歴が書き換えられても、正しく削除できる"""
+    rng = random.Random(1)
+    entry = make_entry(rng, 1)
+    entry.conditions.category = "Rock"
+    index = HistoryIndex()
+    index.add(entry)
+    entry.conditions.category = "Jazz"
+    index.remove(entry.id)
+    assert index.filter(category="rock") == []
+    assert index.facet_counts("category") == {}
+
+
+def test_newest_before_pages_through_everything():
+    rng = random.Random(3)
+    entries = [make_entry(rng, i) for i in range(257)]
+    index = HistoryIndex()
+    index.rebuild(entries)
+
+    pages = []
+    before = None
+    while True:
+        page = index.newest_before(before, 50)
+        if not page:
+            break
+        pages.extend(e.id for e in page)
+        before = (page[-1].created_at, page[-1].id)
+    assert pages == newest_first(entries)
+
+
+def test_unknown_facet_raises():
+    index = HistoryIndex()
+    with pytest.raises(ValueError):
+        index.filter(genre="rock")
+    with pytest.raises(ValueError):
+        index.facet_counts("genre")
@@ -0,0 +1,152 @@
+"""HistoryManager のテスト - ジャーナルの再生・インポート・変更の通知"""
+
+import json
+import threading
+
+import pytest
+
+from history_manager import HistoryManager, SearchConditions
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return tmp_path / "history.jsonl"
+
+
+def add(manager: HistoryManager, title: str, category: str = "rock"):
+    return manager.add(title, "", "", 1, SearchConditions(category=category))
+
+
+def titles(manager: HistoryManager) -> list[str]:
+    return [entry.title for entry in manager.get_all()]
+
+
+def test_replays_journal(journal):
+    manager = HistoryManager(journal)
+    first = add(manager, "first")
+    second = add(manager, "second")
+    add(manager, "third")
+    manager.delete(first.id)
+    second.title = "second (edited)"
+    manager.update(second)
+
+    assert titles(HistoryManager(journal)) == ["third", "second (edited)"]
+
+    manager.clear_all()
+    add(manager, "after clear")
+    assert titles(HistoryManager(journal)) == ["after clear"]
+
+
+def test_truncated_last_line_is_dropped(journal):
+    manager = HistoryManager(journal)
+    add(manager, "kept 1")
+    add(manager, "kept 2")
+    # 書き込み中に終了した場合の途中までの行（改行なし）
+    with open(journal, "a", encoding="utf-8") as f:
+        f.write('{"op":"add","entry":{"id":"torn","title":"to')
+
+    reopened = HistoryManager(journal)
+    assert titles(reopened) == ["kept 2", "kept 1"]
+    # 壊れた行はコンパクションで取り除かれ、以降の追記が壊れた行につながらない
+    assert all(json.loads(line) for line in journal.read_text(encoding="utf-8").splitlines())
+
+    add(reopened, "added after recovery")
+    assert titles(HistoryManager(journal)) == ["added after recovery", "kept 2", "kept 1"]
+
+
+def test_compaction_keeps_live_entries(journal):
+    manager = HistoryManager(journal)
+    for i in range(manager.COMPACT_MIN_RECORDS):
+        manager.delete(add(manager, f"temp {i}").id)
+    add(manager, "live")
+    manager.compact()
+
+    assert journal.read_text(encoding="utf-8").count("\n") == 1
+    assert titles(HistoryManager(journal)) == ["live"]
+
+
+def test_migrates_legacy_file(tmp_path, journal):
+    legacy = tmp_path / "history.json"
+    legacy.write_text(json.dumps({"history": [
+        {"id": "1", "title": "old", "created_at": "2020-01-01T00:00:00"},
+        {"id": "2", "conditions": []},  # 形式が正しくない履歴は読み飛ばす
+    ]}), encoding="utf-8")
+
+    manager = HistoryManager(journal, legacy_path=legacy)
+    assert titles(manager) == ["old"]
+    assert journal.exists() and legacy.exists()
+
+
+def test_import_merge_assigns_new_ids(tmp_path, journal):
+    manager = HistoryManager(journal)
+    existing = add(manager, "existing")
+    source = tmp_path / "import.jsonl"
+    source.write_text("\n".join(json.dumps(item) for item in [
+        {"id": existing.id, "title": "same id", "created_at": "2020-01-01T00:00:00"},
+        {"id": "bad", "conditions": {"category": 5}},
+        {"id": "new", "title": "new", "created_at": "2020-01-02T00:00:00"},
+    ]), encoding="utf-8")
+
+    assert manager.import_from_file(source) == 2
+    ids = [entry.id for entry in manager.get_all()]
+    assert len(ids) == len(set(ids)) == 3
+    assert manager.get_by_id(existing.id).title == "existing"
+    assert sorted(titles(HistoryManager(journal))) == ["existing", "new", "same id"]
+
+
+def test_import_replace_keeps_history_on_error(tmp_path, journal):
+    manager = HistoryManager(journal)
+    add(manager, "existing")
+    broken = tmp_path / "broken.json"
+    broken.write_text('{"history": [{"id": "1", "title": "partial"}, {"id":', encoding="utf-8")
+    not_utf8 = tmp_path / "latin1.json"
+    not_utf8.write_bytes('{"history": [{"id": "1", "title": "café"}]}'.encode("latin-1"))
+
+    assert manager.import_from_file(broken, merge=False) == 0
+    assert manager.import_from_file(not_utf8, merge=False) == 0
+    assert titles(manager) == ["existing"]
+
+    exported = tmp_path / "export.json"
+    add(manager, "second")
+    assert manager.export_to_file(exported)
+    manager.clear_all()
+    assert manager.import_from_file(exported, merge=False) == 2
+    assert titles(HistoryManager(journal)) == ["second", "existing"]
+
+
+def test_listeners_run_outside_lock(journal):
+    """通知中のリスナーが待っている間も、他のスレッドから履歴を読める"""
+    manager = HistoryManager(journal)
+    read_done = threading.Event()
+    events = []
+    waited = []
+
+    def listener(event):
+        events.append(event.kind)
+        if len(events) == 1:
+            reader = threading.Thread(target=lambda: (manager.get_page(limit=10), read_done.set()))
+            reader.start()
+            waited.append(read_done.wait(2))
+
+    manager.add_listener(listener)
+    add(manager, "first")
+    add(manager, "second")
+    assert waited == [True]
+    assert events == ["added", "added"]
+
+
+def test_skips_journal_records_with_invalid_fields(journal):
+    manager = HistoryManager(journal)
+    add(manager, "kept")
+    with open(journal, "a", encoding="utf-8") as f:
+        for conditions in ({"category": None}, {"era": 1990}, {"keywords": [None]}):
+            entry = {"id": str(conditions), "title": "bad", "created_at": "2020-01-01T00:00:00",
+                     "conditions": conditions}
+            f.write(json.dumps({"op": "add", "entry": entry}) + "\n")
+        f.write(json.dumps({"op": "add", "entry": {"id": "p", "title": "bad", "platform": None}}) + "\n")
+
+    reopened = HistoryManager(journal)
+    assert titles(reopened) == ["kept"]
+    assert reopened.get_facet_counts("category") == {"rock": 1}
+    # 壊れた行はコンパクションで取り除かれる
+    assert journal.read_text(encoding="utf-8").count("\n") == 1
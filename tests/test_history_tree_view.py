@@ -0,0 +1,149 @@
+"""HistoryTreeView のテスト - ページ送りと差分の反映（Treeviewは表示なしの代用品を使う）"""
+
+import threading
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from history_manager import HistoryManager, SearchConditions
+from history_tree_view import HistoryTreeView
+
+
+class FakeTree:
+    """ttk.Treeviewのうち、HistoryTreeViewが使う操作だけを持つ代用品"""
+
+    def __init__(self):
+        self.rows: list[str] = []
+        self.values: dict[str, tuple] = {}
+
+    def configure(self, **options):
+        pass
+
+    def get_children(self):
+        return tuple(self.rows)
+
+    def exists(self, iid):
+        return iid in self.values
+
+    def insert(self, parent, index, iid, values):
+        position = len(self.rows) if index == "end" else int(index)
+        self.rows.insert(position, iid)
+        self.values[iid] = values
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.rows.remove(iid)
+            del self.values[iid]
+
+    def item(self, iid, values):
+        self.values[iid] = values
+
+
+class FakeScrollbar:
+    def set(self, first, last):
+        pass
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return HistoryManager(tmp_path / "history.jsonl")
+
+
+def add(manager: HistoryManager, title: str):
+    return manager.add(title, "", "", 1, SearchConditions())
+
+
+def make_view(manager: HistoryManager, page_size: int = 10):
+    tree = FakeTree()
+    # 通知はそのまま同じスレッドで反映する
+    view = HistoryTreeView(tree, FakeScrollbar(), manager, lambda func, *args: func(*args), page_size)
+    return view, tree
+
+
+def shown_ids(tree: FakeTree) -> list[str]:
+    return list(tree.rows)
+
+
+def newest_ids(manager: HistoryManager) -> list[str]:
+    return [entry.id for entry in manager.get_all()]
+
+
+def test_pages_in_order_without_duplicates(manager):
+    for i in range(25):
+        add(manager, f"entry {i}")
+    view, tree = make_view(manager)
+
+    view.reload()
+    assert shown_ids(tree) == newest_ids(manager)[:10]
+    view._on_yscroll(0.0, 0.5)
+    assert len(view) == 10
+    view._on_yscroll(0.5, 0.95)
+    assert shown_ids(tree) == newest_ids(manager)[:20]
+    assert view.load_more() == 5
+    assert view.load_more() == 0
+    assert shown_ids(tree) == newest_ids(manager)
+
+
+def test_applies_changes_incrementally(manager):
+    entries = [add(manager, f"entry {i}") for i in range(25)]
+    view, tree = make_view(manager)
+    view.reload()
+
+    newest = add(manager, "newest")
+    assert shown_ids(tree)[0] == newest.id
+
+    manager.delete(entries[-2].id)
+    assert entries[-2].id not in tree.rows
+
+    entries[-1].title = "renamed"
+    manager.update(entries[-1])
+    assert tree.values[entries[-1].id][1] == "renamed"
+
+    # まだ読み込んでいない範囲の削除は表示に影響しない
+    manager.delete(entries[0].id)
+    while view.load_more():
+        pass
+    assert shown_ids(tree) == newest_ids(manager)
+    assert len(view) == len(tree.rows)
+
+
+def test_reset_reloads_first_page(manager):
+    for i in range(15):
+        add(manager, f"entry {i}")
+    view, tree = make_view(manager)
+    view.reload()
+    while view.load_more():
+        pass
+
+    manager.clear_all()
+    assert shown_ids(tree) == []
+    for i in range(12):
+        add(manager, f"after {i}")
+    assert shown_ids(tree) == newest_ids(manager)
+
+    view.close()
+    add(manager, "not shown")
+    assert len(tree.rows) == 12
+
+
+def test_applies_main_thread_changes_without_dispatch(manager):
+    """Tkスレッドでの変更はキューを通さずに反映し、ワーカーの変更はdispatchに渡す"""
+    queued = []
+    tree = FakeTree()
+    view = HistoryTreeView(tree, FakeScrollbar(), manager, lambda func, *args: queued.append((func, args)))
+    view.reload()
+
+    shown = add(manager, "from tk thread")
+    assert shown_ids(tree) == [shown.id] and queued == []
+
+    worker = threading.Thread(target=lambda: add(manager, "from worker"))
+    worker.start()
+    worker.join()
+    assert shown_ids(tree) == [shown.id] and len(queued) == 1
+
+    # キューに残っていた追加の通知は、後から削除された履歴を表示し直さない
+    manager.clear_all()
+    for func, args in queued:
+        func(*args)
+    assert shown_ids(tree) == []
@@ -0,0 +1,121 @@
+"""json_stream のテスト - 形式の判定・チャンク境界・書き出しの互換性"""
+
+import json
+
+import pytest
+
+import json_stream
+from json_stream import JSONStreamError, iter_json_items, write_json_document, write_json_lines
+
+
+ITEMS = [
+    {
+        "id": str(i),
+        "title": f"タイトル {i} \"引用\" \\ {{}} [] ,:",
+        "score": i * 1.5,
+        "count": 10 ** i,
+        "tags": ["a", "び", {"nested": [1, 2, None]}],
+        "flag": i % 2 == 0,
+        "none": None,
+        "emoji": "🎵",
+    }
+    for i in range(12)
+]
+
+FORMATS = {
+    "indented.json": lambda: json.dumps({"history": ITEMS}, ensure_ascii=False, indent=2),
+    "compact.json": lambda: json.dumps({"version": 2, "history": ITEMS}, separators=(",", ":")),
+    "key_last.json": lambda: json.dumps({"version": 2, "other": [1], "history": ITEMS}),
+    "array.json": lambda: json.dumps(ITEMS, ensure_ascii=False),
+    "lines.jsonl": lambda: "\n".join(json.dumps(item, ensure_ascii=False) for item in ITEMS) + "\n",
+    "lines_crlf.jsonl": lambda: "\r\n".join(json.dumps(item) for item in ITEMS),
+}
+
+
+@pytest.fixture(params=[1, 2, 3, 7, 64 * 1024])
+def chunk_size(request, monkeypatch):
+    """値・エスケープ・マルチバイト文字がチャンクの境界をまたぐようにする"""
+    monkeypatch.setattr(json_stream, "_CHUNK_SIZE", request.param)
+    return request.param
+
+
+@pytest.mark.parametrize("name", sorted(FORMATS))
+@pytest.mark.parametrize("bom", [False, True])
+def test_reads_every_format(tmp_path, chunk_size, name, bom):
+    path = tmp_path / name
+    data = FORMATS[name]().encode("utf-8")
+    path.write_bytes((b"\xef\xbb\xbf" if bom else b"") + data)
+
+    progress = []
+    items = list(iter_json_items(path, "history", progress=lambda done, total: progress.append((done, total))))
+
+    assert items == ITEMS
+    assert progress[-1] == (path.stat().st_size, path.stat().st_size)
+
+
+def test_json_lines_skips_records_without_required_field(tmp_path, chunk_size):
+    path = tmp_path / "mixed.jsonl"
+    path.write_text('{"id": "1"}\n{"name": "no id"}\n[1, 2]\n{"id": "2"}\n', encoding="utf-8")
+    assert list(iter_json_items(path, "history")) == [{"id": "1"}, {"id": "2"}]
+
+
+@pytest.mark.parametrize("text", ["", "  \n", '{"history": []}', "[]", "{}"])
+def test_empty_documents(tmp_path, text):
+    path = tmp_path / "empty.json"
+    path.write_text(text, encoding="utf-8")
+    assert list(iter_json_items(path, "history")) == []
+
+
+def test_truncated_document_yields_items_before_error(tmp_path, chunk_size):
+    path = tmp_path / "truncated.json"
+    text = json.dumps({"history": ITEMS})
+    path.write_text(text[:text.index('"id": "3"') + 3], encoding="utf-8")
+
+    read = []
+    with pytest.raises(JSONStreamError):
+        for item in iter_json_items(path, "history"):
+            read.append(item)
+    assert read == ITEMS[:3]
+
+
+@pytest.mark.parametrize("data", [b"42", b'"text"', b"{\"history\": [1,, 2]}", b"\xff\xfe{}"])
+def test_invalid_input_raises_stream_error(tmp_path, data):
+    path = tmp_path / "invalid.json"
+    path.write_bytes(data)
+    with pytest.raises(JSONStreamError):
+        list(iter_json_items(path, "history"))
+
+
+@pytest.mark.parametrize("items", [ITEMS, []])
+def test_document_matches_json_dump(tmp_path, chunk_size, items):
+    path = tmp_path / "out.json"
+    count = write_json_document(path, "history", iter(items), len(items))
+
+    assert count == len(items)
+    assert path.read_text(encoding="utf-8") == json.dumps({"history": items}, ensure_ascii=False, indent=2)
+    assert list(iter_json_items(path, "history")) == items
+
+
+def test_json_lines_round_trip(tmp_path, chunk_size):
+    path = tmp_path / "out.jsonl"
+    progress = []
+    count = write_json_lines(path, iter(ITEMS), len(ITEMS), lambda done, total: progress.append((done, total)))
+
+    assert count == len(ITEMS)
+    assert len(path.read_text(encoding="utf-8").splitlines()) == len(ITEMS)
+    assert list(iter_json_items(path, "history")) == ITEMS
+    assert progress[-1] == (len(ITEMS), len(ITEMS))
+
+
+def test_failed_write_keeps_original_file(tmp_path):
+    path = tmp_path / "out.json"
+    path.write_text("original", encoding="utf-8")
+
+    def broken_items():
+        yield ITEMS[0]
+        raise RuntimeError("stop")
+
+    with pytest.raises(RuntimeError):
+        write_json_document(path, "history", broken_items())
+    assert path.read_text(encoding="utf-8") == "original"
+    assert list(tmp_path.iterdir()) == [path]
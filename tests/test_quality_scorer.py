@@ -0,0 +1,54 @@
+"""quality_scorer のテスト - 一括計算と1件ずつの計算が同じスコアになること"""
+
+from dataclasses import dataclass
+
+import pytest
+
+from quality_scorer import MAX_QUALITY_SCORE, score_video, score_videos
+
+
+@dataclass
+class Video:
+    """VideoInfoのうち、スコア計算で使う項目だけを持つ代用品"""
+    title: str
+    channel_id: str
+    channel_title: str
+    is_verified: bool = False
+    subscriber_count: int = 0
+    view_count: int = 0
+    quality_score: int = 0
+
+
+def sample_videos() -> list[Video]:
+    return [
+        Video("Song (Official Video)", "UC-9-kyTW8ZkZNDHQJ6FgpwQ", "Music (YouTube)", True, 5_000_000, 9_000_000),
+        Video("Song (Official Video)", "UCxxxxxxxxxxxxxxxxxxxxxx", "Warner Records", True, 150_000, 100_000),
+        Video("cover", "UCxxxxxxxxxxxxxxxxxxxxxx", "Warner Records", False, 99_999, 999_999),
+        Video("live", "UCyyyyyyyyyyyyyyyyyyyyyy", "someone - Topic", False, 1_000_000, 0),
+        Video("vlog", "UCzzzzzzzzzzzzzzzzzzzzzz", "daily vlog", False, None, None),
+    ]
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_batch_matches_single_video(use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    single = [score_video(video) for video in sample_videos()]
+    result = score_videos(sample_videos(), use_numpy=use_numpy)
+
+    assert result.scores == single
+    assert MAX_QUALITY_SCORE >= single[0] > single[1] > 0
+    assert single[-1] == 0
+    assert result.order == sorted(range(len(single)), key=lambda i: -single[i])
+
+
+def test_video_info_uses_same_formula():
+    VideoInfo = pytest.importorskip("youtube_client").VideoInfo
+    for video in sample_videos():
+        info = VideoInfo(
+            video_id="id", title=video.title, description="", channel_id=video.channel_id,
+            channel_title=video.channel_title, published_at=None,
+            is_verified=video.is_verified, subscriber_count=video.subscriber_count,
+            view_count=video.view_count,
+        )
+        assert info.calculate_quality_score() == score_video(video) == info.quality_score
@@ -0,0 +1,63 @@
+"""quota_manager のテスト - 検索精度ごとの見積もりと予約・返却"""
+
+import pytest
+
+from config import get_official_channel_ids
+from quota_manager import (
+    QuotaExceededError,
+    QuotaScheduler,
+    estimate_playlist_creation_cost,
+    estimate_random_run_cost,
+    estimate_search_cost,
+)
+
+
+# --count 50 の場合は200本を検索する
+CREATE_50 = estimate_playlist_creation_cost(50)
+
+
+@pytest.mark.parametrize("precision, category, include_channels, expected", [
+    # 標準: 200本 = 4ページ × (search 100 + videos 1)
+    (None, "music", False, 4 * 101),
+    ("standard", "music", True, 4 * 101 + 4),
+    # 高精度: 絞り込み前に5倍の1000本 = 20ページ、チャンネル情報は取得した200本分
+    ("high", "music", True, 20 * 101 + 4),
+    ("high", None, False, 20 * 101),
+])
+def test_search_estimate_by_precision(precision, category, include_channels, expected):
+    assert estimate_search_cost(200, include_channels, precision, category) == expected
+    assert estimate_random_run_cost(50, include_channels, precision, category) == expected + CREATE_50
+
+
+@pytest.mark.parametrize("category", [None, "music", "news", "entertainment"])
+def test_highest_estimate_searches_every_official_channel(category):
+    channels = len(get_official_channel_ids(category))
+    assert channels > 0
+    # 公式チャンネルごとに最低1回の検索と詳細取得
+    assert estimate_search_cost(200, True, "highest", category) == max(channels, 4) * 101 + 4
+    assert estimate_random_run_cost(50, True, "highest", category) >= channels * 100
+
+
+def test_highest_estimate_without_official_channels():
+    assert get_official_channel_ids("gaming") == {}
+    assert estimate_search_cost(200, True, "highest", "gaming") == 0
+
+
+def test_accepts_search_precision_enum():
+    """youtube_client.SearchPrecision をそのまま渡せる"""
+    enum = pytest.importorskip("youtube_client").SearchPrecision
+    for precision in enum:
+        assert estimate_search_cost(200, True, precision, "music") == \
+            estimate_search_cost(200, True, precision.value, "music")
+
+
+def test_reserve_and_refund(tmp_path):
+    scheduler = QuotaScheduler(ledger_path=tmp_path / "ledger.json", daily_budget=300)
+    assert scheduler.reserve("youtube.playlistItems.insert", 4) == 200
+    with pytest.raises(QuotaExceededError):
+        scheduler.reserve("youtube.search.list", 2)
+    assert scheduler.refund("youtube.playlistItems.insert", 3) == 150
+    # 予約した分より多くは戻さない
+    assert scheduler.refund("youtube.playlistItems.insert", 3) == 50
+    assert scheduler.get_remaining() == 300
+    assert scheduler.get_usage_by_method() == {"youtube.playlistItems.insert": 0}
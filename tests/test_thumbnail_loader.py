@@ -0,0 +1,154 @@
+"""ThumbnailLoader のテスト - ローカルのHTTPサーバーから取得し、キャッシュとTkスレッドへの受け渡しを確認"""
+
+import queue
+import struct
+import threading
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from thumbnail_loader import ThumbnailLoader
+
+
+def make_png(red: int) -> bytes:
+    """1x1ピクセルのPNG（Pillowがなくてもそのまま表示できる形式）"""
+    def chunk(kind: bytes, body: bytes) -> bytes:
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+
+    header = struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0)
+    pixels = zlib.compress(bytes([0, red, 0, 0]))
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", pixels) + chunk(b"IEND", b"")
+
+
+IMAGES = {
+    "/a.png": make_png(1),
+    "/a-copy.png": make_png(1),  # /a.png と同じ内容
+    "/b.png": make_png(2),
+    "/c.png": make_png(3),
+}
+
+
+@pytest.fixture
+def server():
+    hits = Counter()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits[self.path] += 1
+            body = IMAGES.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", hits
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class Dispatcher:
+    """ワーカーからの受け渡しを記録し、テストのスレッドで実行する（UIUpdateQueue.postの代用品）"""
+
+    def __init__(self):
+        self.calls: queue.Queue = queue.Queue()
+
+    def __call__(self, func, *args):
+        self.calls.put((func, args))
+
+    def run_one(self, loader: ThumbnailLoader) -> None:
+        func, args = self.calls.get(timeout=5)
+        # ワーカーは結果の反映を必ずdispatchで渡す
+        assert func == loader._complete
+        func(*args)
+
+
+@pytest.fixture
+def make_loader(tmp_path):
+    loaders = []
+
+    def make(**options):
+        dispatch = Dispatcher()
+        loader = ThumbnailLoader(
+            dispatch,
+            cache_dir=tmp_path / "thumbnails",
+            max_workers=1,
+            image_factory=lambda data: ("image", data),
+            **options,
+        )
+        loaders.append(loader)
+        return loader, dispatch
+
+    yield make
+    for loader in loaders:
+        loader.close()
+
+
+def load(loader: ThumbnailLoader, dispatch: Dispatcher, url: str):
+    """1件を要求し、結果の反映までテストのスレッドで実行する"""
+    received = []
+    loader.request(url, lambda image: received.append((image, threading.current_thread())))
+    assert received == []  # 取得前にはcallbackを呼ばない
+    dispatch.run_one(loader)
+    assert len(received) == 1
+    image, thread = received[0]
+    assert thread is threading.current_thread()
+    return image
+
+
+def test_disk_cache_is_content_addressed(server, make_loader, tmp_path):
+    base, hits = server
+    loader, dispatch = make_loader()
+
+    first = load(loader, dispatch, base + "/a.png")
+    copy = load(loader, dispatch, base + "/a-copy.png")
+    assert first == copy
+
+    cache_dir = tmp_path / "thumbnails"
+    objects = [path for path in (cache_dir / "objects").rglob("*") if path.is_file()]
+    indexes = [path for path in (cache_dir / "index").rglob("*") if path.is_file()]
+    assert len(objects) == 1 and len(indexes) == 2
+    assert objects[0].read_bytes() == IMAGES["/a.png"]
+
+    # 別のローダーでもディスクキャッシュから読み込み、再取得しない
+    other, other_dispatch = make_loader()
+    assert load(other, other_dispatch, base + "/a-copy.png") == first
+    assert hits == Counter({"/a.png": 1, "/a-copy.png": 1})
+
+
+def test_memory_cache_evicts_least_recently_used(server, make_loader):
+    base, hits = server
+    loader, dispatch = make_loader(max_memory_items=2)
+    urls = {name: base + f"/{name}.png" for name in "abc"}
+
+    load(loader, dispatch, urls["a"])
+    load(loader, dispatch, urls["b"])
+    # メモリにある画像はすぐにcallbackを呼び、最近使ったものとして扱う
+    received = []
+    loader.request(urls["a"], received.append)
+    assert len(received) == 1 and dispatch.calls.empty()
+
+    load(loader, dispatch, urls["c"])
+    assert list(loader._memory) == [urls["a"], urls["c"]]
+
+
+def test_failed_fetch_does_not_call_back(server, make_loader):
+    base, hits = server
+    loader, dispatch = make_loader()
+    loader._retry_policy.max_attempts = 1
+
+    received = []
+    loader.request(base + "/missing.png", received.append)
+    dispatch.run_one(loader)
+    assert received == [] and loader._memory == {}
@@ -0,0 +1,62 @@
+"""UIUpdateQueue のテスト - 反映の順序とバックプレッシャー（Tkのルートは代用品を使う）"""
+
+import threading
+
+from ui_queue import UIUpdateQueue
+
+
+class FakeRoot:
+    """after() で登録されたコールバックを保持するだけの代用品"""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, ms, func):
+        self.callbacks.append(func)
+        return len(self.callbacks)
+
+    def after_cancel(self, after_id):
+        pass
+
+
+def test_main_thread_post_never_blocks_on_full_queue():
+    ui_queue = UIUpdateQueue(FakeRoot(), maxsize=2)
+    applied = []
+    # キューの上限を超えても待機しない（待つとTkスレッドが止まる）
+    for i in range(5):
+        ui_queue.post(applied.append, i)
+    ui_queue.post_batched(applied.append, "a")
+    ui_queue.post_batched(applied.append, "b")
+
+    ui_queue._drain()
+    assert applied == [0, 1, 2, 3, 4, ["a", "b"]]
+
+
+def test_worker_post_waits_for_drain():
+    ui_queue = UIUpdateQueue(FakeRoot(), maxsize=2)
+    applied = []
+
+    worker = threading.Thread(target=lambda: [ui_queue.post(applied.append, i) for i in range(4)])
+    worker.start()
+    worker.join(0.3)
+    # 満杯のキューが空くまでワーカーは待機する
+    assert worker.is_alive()
+
+    for _ in range(40):
+        ui_queue._drain()
+        worker.join(0.05)
+        if not worker.is_alive():
+            break
+    assert not worker.is_alive()
+    ui_queue._drain()
+    assert applied == [0, 1, 2, 3]
+
+
+def test_stop_releases_waiting_worker():
+    ui_queue = UIUpdateQueue(FakeRoot(), maxsize=1)
+    ui_queue.post(print, "fill")
+    worker = threading.Thread(target=lambda: ui_queue.post(print, "blocked"))
+    worker.start()
+    ui_queue.stop()
+    worker.join(2)
+    assert not worker.is_alive()